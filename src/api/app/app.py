@@ -4,6 +4,7 @@
 
 from fastapi import FastAPI
 
+from .services.limiter.depends import bind_rate_limiters
 from .routers import include_routers
 from .config.middlewares import add_middlewares
 from .config import get_app_kwargs
@@ -17,5 +18,6 @@ def create_application() -> FastAPI:
 
     add_middlewares(app)
     include_routers(app)
+    bind_rate_limiters(app.routes)
 
     return app
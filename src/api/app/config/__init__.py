@@ -10,6 +10,7 @@ def get_app_kwargs() -> dict:
     """
     Returns FastAPI kwargs.
     """
+    from app.services.api import ApiResponse
     from .exceptions import EXCEPTION_HANDLERS
     from .event_handlers import STARTUP_HANDLERS, SHUTDOWN_HANDLERS
 
@@ -18,6 +19,7 @@ def get_app_kwargs() -> dict:
         "on_startup": STARTUP_HANDLERS,
         "on_shutdown": SHUTDOWN_HANDLERS,
         "exception_handlers": EXCEPTION_HANDLERS,
+        "default_response_class": ApiResponse,
         **get_openapi_kwargs(),
     }
 
@@ -34,4 +36,5 @@ __all__ = [
     "get_gatey_settings",
     "get_openapi_kwargs",
     "get_app_kwargs",
+    "get_cache_client",
 ]
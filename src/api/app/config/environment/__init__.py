@@ -12,6 +12,7 @@ from .mail import get_mail_settings, get_mail  # isort:skip
 from .logging import get_logging_settings, get_logger  # isort:skip
 from .gatey import get_gatey_settings, get_gatey_client  # isort:skip
 from .openapi import get_openapi_kwargs  # isort:skip
+from .cache import get_cache_client  # isort:skip
 
 __all__ = [
     "get_database_settings",
@@ -24,4 +25,5 @@ __all__ = [
     "get_gatey_client",
     "get_gatey_settings",
     "get_openapi_kwargs",
+    "get_cache_client",
 ]
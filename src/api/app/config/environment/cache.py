@@ -0,0 +1,21 @@
+"""
+    Cache (Redis) client for the synchronous code (repositories, auth, services).
+"""
+
+from functools import lru_cache
+
+from redis import Redis
+
+from .settings import get_settings
+
+
+@lru_cache(maxsize=1)
+def get_cache_client() -> Redis:
+    settings = get_settings()
+    return Redis.from_url(
+        settings.cache_dsn,
+        encoding=settings.cache_encoding,
+        decode_responses=True,
+        socket_timeout=settings.cache_socket_timeout,
+        socket_connect_timeout=settings.cache_socket_timeout,
+    )
@@ -31,6 +31,9 @@ class DatabaseSettings(BaseSettings):
     orm_pool_recycle: int = 3600
     orm_pool_timeout: int = 10
     orm_poll_size: int = 20
+    # Names of the routes (endpoint functions) that use native asynchronous ORM (asyncpg),
+    # others are served by synchronous engine in the thread pool. `*` switches all routes.
+    orm_async_routes: list[str] = []
 
     class Config:
         env_prefix = "POSTGRES_DB_"
@@ -47,6 +50,13 @@ class DatabaseSettings(BaseSettings):
             "pool_pre_ping": self.orm_poll_pre_ping,
         }
 
+    @property
+    def orm_async_engine_kwargs(self) -> dict[str, Any]:
+        return self.orm_engine_kwargs | {"url": self.async_url}
+
+    def route_uses_async_orm(self, route_name: str) -> bool:
+        return "*" in self.orm_async_routes or route_name in self.orm_async_routes
+
     @property
     def echo(self) -> bool | Literal["debug"]:
         if self.orm_echo_statements:
@@ -20,6 +20,20 @@ class Environment(Enum):
     production = "production"
 
 
+class RequestsLimiterAlgorithm(Enum):
+    """
+    Algorithm of the requests limiter.
+
+    Fixed window -> Counter per window, allows bursts at window edges, quota may be leased by worker.
+    GCRA -> Generic cell rate algorithm, spreads requests evenly within window.
+    Sliding log -> Exact log of request times, stores entry per request.
+    """
+
+    fixed_window = "fixed_window"
+    gcra = "gcra"
+    sliding_log = "sliding_log"
+
+
 class Settings(BaseSettings):
     """
     Fetches configuration from the environment variables of the OS.
@@ -54,15 +68,53 @@ class Settings(BaseSettings):
     # TODO: More configuration.
     cache_dsn: RedisDsn
     cache_encoding: str = "utf-8"
+    # Timeout (in seconds) for the synchronous cache client calls.
+    cache_socket_timeout: float = 0.5
+    # Sessions cache (per-worker LRU in front of the Redis layer).
+    cache_sessions_enabled: bool = True
+    cache_sessions_local_maxsize: int = 10_000
+    cache_sessions_local_ttl: int = 30
+    cache_sessions_ttl: int = 600
+    # Session secrets are stored in Redis only encrypted with that key (random string),
+    # so tokens can not be forged with Redis access. Redis layer is not used if empty.
+    cache_sessions_secret_key: str = ""
+    # Sessions are not cached for that time (seconds) after invalidation,
+    # so entries loaded before invalidation are not stored again.
+    cache_sessions_invalidation_ttl: int = 30
+    # User agents intern map (per-worker, user agent string -> id).
+    cache_user_agents_local_maxsize: int = 10_000
+    # OAuth clients cache (same tiers as sessions), missing clients are cached with negative TTL.
+    cache_oauth_clients_enabled: bool = True
+    cache_oauth_clients_local_maxsize: int = 1_000
+    cache_oauth_clients_local_ttl: int = 30
+    cache_oauth_clients_ttl: int = 600
+    cache_oauth_clients_negative_ttl: int = 30
 
     # Requests limiter.
     # TODO: Allow to handle requests limiter disable better, and do not connect to Redis if not required.
     # TODO: More configuration.
     requests_limiter_enabled: bool = True
-
-    # Caching.
+    requests_limiter_algorithm: RequestsLimiterAlgorithm = (
+        RequestsLimiterAlgorithm.fixed_window
+    )
+    # Maximal amount of keys in the per-worker state (rejections and fallback windows).
+    requests_limiter_local_maxsize: int = 10_000
+    # Redis calls timeout (seconds), and circuit breaker (local limits are used while open).
+    requests_limiter_redis_timeout: float = 0.05
+    requests_limiter_breaker_failures: int = 3
+    requests_limiter_breaker_backoff: float = 1.0
+    requests_limiter_breaker_backoff_max: float = 30.0
+
+    # Caching (responses of the read-heavy methods).
     fastapi_cache_enable: bool = True
     fastapi_cache_use_inmemory_backend: bool = False
+    # Per-worker tier (in front of Redis, or the only one with in-memory backend).
+    fastapi_cache_local_maxsize: int = 1_000
+    fastapi_cache_local_ttl: int = 5
+    # Per-route TTLs (seconds).
+    fastapi_cache_user_profile_ttl: int = 60
+    fastapi_cache_oauth_client_ttl: int = 300
+    fastapi_cache_features_ttl: int = 60
 
     # FastAPI.
     fastapi_debug: bool = False
@@ -87,6 +139,21 @@ class Settings(BaseSettings):
     auth_oauth_screen_provider_url: str = "https://florgon.com/oauth/authorize"
     # If true will enable 2FA with email when user verifies email.
     auth_enable_tfa_on_email_verification: bool = True
+    # Online time of the users is buffered in Redis and flushed periodically by the worker.
+    auth_online_buffer_enabled: bool = True
+    # How often (in seconds) buffered online time is flushed into the database.
+    auth_online_flush_interval: int = 60
+    # Online time changes smaller than this (in seconds) are not recorded.
+    auth_online_granularity: int = 60
+    # OAuth client uses are buffered in Redis stream and inserted in batches by the worker.
+    auth_oauth_client_uses_buffer_enabled: bool = True
+    # How often (in seconds) buffered uses are flushed, and maximal amount of uses per insert.
+    auth_oauth_client_uses_flush_interval: int = 5
+    auth_oauth_client_uses_batch_size: int = 1_000
+    # While buffer is longer than this, uses are inserted directly (backpressure).
+    auth_oauth_client_uses_buffer_max_length: int = 100_000
+    # Uses that are failed to insert that many times are moved to the dead letter stream.
+    auth_oauth_client_uses_max_deliveries: int = 5
 
     # Admin.
     admin_methods_disabled: bool = False
@@ -102,6 +169,21 @@ class Settings(BaseSettings):
     security_refresh_tokens_ttl: int = 7776000
     security_session_tokens_ttl: int = 864000
     security_oauth_code_tokens_ttl: int = 300
+    # Paths to the PEM private keys (P-256 or Ed25519) for signing access tokens (ES256 / EdDSA),
+    # so they may be verified offline with JWKS. Access tokens are signed with session secret if empty.
+    # First key signs new tokens, others are only published (add new key last, then move it first).
+    security_access_tokens_signing_keys: list[str] = []
+    # How long (in seconds) JWKS may be cached by the resource servers.
+    security_jwks_max_age: int = 3600
+    # Maximal amount of access tokens for the batch tokens check.
+    security_tokens_check_batch_max_size: int = 100
+    # Amount of processes for password hashing (zero means hashing in the thread pool).
+    security_password_hashing_processes: int = 2
+    # Password hashing (scrypt) cost parameters, see `benchmarks.passwords` for choosing them.
+    # Passwords hashed with other parameters are re-hashed on signin.
+    security_password_scrypt_n: int = 2**14
+    security_password_scrypt_r: int = 8
+    security_password_scrypt_p: int = 1
     # 2FA TOTP intervals.
     security_tfa_totp_interval_email: int = 3600
     security_tfa_totp_interval_mobile: int = 30
@@ -3,10 +3,25 @@
     Provides list of handlers.
 """
 
-from app.services import limiter
-from app.database.bootstrap import dispose_database, bootstrap_database
+from app.services import passwords, limiter, cache
+from app.database.bootstrap import (
+    dispose_database,
+    dispose_async_database,
+    bootstrap_database,
+)
 
 from .logging import hook_fastapi_logger
 
-STARTUP_HANDLERS = [hook_fastapi_logger, limiter.on_startup, bootstrap_database]
-SHUTDOWN_HANDLERS = [limiter.on_shutdown, dispose_database]
+STARTUP_HANDLERS = [
+    hook_fastapi_logger,
+    limiter.on_startup,
+    cache.on_startup,
+    bootstrap_database,
+]
+SHUTDOWN_HANDLERS = [
+    limiter.on_shutdown,
+    cache.on_shutdown,
+    passwords.on_shutdown,
+    dispose_database,
+    dispose_async_database,
+]
@@ -6,6 +6,7 @@
 
 from fastapi import FastAPI
 
+from .rate_limit import add_rate_limit_headers_middleware
 from .gatey import add_gatey_middleware
 from .cors import add_cors_middleware
 from .context import add_context_middleware
@@ -18,3 +19,4 @@ def add_middlewares(_app: FastAPI) -> None:
     add_cors_middleware(_app)
     add_gatey_middleware(_app)
     add_context_middleware(_app)
+    add_rate_limit_headers_middleware(_app)
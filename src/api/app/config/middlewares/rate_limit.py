@@ -0,0 +1,39 @@
+"""
+    Rate limit headers middleware.
+"""
+
+from starlette.types import Send, Scope, Receive, Message, ASGIApp
+from starlette.datastructures import MutableHeaders
+from fastapi import FastAPI
+from app.services.limiter.depends import set_rate_limit_headers, RATE_LIMIT_STATE
+
+
+class RateLimitHeadersMiddleware:
+    """
+    Sets `RateLimit-*` headers of the limiters checked for the request to the response.
+
+    Routes return their own responses (and limiters may raise errors),
+    so headers can not be set by the limiter dependency itself.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                result = scope.get("state", {}).get(RATE_LIMIT_STATE)
+                if result is not None:
+                    set_rate_limit_headers(MutableHeaders(scope=message), result)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+def add_rate_limit_headers_middleware(_app: FastAPI) -> None:
+    """Registers rate limit headers middleware to the FastAPI application."""
+    _app.add_middleware(RateLimitHeadersMiddleware)
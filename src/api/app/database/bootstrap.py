@@ -10,7 +10,7 @@ from sqlalchemy import select
 from app.database.repositories.users import UsersRepository
 from app.database.repositories.oauth_clients import OAuthClientsRepository
 from app.database.dependencies import SessionLocal, Session
-from app.database.core import engine, create_all
+from app.database.core import get_async_engine, engine, create_all
 from app.config import get_settings, get_logger, get_database_settings
 
 
@@ -26,6 +26,13 @@ def dispose_database() -> None:
     engine.dispose()
 
 
+async def dispose_async_database() -> None:
+    if get_async_engine.cache_info().currsize == 0:
+        # Asynchronous engine was never used.
+        return
+    await get_async_engine().dispose()
+
+
 def create_start_database_entries() -> None:
     """
     Creates initial OAuth client and super user for first time.
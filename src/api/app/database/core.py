@@ -3,9 +3,12 @@
     Contains engine and ORM related stuff.
 """
 
+from functools import lru_cache
+
 from sqlalchemy.pool import QueuePool
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncEngine
 from sqlalchemy.exc import OperationalError, IntegrityError
 from sqlalchemy import create_engine, MetaData
 from app.config import get_logger, get_database_settings
@@ -21,6 +24,30 @@ SessionLocal = sessionmaker(
 )
 
 
+@lru_cache(maxsize=1)
+def get_async_engine() -> AsyncEngine:
+    """
+    Returns asynchronous (asyncpg) engine.
+    Created lazily on first use, so synchronous only processes (e.g worker) never connect with it.
+    """
+    return create_async_engine(**get_database_settings().orm_async_engine_kwargs)
+
+
+@lru_cache(maxsize=1)
+def get_async_sessionmaker() -> sessionmaker:
+    """
+    Returns factory for asynchronous sessions.
+    Objects are not expired on commit, as lazy loading is not possible with asyncio.
+    """
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        bind=get_async_engine(),
+        class_=AsyncSession,
+    )
+
+
 def create_all() -> None:
     """
     Creating all database metadata.
@@ -2,12 +2,15 @@
     FastAPI dependencies for the database.
 """
 
-from typing import TypeVar, Callable
+from typing import TypeVar, Callable, AsyncIterator
 
 from sqlalchemy.orm import Session
-from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Request, Depends
+from app.config import get_database_settings
 
-from .core import sessionmaker, SessionLocal
+from .threadpool import run_in_database_threadpool
+from .core import sessionmaker, get_async_sessionmaker, SessionLocal
 
 T = TypeVar("T")
 
@@ -24,6 +27,14 @@ def get_db() -> sessionmaker:  # type: ignore[misc]
         db_session.close()
 
 
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    Returns asynchronous database session for making plain database requests.
+    """
+    async with get_async_sessionmaker()() as db_session:
+        yield db_session
+
+
 def get_repository(repo_type: type[T]) -> Callable[[Session], T]:
     """
     Instantiates repository dependency (wrapped) based on type.
@@ -34,3 +45,26 @@ def get_repository(repo_type: type[T]) -> Callable[[Session], T]:
         return repo_type(db)  # type: ignore[call-arg]
 
     return wrapper
+
+
+def get_async_repository(repo_type: type[T]) -> Callable[[Request], AsyncIterator[T]]:
+    """
+    Instantiates asynchronous repository dependency (wrapped) based on type.
+    Repository gets asynchronous session if route is switched to the async ORM (`orm_async_routes`),
+    otherwise synchronous session, which statements are executed in the bounded database thread pool.
+    """
+
+    async def wrapper(request: Request) -> AsyncIterator[T]:
+        route_name = request.scope["endpoint"].__name__
+        if get_database_settings().route_uses_async_orm(route_name):
+            async with get_async_sessionmaker()() as db_session:
+                yield repo_type(db_session)  # type: ignore[call-arg]
+            return
+
+        db_session = SessionLocal()
+        try:
+            yield repo_type(db_session)  # type: ignore[call-arg]
+        finally:
+            await run_in_database_threadpool(db_session.close)
+
+    return wrapper
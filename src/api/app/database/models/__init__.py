@@ -7,17 +7,17 @@ from . import (
     user_agent,
     user,
     ticket,
-    oauth_code,
     oauth_client_user,
     oauth_client_use,
+    oauth_client_stats,
     oauth_client,
 )
 
 __all__ = [
     "oauth_client_use",
+    "oauth_client_stats",
     "oauth_client_user",
     "oauth_client",
-    "oauth_code",
     "ticket",
     "user_agent",
     "user_session",
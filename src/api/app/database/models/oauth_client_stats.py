@@ -0,0 +1,25 @@
+"""
+    OAuth client usage statistics (pre-aggregated counters) database models.
+"""
+
+from sqlalchemy import Integer, ForeignKey, Column, BigInteger
+from app.database.core import Base
+
+
+class OAuthClientStats(Base):
+    """Auth service OAuth2 client usage counters, maintained with each use."""
+
+    __tablename__ = "oauth_clients_stats"
+
+    client_id = Column(Integer, ForeignKey("oauth_clients.id"), primary_key=True)
+    uses = Column(BigInteger, nullable=False, default=0)
+    unique_users = Column(Integer, nullable=False, default=0)
+
+
+class OAuthClientUniqueUser(Base):
+    """Auth service OAuth2 client distinct users, used to maintain unique users counter."""
+
+    __tablename__ = "oauth_clients_unique_users"
+
+    client_id = Column(Integer, ForeignKey("oauth_clients.id"), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
@@ -2,7 +2,9 @@
     User agent database model.
 """
 
-from sqlalchemy import Text, Integer, Column
+import hashlib
+
+from sqlalchemy import Text, String, Integer, Column
 from app.database.core import Base
 
 
@@ -13,3 +15,10 @@ class UserAgent(Base):
 
     id = Column(Integer, primary_key=True, index=True, nullable=False)
     user_agent = Column(Text, nullable=False)
+    # SHA-256 hex digest of the user agent string, used for indexed lookup.
+    user_agent_hash = Column(String(64), unique=True, index=True, nullable=True)
+
+    @staticmethod
+    def get_hash(user_agent_string: str) -> str:
+        """Returns digest of the user agent string for the `user_agent_hash` column."""
+        return hashlib.sha256(user_agent_string.encode("utf-8")).hexdigest()
@@ -3,6 +3,7 @@
 """
 
 from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
 from sqlalchemy import String, Integer, ForeignKey, DateTime, Column, Boolean
 from app.database.core import Base
 
@@ -19,6 +20,7 @@ class UserSession(Base):
 
     ip_address = Column(String(12), nullable=False)
     user_agent_id = Column(Integer, ForeignKey("user_agents.id"), nullable=False)
+    user_agent = relationship("UserAgent")
     geo_country = Column(String(2), nullable=True)
 
     is_active = Column(Boolean, nullable=False, default=True)
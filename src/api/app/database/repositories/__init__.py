@@ -2,15 +2,14 @@
     Database models CRUD repositores.
 """
 
-from .users import UsersRepository
-from .user_sessions import UserSessionsRepository
+from .users import UsersRepository, AsyncUsersRepository
+from .user_sessions import UserSessionsRepository, AsyncUserSessionsRepository
 from .user_agent import UserAgentsRepository
 from .tickets import TicketsRepository
-from .oauth_code import OAuthCodesRepository
-from .oauth_clients import OAuthClientsRepository
+from .oauth_clients import OAuthClientsRepository, AsyncOAuthClientsRepository
 from .oauth_client_user import OAuthClientUserRepository
 from .oauth_client_use import OAuthClientUseRepository
-from .base import BaseRepository
+from .base import BaseRepository, AsyncBaseRepository
 
 __all__ = [
     "BaseRepository",
@@ -21,5 +20,8 @@ __all__ = [
     "UserAgentsRepository",
     "OAuthClientUserRepository",
     "OAuthClientUseRepository",
-    "OAuthCodesRepository",
+    "AsyncBaseRepository",
+    "AsyncUsersRepository",
+    "AsyncUserSessionsRepository",
+    "AsyncOAuthClientsRepository",
 ]
@@ -3,6 +3,10 @@
 """
 from abc import ABCMeta
 
+from sqlalchemy.sql import Executable
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.engine import Result
+from app.database.threadpool import run_in_database_threadpool
 from app.database.dependencies import Session
 
 
@@ -37,3 +41,52 @@ class BaseRepository(metaclass=ABCMeta):
         Commits database changes.
         """
         self.db.commit()
+
+
+class AsyncBaseRepository(metaclass=ABCMeta):
+    """
+    Base abstract class for asynchronous repositories.
+
+    Works with native asynchronous session, or with synchronous session
+    (executing statements in the bounded database thread pool) for routes that are not switched to async ORM yet.
+    """
+
+    db: AsyncSession | Session
+
+    def __init__(self, db: AsyncSession | Session) -> None:
+        """
+        Initialize a repository with a given (asynchronous or synchronous) database session.
+        """
+        self.db = db
+        if not isinstance(self.db, (AsyncSession, Session)):
+            raise TypeError(
+                f"`db` should be database AsyncSession or Session! Expected session but got: {type(self.db)}"
+            )
+
+    async def execute(self, statement: Executable) -> Result:
+        """
+        Executes statement and returns its result.
+        """
+        if isinstance(self.db, AsyncSession):
+            return await self.db.execute(statement)
+        return await run_in_database_threadpool(self.db.execute, statement)
+
+    async def finish(self, instance: object) -> None:
+        """
+        Finishes instance with adding and commiting it.
+        """
+        self.db.add(instance)
+        await self.commit()
+        if isinstance(self.db, AsyncSession):
+            await self.db.refresh(instance)
+        else:
+            await run_in_database_threadpool(self.db.refresh, instance)
+
+    async def commit(self) -> None:
+        """
+        Commits database changes.
+        """
+        if isinstance(self.db, AsyncSession):
+            await self.db.commit()
+        else:
+            await run_in_database_threadpool(self.db.commit)
@@ -2,38 +2,162 @@
     OAuth Client use repository.
 """
 
+from typing import Iterable
+from datetime import datetime, timezone
+from collections import Counter
 
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import values, update, select, func, column, Integer, BigInteger
 from app.database.repositories.base import BaseRepository
 from app.database.models.oauth_client_use import OAuthClientUse
+from app.database.models.oauth_client import OAuthClient
+from app.database.models.oauth_client_stats import (
+    OAuthClientUniqueUser,
+    OAuthClientStats,
+)
 
 
 class OAuthClientUseRepository(BaseRepository):
     """
     OAuth client use database CRUD repository.
+
+    Usage counters are maintained with each use, so statistics are read without scanning uses.
+    Uses lock rows of their clients (`FOR KEY SHARE`, so clients updates are not blocked),
+    and counters are created (from uses) with exclusive client lock,
+    so uses committed during creation are never skipped.
     """
 
-    def create(self, user_id: int, client_id: int) -> OAuthClientUse:
+    def create(self, user_id: int, client_id: int) -> None:
+        """
+        Creates new client use, and updates usage counters of the client.
+        """
+        self.create_many([(user_id, client_id, datetime.now(tz=timezone.utc))])
+
+    def create_many(self, uses: Iterable[tuple[int, int, datetime]]) -> None:
         """
-        Creates new client use object that ready to use and have all required stuff (as secret) generated.
+        Creates client uses (user id, client id, time) with single multi-row insert,
+        and updates usage counters of the clients within same transaction.
         """
-        oauth_client_use = OAuthClientUse(user_id=user_id, client_id=client_id)
+        uses = list(uses)
+        if not uses:
+            return
 
-        self.finish(oauth_client_use)
-        return oauth_client_use
+        self._lock_clients({client_id for _, client_id, _ in uses}, exclusive=False)
+        self.db.execute(
+            insert(OAuthClientUse).values(
+                [
+                    {
+                        "user_id": user_id,
+                        "client_id": client_id,
+                        "time_created": time_created,
+                    }
+                    for user_id, client_id, time_created in uses
+                ]
+            )
+        )
+        self._increment_stats(uses)
+        self.db.commit()
+
+    def get_stats(self, client_id: int) -> OAuthClientStats:
+        """
+        Returns usage counters of the client (total uses and unique users).
+        Counters are created from the uses when requested for the first time.
+        """
+        stats = self.db.get(OAuthClientStats, client_id)
+        if stats is None:
+            self._create_stats(client_id)
+            stats = self.db.get(OAuthClientStats, client_id)
+        return stats  # type: ignore
 
     def get_unique_users(self, client_id: int) -> int:
         """Returns count of all uses of oauth client by different users."""
-        return (
-            self.db.query(OAuthClientUse.user_id)
-            .filter(OAuthClientUse.client_id == client_id)
-            .group_by(OAuthClientUse.user_id)
-            .count()
-        )
+        return self.get_stats(client_id).unique_users  # type: ignore
 
     def get_uses(self, client_id: int) -> int:
         """Returns count of all uses of oauth client."""
-        return (
-            self.db.query(OAuthClientUse)
-            .filter(OAuthClientUse.client_id == client_id)
-            .count()
+        return self.get_stats(client_id).uses  # type: ignore
+
+    def _increment_stats(self, uses: list[tuple[int, int, datetime]]) -> None:
+        """
+        Increments counters of the clients with single `UPDATE ... FROM (VALUES ...)`.
+        New users are found by inserting into distinct users table (`ON CONFLICT DO NOTHING`).
+        Clients without counters are skipped, as counters are created from the uses later.
+        """
+        new_users = Counter(
+            self.db.execute(
+                insert(OAuthClientUniqueUser)
+                .values(
+                    [
+                        {"client_id": client_id, "user_id": user_id}
+                        for user_id, client_id in {use[:2] for use in uses}
+                    ]
+                )
+                .on_conflict_do_nothing()
+                .returning(OAuthClientUniqueUser.client_id)
+            ).scalars()
+        )
+        new_uses = Counter(client_id for _, client_id, _ in uses)
+        increments = values(
+            column("client_id", Integer),
+            column("uses", BigInteger),
+            column("unique_users", Integer),
+            name="increments",
+        ).data(
+            [
+                (client_id, uses_count, new_users[client_id])
+                for client_id, uses_count in new_uses.items()
+            ]
+        )
+        self.db.execute(
+            update(OAuthClientStats)
+            .where(OAuthClientStats.client_id == increments.c.client_id)
+            .values(
+                uses=OAuthClientStats.uses + increments.c.uses,
+                unique_users=OAuthClientStats.unique_users + increments.c.unique_users,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    def _lock_clients(self, client_ids: Iterable[int], exclusive: bool) -> None:
+        """Locks rows of the clients (in order of ids, so concurrent locks are not deadlocked)."""
+        self.db.execute(
+            select(OAuthClient.id)
+            .where(OAuthClient.id.in_(list(client_ids)))
+            .order_by(OAuthClient.id)
+            .with_for_update(read=not exclusive, key_share=not exclusive)
+        )
+
+    def _create_stats(self, client_id: int) -> None:
+        """
+        Creates counters of the client (once) by counting its uses,
+        for clients that were used before counters were maintained.
+        """
+        # Waits for uses that are not committed yet (and blocks new ones until commit),
+        # as their counters increments are skipped while counters are not created.
+        self._lock_clients([client_id], exclusive=True)
+        self.db.execute(
+            insert(OAuthClientUniqueUser)
+            .from_select(
+                ["client_id", "user_id"],
+                select(OAuthClientUse.client_id, OAuthClientUse.user_id)
+                .where(OAuthClientUse.client_id == client_id)
+                .distinct(),
+            )
+            .on_conflict_do_nothing()
+        )
+        self.db.execute(
+            insert(OAuthClientStats)
+            .values(
+                client_id=client_id,
+                uses=select(func.count())
+                .select_from(OAuthClientUse)
+                .where(OAuthClientUse.client_id == client_id)
+                .scalar_subquery(),
+                unique_users=select(func.count())
+                .select_from(OAuthClientUniqueUser)
+                .where(OAuthClientUniqueUser.client_id == client_id)
+                .scalar_subquery(),
+            )
+            .on_conflict_do_nothing()
         )
+        self.db.commit()
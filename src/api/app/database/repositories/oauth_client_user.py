@@ -3,6 +3,7 @@
 """
 
 
+from sqlalchemy.orm import joinedload
 from app.database.repositories.base import BaseRepository
 from app.database.models.oauth_client_user import OAuthClientUser
 
@@ -41,9 +42,10 @@ class OAuthClientUserRepository(BaseRepository):
         return oauth_client_user
 
     def get_by_user_id(self, user_id: int) -> list[OAuthClientUser]:
-        """Returns all oauth client users by user ID."""
+        """Returns all oauth client users by user ID, with their clients loaded by same query."""
         return (
             self.db.query(OAuthClientUser)
+            .options(joinedload(OAuthClientUser.oauth_client))
             .filter(OAuthClientUser.is_active == True)
             .filter(OAuthClientUser.user_id == user_id)
             .all()
@@ -4,7 +4,10 @@
 
 from secrets import token_urlsafe
 
-from app.database.repositories.base import BaseRepository
+from sqlalchemy import select
+from app.services.cache.responses import invalidate_cached_responses, OAUTH_CLIENTS
+from app.services.cache.oauth_clients import invalidate_oauth_clients
+from app.database.repositories.base import BaseRepository, AsyncBaseRepository
 from app.database.models.oauth_client import OAuthClient
 
 
@@ -13,6 +16,14 @@ class OAuthClientsRepository(BaseRepository):
     OAuth client database CRUD repository.
     """
 
+    def finish(self, instance: object) -> None:
+        """
+        Finishes client and invalidates its caches (also negative entry, when client is created).
+        """
+        super().finish(instance)
+        invalidate_oauth_clients([instance.id])  # type: ignore
+        invalidate_cached_responses(OAUTH_CLIENTS, [instance.id])  # type: ignore
+
     def get_client_by_id(self, client_id: int) -> OAuthClient | None:
         """
         Get one client by given id.
@@ -58,3 +69,29 @@ class OAuthClientsRepository(BaseRepository):
             else query
         )
         return query.first()
+
+
+class AsyncOAuthClientsRepository(AsyncBaseRepository):
+    """
+    OAuth client database asynchronous repository (read queries for the hot routes).
+    """
+
+    async def get_by_owner_id(self, owner_id: int) -> list[OAuthClient]:
+        """Returns clients by it`s owner ID."""
+        result = await self.execute(
+            select(OAuthClient).where(OAuthClient.owner_id == owner_id)
+        )
+        return list(result.scalars().all())
+
+    async def get_by_id(
+        self, client_id: int, *, is_active: bool | None = None
+    ) -> OAuthClient | None:
+        """Returns client by it ID."""
+        query = select(OAuthClient).where(OAuthClient.id == client_id)
+        query = (
+            query.where(OAuthClient.is_active == is_active)
+            if is_active is not None
+            else query
+        )
+        result = await self.execute(query.limit(1))
+        return result.scalars().first()
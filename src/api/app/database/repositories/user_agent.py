@@ -2,6 +2,12 @@
     Browser user agent repository.
 """
 
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import select
+from app.services.cache.user_agents import (
+    intern_user_agent,
+    get_interned_user_agent_id,
+)
 from app.database.repositories.base import BaseRepository
 from app.database.models.user_agent import UserAgent
 
@@ -12,22 +18,42 @@ class UserAgentsRepository(BaseRepository):
     """
 
     def get_by_string(self, user_agent_string: str) -> UserAgent | None:
-        """Returns user agent by it`s string."""
+        """Returns user agent by it`s string (looked up by the indexed digest)."""
         user_agent = (
             self.db.query(UserAgent)
-            .filter(UserAgent.user_agent == user_agent_string)
+            .filter(UserAgent.user_agent_hash == UserAgent.get_hash(user_agent_string))
             .first()
         )
+        if user_agent is not None:
+            intern_user_agent(user_agent_string, user_agent.id)  # type: ignore
         return user_agent
 
     def get_by_id(self, user_agent_id: int) -> UserAgent | None:
         """Returns user agent by it`s id."""
         return self.db.query(UserAgent).filter(UserAgent.id == user_agent_id).first()
 
-    def get_or_create_by_string(self, user_agent_string: str) -> UserAgent:
-        """Creates or returns already created user agent."""
-        user_agent = self.get_by_string(user_agent_string)
-        if user_agent is None:
-            user_agent = UserAgent(user_agent=user_agent_string)
-            self.finish(user_agent)
-        return user_agent
+    def get_or_create_id_by_string(self, user_agent_string: str) -> int:
+        """
+        Returns id of the user agent, creating it if it is not exists.
+        Repeated user agents are served from the intern map without querying database,
+        creation is race-safe with `INSERT ... ON CONFLICT DO NOTHING`.
+        """
+        if (user_agent_id := get_interned_user_agent_id(user_agent_string)) is not None:
+            return user_agent_id
+
+        user_agent_hash = UserAgent.get_hash(user_agent_string)
+        user_agent_id = self.db.execute(
+            insert(UserAgent)
+            .values(user_agent=user_agent_string, user_agent_hash=user_agent_hash)
+            .on_conflict_do_nothing(index_elements=[UserAgent.user_agent_hash])
+            .returning(UserAgent.id)
+        ).scalar()
+        if user_agent_id is None:
+            # Already created (maybe concurrently).
+            user_agent_id = self.db.execute(
+                select(UserAgent.id).where(UserAgent.user_agent_hash == user_agent_hash)
+            ).scalar_one()
+        self.db.commit()
+
+        intern_user_agent(user_agent_string, user_agent_id)
+        return user_agent_id
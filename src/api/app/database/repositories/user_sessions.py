@@ -5,9 +5,14 @@
 import secrets
 from typing import Iterator, Iterable
 
-from app.database.repositories.user_agent import UserAgentsRepository, UserAgent
-from app.database.repositories.base import BaseRepository
+from sqlalchemy.orm import joinedload
+from sqlalchemy import select
+from app.services.cache.sessions import invalidate_sessions
+from app.database.repositories.user_agent import UserAgentsRepository
+from app.database.repositories.base import BaseRepository, AsyncBaseRepository
 from app.database.models.user_session import UserSession
+from app.database.models.user_agent import UserAgent
+from app.database.models.user import User
 
 
 class UserSessionsRepository(BaseRepository):
@@ -25,13 +30,16 @@ class UserSessionsRepository(BaseRepository):
     def deactivate_one(self, session: UserSession, *, commit=True) -> None:
         """
         Deactivate one user session (mark as inactive) and commit by default.
+        Without commit, caller is responsible for invalidating sessions cache after commit.
         """
         session.is_active = False  # type: ignore
 
         # Finish database instance.
+        session_id: int = session.id  # type: ignore
         self.db.add(session)
         if commit:
             self.commit()
+            invalidate_sessions([session_id])
 
     def deactivate_list(
         self, sessions: Iterable[UserSession] | Iterator[UserSession], *, commit=True
@@ -39,29 +47,69 @@ class UserSessionsRepository(BaseRepository):
         """
         Deactivates list of user sessions (mark as inactive) and commit by default.
         """
+        session_ids = []
         for session in sessions:
             self.deactivate_one(session, commit=False)
+            session_ids.append(session.id)
         if commit:
             self.db.commit()
+            invalidate_sessions(session_ids)
 
-    def get_by_owner_id(self, owner_id: int, active_only=True) -> list[UserSession]:
-        """Returns list of sessions by owner user id."""
+    def get_by_owner_id(
+        self, owner_id: int, active_only=True, *, with_user_agents=False
+    ) -> list[UserSession]:
+        """
+        Returns list of sessions by owner user id.
+        :param with_user_agents: If true, user agents are loaded with same query (for serializing).
+        """
         query = self.db.query(UserSession).filter(UserSession.owner_id == owner_id)
         query = query.filter(UserSession.is_active == True) if active_only else query
+        if with_user_agents:
+            query = query.options(joinedload(UserSession.user_agent))
         return query.all()
 
     def get_by_id(self, session_id: int) -> UserSession | None:
         """Returns session by ID"""
         return self.db.query(UserSession).filter(UserSession.id == session_id).first()
 
+    def get_with_owner_and_user_agent(
+        self, session_id: int
+    ) -> tuple[UserSession, User, str] | None:
+        """
+        Returns session by ID with its owner user and user agent string,
+        queried with single joined SELECT (for the authentication hot path).
+        """
+        return (
+            self.db.query(UserSession, User, UserAgent.user_agent)
+            .join(User, User.id == UserSession.owner_id)
+            .join(UserAgent, UserAgent.id == UserSession.user_agent_id)
+            .filter(UserSession.id == session_id)
+            .first()
+        )  # type: ignore
+
+    def get_many_with_owner_and_user_agent(
+        self, session_ids: Iterable[int]
+    ) -> list[tuple[UserSession, User, str]]:
+        """
+        Returns sessions by IDs with their owner users and user agent strings,
+        queried with single joined SELECT.
+        """
+        return (
+            self.db.query(UserSession, User, UserAgent.user_agent)
+            .join(User, User.id == UserSession.owner_id)
+            .join(UserAgent, UserAgent.id == UserSession.user_agent_id)
+            .filter(UserSession.id.in_(list(session_ids)))
+            .all()
+        )  # type: ignore
+
     def get_by_ip_address_and_user_agent(
-        self, ip_address: str, user_agent: UserAgent
+        self, ip_address: str, user_agent_id: int
     ) -> UserSession | None:
-        """Returns session by ip address and user agent."""
+        """Returns session by ip address and user agent id."""
         return (
             self.db.query(UserSession)
             .filter(UserSession.ip_address == ip_address)
-            .filter(UserSession.user_agent_id == user_agent.id)
+            .filter(UserSession.user_agent_id == user_agent_id)
             .filter(UserSession.is_active == True)
             .first()
         )
@@ -85,12 +133,13 @@ class UserSessionsRepository(BaseRepository):
     ) -> UserSession:
         """Returns user session or creates a new one."""
 
-        user_agent = UserAgentsRepository(self.db).get_or_create_by_string(
+        user_agent_id = UserAgentsRepository(self.db).get_or_create_id_by_string(
             client_user_agent
         )
-        user_agent_id = user_agent.id
 
-        queried_session = self.get_by_ip_address_and_user_agent(client_host, user_agent)
+        queried_session = self.get_by_ip_address_and_user_agent(
+            client_host, user_agent_id
+        )
         if queried_session and queried_session.owner_id == owner_id:
             return queried_session
 
@@ -106,3 +155,39 @@ class UserSessionsRepository(BaseRepository):
 
         self.finish(session)
         return session
+
+
+class AsyncUserSessionsRepository(AsyncBaseRepository):
+    """
+    User sessions database asynchronous repository (read queries for the hot routes).
+    """
+
+    async def get_by_owner_id(
+        self, owner_id: int, active_only=True, *, with_user_agents=False
+    ) -> list[UserSession]:
+        """
+        Returns list of sessions by owner user id.
+        :param with_user_agents: If true, user agents are loaded with same query (for serializing).
+        """
+        query = select(UserSession).where(UserSession.owner_id == owner_id)
+        query = query.where(UserSession.is_active == True) if active_only else query
+        if with_user_agents:
+            query = query.options(joinedload(UserSession.user_agent))
+        result = await self.execute(query)
+        return list(result.scalars().all())
+
+    async def get_with_owner_and_user_agent(
+        self, session_id: int
+    ) -> tuple[UserSession, User, str] | None:
+        """
+        Returns session by ID with its owner user and user agent string,
+        queried with single joined SELECT (for the authentication hot path).
+        """
+        result = await self.execute(
+            select(UserSession, User, UserAgent.user_agent)
+            .join(User, User.id == UserSession.owner_id)
+            .join(UserAgent, UserAgent.id == UserSession.user_agent_id)
+            .where(UserSession.id == session_id)
+            .limit(1)
+        )
+        return result.first()  # type: ignore
@@ -2,12 +2,15 @@
     Users repository.
 """
 
+from typing import Iterable
 from datetime import datetime
 
+from sqlalchemy import values, update, select, column, Integer, DateTime
 from pyotp import random_base32
-from app.services.passwords import get_hashed_password, HashingError
+from app.services.passwords import get_hashed_password, LATEST_HASH_METHOD, HashingError
+from app.services.cache.responses import invalidate_cached_responses, USER_PROFILES
 from app.schemas.user import UpdateModel
-from app.database.repositories.base import BaseRepository
+from app.database.repositories.base import BaseRepository, AsyncBaseRepository
 from app.database.models.user import User
 from app.config import get_settings
 
@@ -43,6 +46,36 @@ class UsersRepository(BaseRepository):
         """
         return self.db.query(User).filter(User.id == user_id).first()
 
+    def get_users_by_ids(self, user_ids: Iterable[int]) -> list[User]:
+        """
+        Get many users by IDs with single query.
+        """
+        return self.db.query(User).filter(User.id.in_(list(user_ids))).all()
+
+    def bulk_update_time_online(self, times_online: dict[int, datetime]) -> int:
+        """
+        Updates online time for many users with single `UPDATE ... FROM (VALUES ...)`.
+        Never moves online time backwards, and does not touch update time of the users.
+        Returns amount of updated users.
+        """
+        if not times_online:
+            return 0
+
+        online = values(
+            column("id", Integer),
+            column("time_online", DateTime(timezone=True)),
+            name="online",
+        ).data(list(times_online.items()))
+        result = self.db.execute(
+            update(User)
+            .where(User.id == online.c.id)
+            .where(User.time_online < online.c.time_online)
+            .values(time_online=online.c.time_online, time_updated=User.time_updated)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return result.rowcount
+
     def deactivate(self, user: User, reason: str | None = None) -> None:
         """
         Deactivates (bans) user.
@@ -50,36 +83,60 @@ class UsersRepository(BaseRepository):
         """
         user.is_active = False  # type: ignore
         reason = reason  # type: ignore
+        self.commit()
+        invalidate_cached_responses(USER_PROFILES, [user.username])
 
     def activate(self, user: User) -> None:
         """
         Activates (unbans) user.
         """
         user.is_active = True  # type: ignore
+        self.commit()
+        invalidate_cached_responses(USER_PROFILES, [user.username])
 
     def create(
-        self, username: str, email: str, password: str, phone_number: str | None = None
+        self,
+        username: str,
+        email: str,
+        password: str,
+        phone_number: str | None = None,
+        *,
+        hashed_password: str | None = None,
     ) -> User | None:
         """
         Creates new user object that ready to use and have all required stuff (as hashed password) generated.
+        If hashed password is passed (e.g hashed asynchronously), password is not hashed again,
+        and should be hashed with the latest hash method.
         """
 
-        try:
-            # !TODO!: Weird crutch that is caused by hashing stuff.
-            hashed_password = get_hashed_password(password, hash_method=None)
-        except HashingError:
-            return None
+        if hashed_password is None:
+            try:
+                # !TODO!: Weird crutch that is caused by hashing stuff.
+                hashed_password = get_hashed_password(
+                    password, hash_method=LATEST_HASH_METHOD
+                )
+            except HashingError:
+                return None
 
         user = User(
             username=username,
             email=email,
             phone_number=phone_number,
             password=hashed_password,
+            security_hash_method=LATEST_HASH_METHOD,
         )
 
         self.finish(user)
         return user
 
+    def set_hashed_password(
+        self, user: User, hashed_password: str, hash_method: int
+    ) -> None:
+        """Sets new hashed password (with its hash method) for user and commits."""
+        user.password = hashed_password  # type: ignore
+        user.security_hash_method = hash_method  # type: ignore
+        self.db.commit()
+
     def email_confirm(self, user: User) -> None:
         """Confirms given user email."""
 
@@ -94,13 +151,16 @@ class UsersRepository(BaseRepository):
     def apply_update_model(self, model: UpdateModel, user: User) -> bool:
         """
         Applies the update model onto given user object.
+        Cached profile is dropped both by the old and new username (if it is changed).
         """
+        old_username = user.username
         new_fields = model.get_new_fields(user)
         for name in new_fields.keys():
             setattr(user, name, getattr(model, name))
 
         if is_updated := bool(new_fields):
             self.commit()
+            invalidate_cached_responses(USER_PROFILES, {old_username, user.username})
         return is_updated
 
     def email_is_taken(self, email: str) -> bool:
@@ -117,3 +177,25 @@ class UsersRepository(BaseRepository):
             self.db.query(User).filter(User.phone_number == phone_number).first()
             is not None
         )
+
+
+class AsyncUsersRepository(AsyncBaseRepository):
+    """
+    Users database asynchronous repository (read queries for the hot routes).
+    """
+
+    async def get_user_by_id(self, user_id: int) -> User | None:
+        """
+        Get one user by ID.
+        """
+        result = await self.execute(select(User).where(User.id == user_id).limit(1))
+        return result.scalars().first()
+
+    async def get_user_by_username(self, username: str) -> User | None:
+        """
+        Get one user by given username.
+        """
+        result = await self.execute(
+            select(User).where(User.username == username).limit(1)
+        )
+        return result.scalars().first()
@@ -0,0 +1,57 @@
+"""
+    Bounded thread pool for the synchronous database work.
+
+    Until routes are switched to the asynchronous ORM, blocking SQLAlchemy calls
+    are executed in the worker threads limited to the ORM pool size,
+    so excess work waits for the free connection without holding threads (or event loop).
+"""
+
+import time
+from typing import TypeVar, Callable, Any
+from functools import lru_cache
+
+import anyio
+from app.services import metrics
+from app.config import get_database_settings
+
+T = TypeVar("T")
+
+
+async def run_in_database_threadpool(
+    func: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    """
+    Runs synchronous database work in the bounded thread pool.
+    Time spent waiting for the free thread is observed as metric.
+    """
+    submitted_at = time.monotonic()
+
+    def run() -> T:
+        metrics.observe(
+            "database_threadpool_wait_seconds", time.monotonic() - submitted_at
+        )
+        return func(*args, **kwargs)
+
+    return await anyio.to_thread.run_sync(run, limiter=_get_limiter())
+
+
+@lru_cache(maxsize=1)
+def _get_limiter() -> anyio.CapacityLimiter:
+    return anyio.CapacityLimiter(get_database_settings().orm_poll_size)
+
+
+def _get_queue_depth() -> float:
+    return _get_limiter().statistics().tasks_waiting
+
+
+def _get_threads_busy() -> float:
+    return _get_limiter().borrowed_tokens
+
+
+def _get_size() -> float:
+    return _get_limiter().total_tokens
+
+
+metrics.register_gauge("database_threadpool_queue_depth", _get_queue_depth)
+metrics.register_gauge("database_threadpool_threads_busy", _get_threads_busy)
+metrics.register_gauge("database_threadpool_size", _get_size)
@@ -9,7 +9,8 @@ from app.services.validators.user import (
 )
 from app.services.tfa import validate_user_tfa_otp_from_request, generate_tfa_otp
 from app.services.request.signup_host_allowance import validate_signup_host_allowance
-from app.services.limiter.depends import RateLimiter
+from app.services.passwords import get_hashed_password_async, LATEST_HASH_METHOD
+from app.services.limiter.depends import RateLimiter, RateLimit
 from app.services.limiter import extended_default_identifier
 from app.services.api import ApiErrorException, ApiErrorCode
 from app.schemas.session import SignupModel, SigninModel
@@ -19,6 +20,11 @@ from app.database.dependencies import get_repository
 from app.config import get_settings, Settings
 
 
+async def _tfa_user_identifier(request: Request, user_id: int) -> str:
+    # pylint: disable=unused-argument
+    return f"user:{user_id}:signin_email_tfa"
+
+
 def _tfa_limiter_callback(request, response, pexpire):
     if not get_settings().requests_limiter_enabled:
         return
@@ -44,7 +50,9 @@ async def get_valid_signin_user(
             login=convert_email_to_standardized(payload.login)
         )
 
-    user = validate_signin_fields(user=user, password=payload.password)
+    user = await validate_signin_fields(
+        user=user, password=payload.password, db=user_repo.db
+    )
 
     if not user.security_tfa_enabled:
         return user
@@ -56,6 +64,8 @@ async def get_valid_signin_user(
         if tfa_device == "email":
             # Email 2FA device.
             # Send 2FA OTP to email address.
+            # Limited both per client and per user (with single Redis call),
+            # so email is not flooded from different hosts.
             await RateLimiter(
                 times=1,
                 seconds=30,
@@ -63,6 +73,13 @@ async def get_valid_signin_user(
                     extended_default_identifier, extended_identifier="signin_email_tfa"
                 ),
                 callback=_tfa_limiter_callback,
+                limits=(
+                    RateLimit(
+                        times=1,
+                        milliseconds=30_000,
+                        identifier=partial(_tfa_user_identifier, user_id=user.id),
+                    ),
+                ),
             ).check(request)
 
             tfa_otp: str = generate_tfa_otp(user, device_type=tfa_device)  # type: ignore
@@ -107,9 +124,16 @@ async def get_valid_signup_user(
 
     validate_signup_host_allowance(db=user_repo.db, request=req)
     validate_signup_fields(user_repo.db, model)
+    hashed_password = await get_hashed_password_async(
+        model.password, hash_method=LATEST_HASH_METHOD
+    )
     if not (
         user := user_repo.create(
-            model.username, model.email, model.password, model.phone_number
+            model.username,
+            model.email,
+            model.password,
+            model.phone_number,
+            hashed_password=hashed_password,
         )
     ):
         raise ApiErrorException(
@@ -1,33 +1,27 @@
-from fastapi import Request, Depends
-from app.services.request.auth import try_query_auth_data_from_request
+from app.services.request.auth_data import AuthData
 from app.services.api import ApiErrorException, ApiErrorCode
-from app.database.repositories.users import UsersRepository, User
-from app.database.dependencies import get_repository
+from app.database.repositories.users import AsyncUsersRepository, User
 
 
 async def get_profile_with_access(
-    req: Request,
     username: str,
-    user_repo: UsersRepository = Depends(get_repository(UsersRepository)),
+    user_repo: AsyncUsersRepository,
+    auth_data: AuthData | None,
 ) -> User:
-    user = user_repo.get_user_by_username(username)
+    """
+    Returns user profile by username, if it is accessible with given auth data.
+    Auth data is queried by the caller, as cached profile response varies by it.
+    """
+    user = await user_repo.get_user_by_username(username)
     if not user:
         raise ApiErrorException(
             ApiErrorCode.USER_NOT_FOUND,
             "User with requested username was not found!",
         )
 
-    is_owner = False
-    is_admin = False
-    is_authenticated = False
-    if not user.privacy_profile_public or not user.is_active:
-        # If not public, or deactivated (check for admin).
-        if auth_data := try_query_auth_data_from_request(
-            req, user_repo.db, allow_external_clients=True
-        ):
-            is_owner = auth_data.user.id == user.id  # type: ignore
-            is_admin = auth_data.user.is_admin  # type: ignore
-        is_authenticated = auth_data is not None
+    is_authenticated = auth_data is not None
+    is_owner = is_authenticated and auth_data.user.id == user.id  # type: ignore
+    is_admin = is_authenticated and auth_data.user.is_admin  # type: ignore
 
     if not user.is_active and not is_admin:
         raise ApiErrorException(
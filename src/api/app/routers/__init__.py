@@ -5,6 +5,7 @@
 from fastapi import FastAPI
 
 from .v1 import include_v1_routers
+from . import well_known
 
 
 def include_routers(_app: FastAPI) -> None:
@@ -12,3 +13,4 @@ def include_routers(_app: FastAPI) -> None:
     Includes FastAPI routers onto the app.
     """
     include_v1_routers(_app=_app)
+    _app.include_router(well_known.router)
@@ -6,8 +6,9 @@ from fastapi.responses import RedirectResponse, JSONResponse
 from fastapi import Depends, APIRouter
 from app.services.request.auth import AuthDataDependency, AuthData
 from app.services.oauth.permissions import normalize_scope
+from app.services.oauth.uses import record_oauth_client_use
 from app.services.oauth.flows import oauth_impicit_flow, oauth_authorization_code_flow
-from app.services.oauth import resolve_grant, query_oauth_client
+from app.services.oauth import resolve_grant, query_oauth_client_metadata
 from app.services.api import api_success, api_error, ApiErrorCode
 from app.schemas.oauth import (
     ResponseType,
@@ -15,10 +16,7 @@ from app.schemas.oauth import (
     AuthorizeModel,
     AllowClientModel,
 )
-from app.database.repositories import (
-    OAuthClientUserRepository,
-    OAuthClientUseRepository,
-)
+from app.database.repositories import OAuthClientUserRepository
 from app.database.dependencies import Session
 from app.config import get_settings, Settings
 
@@ -33,7 +31,7 @@ async def oauth_authorize(
 ) -> JSONResponse | RedirectResponse:
     """Redirects to authorization screen."""
 
-    query_oauth_client(db, model.client_id)
+    query_oauth_client_metadata(db, model.client_id)
     return RedirectResponse(
         url=f"{settings.auth_oauth_screen_provider_url}"
         f"?client_id={model.client_id}"
@@ -72,16 +70,16 @@ async def oauth_allow_client(
     by returning required information (code or access token) and formatted redirect_to URL.
     """
 
-    oauth_client = query_oauth_client(db=db, client_id=model.client_id)
+    oauth_client = query_oauth_client_metadata(db=db, client_id=model.client_id)
     user, session = auth_data.user, auth_data.session
 
     if response := (
-        oauth_authorization_code_flow(model, db, user, session)
+        oauth_authorization_code_flow(model, user, session)
         if model.response_type == ResponseType.code
         else oauth_impicit_flow(model, user, session)
     ):
         # Log statistics and save oauth user.
-        OAuthClientUseRepository(db).create(user.id, oauth_client.id)  # type: ignore
+        record_oauth_client_use(db, user.id, oauth_client.id)  # type: ignore
         OAuthClientUserRepository(db).create_if_not_exists(
             user_id=user.id, client_id=oauth_client.id, scope=normalize_scope(model.scope)  # type: ignore
         )
@@ -2,24 +2,35 @@
     Oauth API auth routers.
 """
 
-import time
-
 from sqlalchemy.orm import Session
 from fastapi.responses import JSONResponse
-from fastapi import Request, Depends, APIRouter
+from fastapi import Response, Request, Depends, APIRouter
 from app.services.request.auth import AuthDataDependency, AuthData
 from app.services.request import query_auth_data_from_request
 from app.services.oauth.permissions import scopes_is_same, Permission
-from app.services.oauth import query_oauth_client
+from app.services.oauth import query_oauth_client, get_oauth_client_metadata
 from app.services.limiter.depends import RateLimiter
+from app.services.cache.responses import (
+    invalidate_cached_responses,
+    get_cached_response,
+    cache_response,
+    OAUTH_CLIENTS,
+)
+from app.services.cache.oauth_clients import invalidate_oauth_clients
 from app.services.api import api_success, api_error, ApiErrorCode
-from app.serializers.oauth_client import serialize_oauth_clients, serialize_oauth_client
+from app.serializers.oauth_client import (
+    serialize_oauth_clients,
+    serialize_oauth_client,
+    serialize_linked_oauth_clients,
+)
 from app.database.repositories import (
     OAuthClientUserRepository,
     OAuthClientUseRepository,
     OAuthClientsRepository,
+    AsyncOAuthClientsRepository,
 )
-from app.database.dependencies import get_repository
+from app.database.dependencies import get_repository, get_async_repository
+from app.config import get_settings
 
 router = APIRouter(tags=["client"], prefix="/client")
 
@@ -46,7 +57,9 @@ async def create_client(
 
 @router.get("/list")
 async def list_clients(
-    repo: OAuthClientsRepository = Depends(get_repository(OAuthClientsRepository)),
+    repo: AsyncOAuthClientsRepository = Depends(
+        get_async_repository(AsyncOAuthClientsRepository)
+    ),
     auth_data: AuthData = Depends(
         AuthDataDependency(
             required_permissions={Permission.oauth_clients}, allow_not_confirmed=False
@@ -56,7 +69,8 @@ async def list_clients(
     """Returns list of user owned OAuth clients."""
     return api_success(
         serialize_oauth_clients(
-            repo.get_by_owner_id(auth_data.user.id), include_deactivated=False  # type: ignore
+            await repo.get_by_owner_id(auth_data.user.id),  # type: ignore
+            include_deactivated=False,
         )
     )
 
@@ -73,21 +87,7 @@ async def get_linked_clients(
     """OAUTH API endpoint for getting linked oauth clients."""
 
     return api_success(
-        {
-            "linked_oauth_clients": [
-                {
-                    serialize_oauth_client(user.oauth_client, display_secret=False)
-                    | {
-                        "requested_scope": user.requested_scope,
-                        "requested_at": time.mktime(user.time_created.timetuple()),
-                        "request_updated_at": time.mktime(user.time_updated.timetuple())
-                        if user.time_updated
-                        else None,
-                    },
-                }
-                for user in repo.get_by_user_id(auth_data.user.id)  # type: ignore
-            ]
-        }
+        serialize_linked_oauth_clients(repo.get_by_user_id(auth_data.user.id))  # type: ignore
     )
 
 
@@ -123,9 +123,15 @@ async def get_client(
     scope: str = "",
     db: Session = Depends(),
     repo: OAuthClientsRepository = Depends(get_repository(OAuthClientsRepository)),
-) -> JSONResponse:
+) -> Response:
     """OAUTH API endpoint for getting oauth authorization client data."""
-    oauth_client = repo.get_by_id(client_id, is_active=True)
+    # Only display data is cached, as linked state is different for each user.
+    if not check_is_linked and (
+        cached_response := await get_cached_response(OAUTH_CLIENTS, client_id)
+    ):
+        return cached_response
+
+    oauth_client = get_oauth_client_metadata(repo.db, client_id)
     if not oauth_client:
         return api_error(
             ApiErrorCode.OAUTH_CLIENT_NOT_FOUND,
@@ -146,8 +152,14 @@ async def get_client(
             "is_linked": oauth_client_user is not None
             and scopes_is_same(scope, oauth_client_user.requested_scope)
         }
+        return api_success(response)
 
-    return api_success(response)
+    return await cache_response(
+        OAUTH_CLIENTS,
+        client_id,
+        api_success(response),
+        ttl=get_settings().fastapi_cache_oauth_client_ttl,
+    )
 
 
 @router.post("/secret/refresh")
@@ -192,6 +204,8 @@ async def method_oauth_client_update(
 
     if is_updated:
         db.commit()
+        invalidate_oauth_clients([oauth_client.id])
+        invalidate_cached_responses(OAUTH_CLIENTS, [oauth_client.id])
 
     return api_success(
         {
@@ -211,11 +225,12 @@ async def method_oauth_client_stats(
 ) -> JSONResponse:
     """Fetch usage statistics of your OAuth client, like total uses, unique users."""
     oauth_client = query_oauth_client(repo.db, client_id, auth_data.user.id)  # type: ignore
+    stats = repo.get_stats(client_id)
 
     return api_success(
         {
             **serialize_oauth_client(oauth_client, display_secret=False),
-            "uses": repo.get_uses(client_id),
-            "unique_users": repo.get_unique_users(client_id),
+            "uses": stats.uses,
+            "unique_users": stats.unique_users,
         }
     )
@@ -21,7 +21,7 @@ from app.services.session import publish_new_session_with_token
 from app.services.request.direct_auth import check_direct_auth_is_allowed
 from app.services.request import AuthDataDependency, AuthData
 from app.services.limiter.depends import RateLimiter
-from app.services.api import api_success, api_error, ApiErrorCode
+from app.services.api import api_success, api_error, ApiResponse, ApiErrorCode
 from app.serializers.user import serialize_user
 from app.schemas.session import LogoutModel, AuthModel
 from app.dependencies.session import get_valid_signup_user, get_valid_signin_user, User
@@ -32,7 +32,7 @@ router = APIRouter(
     include_in_schema=True,
     tags=["session"],
     prefix="/session",
-    default_response_class=JSONResponse,
+    default_response_class=ApiResponse,
     dependencies=[Depends(check_direct_auth_is_allowed)],
 )
 
@@ -69,7 +69,8 @@ async def logout(
     Logout current session (or specified by ID).
     """
 
-    sessions: Iterable | Iterator = [auth_data.session]
+    # Current session may be cached snapshot, so query the database model for deactivation.
+    sessions: Iterable | Iterator = [repo.get_by_id(auth_data.session.id)]  # type: ignore
     if model.revoke_all:
         sessions = repo.get_by_owner_id(owner_id=auth_data.user.id)  # type: ignore
         if model.exclude_current:
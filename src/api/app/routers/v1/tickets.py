@@ -6,7 +6,7 @@ from fastapi.responses import JSONResponse
 from fastapi import Request, Depends, APIRouter
 from app.services.request.auth import try_query_auth_data_from_request
 from app.services.limiter.depends import RateLimiter
-from app.services.api import api_success
+from app.services.api import api_success, ApiResponse
 from app.serializers.ticket import serialize_ticket
 from app.schemas.tickets import TicketModel
 from app.database.repositories import TicketsRepository
@@ -16,7 +16,7 @@ router = APIRouter(
     include_in_schema=True,
     tags=["tickets"],
     prefix="/tickets",
-    default_response_class=JSONResponse,
+    default_response_class=ApiResponse,
 )
 
 
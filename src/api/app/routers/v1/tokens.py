@@ -7,18 +7,21 @@
 from fastapi.responses import JSONResponse
 from fastapi import Depends, APIRouter
 from app.services.request.auth import (
+    query_auth_data_from_tokens,
     query_auth_data_from_token,
     parse_permissions_from_scope,
     AccessToken,
 )
-from app.services.api import api_success
+from app.services.api import api_success, ApiResponse, ApiErrorException
+from app.schemas.tokens import CheckTokensBatchModel
+from app.database.threadpool import run_in_database_threadpool
 from app.database.dependencies import Session
 
 router = APIRouter(
     include_in_schema=True,
     tags=["tokens"],
     prefix="/tokens",
-    default_response_class=JSONResponse,
+    default_response_class=ApiResponse,
 )
 
 
@@ -44,12 +47,54 @@ async def check_access_token(
         request=None,
     ).token
 
+    return api_success(_serialize_token_check(token))
+
+
+@router.post("/check/batch")
+async def check_access_tokens_batch(
+    model: CheckTokensBatchModel,
+    db: Session = Depends(),
+) -> JSONResponse:
+    """
+    Returns information about many given tokens at once (see `check` method),
+    with one result (success or error) per token in same order.
+
+    Sessions and users for all tokens are queried at once,
+    so prefer this method for checking many tokens from your end-users.
+    """
+    results = await run_in_database_threadpool(
+        query_auth_data_from_tokens,
+        model.access_tokens,
+        db,
+        required_permissions=parse_permissions_from_scope(model.required_scope),
+        allow_external_clients=True,
+    )
+
     return api_success(
         {
-            "scope": token.get_scope(),
-            "user_id": token.get_subject(),
-            "expires_at": token.get_expires_at(),
-            "issued_at": token.get_issued_at(),
-            "signature_is_valid": token.signature_is_valid(),
+            "results": [
+                _serialize_token_check_error(result)
+                if isinstance(result, ApiErrorException)
+                else {"success": _serialize_token_check(result.token)}  # type: ignore
+                for result in results
+            ]
         }
     )
+
+
+def _serialize_token_check(token: AccessToken) -> dict:
+    return {
+        "scope": token.get_scope(),
+        "user_id": token.get_subject(),
+        "expires_at": token.get_expires_at(),
+        "issued_at": token.get_issued_at(),
+        "signature_is_valid": token.signature_is_valid(),
+    }
+
+
+def _serialize_token_check_error(error: ApiErrorException) -> dict:
+    code, status = error.api_code.value
+    return {
+        "error": {"message": error.message, "code": code, "status": status}
+        | (error.data or {})
+    }
@@ -5,10 +5,11 @@
 """
 
 from fastapi.responses import JSONResponse
-from fastapi import Depends, APIRouter
+from fastapi import Response, Request, Depends, APIRouter
 from app.services.request import AuthDataDependency, AuthData
 from app.services.oauth.permissions import Permission
 from app.services.limiter.depends import RateLimiter
+from app.services.api.etag import not_modified_response, is_not_modified, get_user_etag
 from app.services.api import api_success
 from app.serializers.user import serialize_user
 from app.schemas.user import UpdateModel
@@ -20,16 +21,23 @@ router = APIRouter()
 
 @router.get("/")
 async def get_user_info(
+    req: Request,
     auth_data: AuthData = Depends(AuthDataDependency()),
-) -> JSONResponse:
+) -> Response:
     """
     Fetch all information about current user with access token.
 
     Email and phone will be only returned if there is email or phone permission for token.
+    Supports conditional requests with `If-None-Match` (not modified response only saves body,
+    and online time may be stale in it).
     """
     has_access_to_email = Permission.email in auth_data.permissions
     has_access_to_phone = Permission.phone in auth_data.permissions
-    return api_success(
+    etag = get_user_etag(auth_data.user, has_access_to_email, has_access_to_phone)
+    if is_not_modified(req, etag):
+        return not_modified_response(etag)
+
+    response = api_success(
         serialize_user(
             user=auth_data.user,
             include_optional_fields=True,
@@ -39,6 +47,8 @@ async def get_user_info(
             include_phone=has_access_to_phone,
         )
     )
+    response.headers["ETag"] = etag
+    return response
 
 
 @router.patch("/", dependencies=[Depends(RateLimiter(times=2, seconds=5))])
@@ -4,28 +4,85 @@
     Provides methods to work with user profiles (e.g. public users)
 """
 
-from fastapi.responses import JSONResponse
-from fastapi import Depends, APIRouter
+from sqlalchemy.orm import Session
+from fastapi import Response, Request, Depends, APIRouter
+from app.services.request.auth import (
+    try_query_auth_data_from_request,
+    get_token_from_request,
+)
 from app.services.limiter.depends import RateLimiter
+from app.services.cache.responses import (
+    get_cached_response,
+    cache_response,
+    USER_PROFILES,
+)
+from app.services.api.etag import not_modified_response, is_not_modified, get_user_etag
 from app.services.api import api_success
 from app.serializers.user import serialize_user
-from app.dependencies.user import get_profile_with_access, User
+from app.dependencies.user import get_profile_with_access
+from app.database.threadpool import run_in_database_threadpool
+from app.database.repositories.users import AsyncUsersRepository
+from app.database.dependencies import get_async_repository
+from app.config import get_settings
 
 router = APIRouter(prefix="/profile", tags=["profile"])
 
 
 @router.get("/", dependencies=[Depends(RateLimiter(times=3, seconds=1))])
 async def get_user_profile(
-    profile: User = Depends(get_profile_with_access),
-) -> JSONResponse:
+    req: Request,
+    username: str,
+    user_repo: AsyncUsersRepository = Depends(
+        get_async_repository(AsyncUsersRepository)
+    ),
+    db: Session = Depends(),
+) -> Response:
     """
     Returns public information about the user (his profile) by username,
     if their privacy settings allows access for you.
+    Supports conditional requests with `If-None-Match`.
     """
-    return api_success(
+    # Public profiles are same for everyone, but may require authentication.
+    # Profile that is cached for anonymous users is returned without querying auth data.
+    variant = "anonymous"
+    cached_response = await get_cached_response(USER_PROFILES, username, variant)
+    auth_data = None
+    if cached_response is None and get_token_from_request(
+        req, only_session_token=False
+    ):
+        auth_data = await run_in_database_threadpool(
+            try_query_auth_data_from_request, req, db, allow_external_clients=True
+        )
+        if auth_data:
+            variant = "authenticated"
+            cached_response = await get_cached_response(
+                USER_PROFILES, username, variant
+            )
+    if cached_response is not None:
+        # ETag is cached with the response, so user is not loaded for conditional requests.
+        if is_not_modified(req, etag := cached_response.headers.get("ETag")):
+            return not_modified_response(etag)  # type: ignore
+        return cached_response
+
+    profile = await get_profile_with_access(username, user_repo, auth_data)
+    etag = get_user_etag(profile, "profile")
+    if is_not_modified(req, etag):
+        return not_modified_response(etag)
+
+    response = api_success(
         serialize_user(
             profile,
             include_optional_fields=True,
             include_profile_fields=True,
         )
     )
+    response.headers["ETag"] = etag
+    if profile.is_active and profile.privacy_profile_public:
+        await cache_response(
+            USER_PROFILES,
+            username,
+            response,
+            ttl=get_settings().fastapi_cache_user_profile_ttl,
+            variant=variant,
+        )
+    return response
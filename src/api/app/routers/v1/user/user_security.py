@@ -44,6 +44,8 @@ async def list_sessions(
     return api_success(
         {"current_session_id": auth_data.session.id}
         | serialize_sessions(
-            repo.get_by_owner_id(auth_data.session.owner_id), repo.db  # type: ignore
+            repo.get_by_owner_id(
+                auth_data.session.owner_id, with_user_agents=True  # type: ignore
+            )
         )
     )
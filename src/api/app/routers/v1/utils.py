@@ -6,15 +6,20 @@
 from time import time
 
 from fastapi.responses import JSONResponse
-from fastapi import APIRouter
-from app.services.api import api_success
+from fastapi import Response, Depends, APIRouter
+from app.services.request import AuthDataDependency, AuthData
+from app.services.oauth.permissions import Permission
+from app.services.cache.responses import get_cached_response, cache_response, FEATURES
+from app.services.api import api_success, ApiResponse, ApiErrorException, ApiErrorCode
+from app.services import metrics
 from app.schemas.features import FeaturesModel
+from app.config import get_settings
 
 router = APIRouter(
     include_in_schema=True,
     tags=["utils"],
     prefix="/utils",
-    default_response_class=JSONResponse,
+    default_response_class=ApiResponse,
 )
 
 
@@ -28,10 +33,37 @@ async def status() -> JSONResponse:
 
 
 @router.get("/features")
-async def features() -> JSONResponse:
+async def features() -> Response:
     """
     Returns API features (like, is there signup open or other stuff).
     May be used for displaying some service outage information.
     """
 
-    return api_success(FeaturesModel.from_settings())
+    if cached_response := await get_cached_response(FEATURES, "all"):
+        return cached_response
+    return await cache_response(
+        FEATURES,
+        "all",
+        api_success(FeaturesModel.from_settings()),
+        ttl=get_settings().fastapi_cache_features_ttl,
+    )
+
+
+@router.get("/metrics")
+async def get_metrics(
+    auth_data: AuthData = Depends(
+        AuthDataDependency(
+            required_permissions={Permission.admin}, trigger_online_update=False
+        )
+    ),
+) -> JSONResponse:
+    """
+    Returns in-process metrics of the worker that served request (admin only).
+    Used for watching saturation (e.g database thread pool queue depth and wait time).
+    """
+    if get_settings().admin_methods_disabled or not auth_data.user.is_admin:
+        raise ApiErrorException(
+            ApiErrorCode.API_FORBIDDEN, "Admin methods are not available for you!"
+        )
+
+    return api_success({"metrics": metrics.collect_metrics()})
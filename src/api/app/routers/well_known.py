@@ -0,0 +1,30 @@
+"""
+    Well-known URIs router.
+    Provides public keys (JWKS) for offline verification of the access tokens.
+"""
+
+from fastapi import APIRouter
+from app.services.tokens.signing_keys import get_jwks
+from app.services.api import ApiResponse
+from app.config import get_settings
+
+router = APIRouter(
+    include_in_schema=True,
+    tags=["well-known"],
+    prefix="/.well-known",
+    default_response_class=ApiResponse,
+)
+
+
+@router.get("/jwks.json")
+async def jwks() -> ApiResponse:
+    """
+    Returns public keys of the access tokens signing keys (JWK set),
+    key for the token is found by its `kid` header. Empty if tokens are signed with session secrets.
+    """
+    return ApiResponse(
+        get_jwks(),
+        headers={
+            "Cache-Control": f"public, max-age={get_settings().security_jwks_max_age}"
+        },
+    )
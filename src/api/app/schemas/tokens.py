@@ -0,0 +1,22 @@
+"""
+    Token schemas.
+"""
+from pydantic import validator, Field, BaseModel
+from app.config import get_settings
+
+
+class CheckTokensBatchModel(BaseModel):
+    """
+    Batch access tokens check request model.
+    """
+
+    access_tokens: list[str] = Field(min_items=1)
+    required_scope: str = ""
+
+    @validator("access_tokens")
+    @classmethod
+    def validate_access_tokens(cls, value) -> list[str]:
+        max_size = get_settings().security_tokens_check_batch_max_size
+        if len(value) > max_size:
+            raise ValueError(f"Batch should contain no more than {max_size} tokens!")
+        return value
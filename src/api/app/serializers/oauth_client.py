@@ -47,5 +47,27 @@ def serialize_list(
     }
 
 
+def serialize_linked(oauth_client_users: list) -> dict:
+    """
+    Returns dict object for API response with serialized linked oauth clients list data.
+    Clients should be loaded with links (see `OAuthClientUserRepository.get_by_user_id`).
+    """
+
+    return {
+        "linked_oauth_clients": [
+            serialize(user.oauth_client, display_secret=False)
+            | {
+                "requested_scope": user.requested_scope,
+                "requested_at": time.mktime(user.time_created.timetuple()),
+                "request_updated_at": time.mktime(user.time_updated.timetuple())
+                if user.time_updated
+                else None,
+            }
+            for user in oauth_client_users
+        ]
+    }
+
+
 serialize_oauth_clients = serialize_list
 serialize_oauth_client = serialize
+serialize_linked_oauth_clients = serialize_linked
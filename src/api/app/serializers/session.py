@@ -5,21 +5,20 @@
 
 import time
 
-from app.database.repositories import UserAgentsRepository
 from app.database.models.user_session import UserSession
-from app.database.dependencies import Session
 
 
-def serialize(session: UserSession, db: Session, in_list: bool = False):
-    """Returns dict object for API response with serialized session data."""
+def serialize(session: UserSession, in_list: bool = False):
+    """
+    Returns dict object for API response with serialized session data.
+    User agent should be loaded with session (see `UserSessionsRepository.get_by_owner_id`).
+    """
 
-    user_agent = UserAgentsRepository(db).get_by_id(session.user_agent_id)
-    user_agent_string = user_agent.user_agent
     serialized = {
         "id": session.id,
         "ip": session.ip_address,
         "geo_country": session.geo_country,
-        "user_agent": user_agent_string,
+        "user_agent": session.user_agent.user_agent,
         "created_at": time.mktime(session.time_created.timetuple()),
         "is_active": session.is_active,
     }
@@ -27,12 +26,10 @@ def serialize(session: UserSession, db: Session, in_list: bool = False):
     return serialized if in_list else {"session": serialized}
 
 
-def serialize_list(sessions: list[UserSession], db: Session) -> dict:
+def serialize_list(sessions: list[UserSession]) -> dict:
     """Returns dict object for API response with serialized sessions list data."""
 
-    return {
-        "sessions": [serialize(session, db=db, in_list=True) for session in sessions]
-    }
+    return {"sessions": [serialize(session, in_list=True) for session in sessions]}
 
 
 serialize_sessions = serialize_list
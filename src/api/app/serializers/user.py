@@ -4,10 +4,143 @@
 
 
 import time
-from typing import Any
+from typing import Iterable, Callable, Any
+from functools import lru_cache
 
+from sqlalchemy.orm import InstrumentedAttribute
 from app.database.models.user import User
 
+# Serializes fields of the user (model or row with same attributes) into the serialized dict.
+_Section = Callable[[Any, dict[str, Any]], None]
+
+
+class UserSerializer:
+    """
+    Serializer of the users, specialized for one combination of the flags.
+
+    Accepts both `User` models and rows selected with `columns`
+    (e.g `select(*serializer.columns)`), so lists may be serialized without loading full models.
+    """
+
+    def __init__(self, sections: list[tuple[_Section, tuple[str, ...]]]) -> None:
+        """
+        :param sections: Sections to serialize in order, with column names required by each.
+        """
+        self._sections = [section for section, _ in sections]
+        names = dict.fromkeys(name for _, names in sections for name in names)
+        self.columns: tuple[InstrumentedAttribute, ...] = tuple(
+            getattr(User, name) for name in names
+        )
+
+    def __call__(self, user: Any) -> dict[str, Any]:
+        serialized: dict[str, Any] = {}
+        for section in self._sections:
+            section(user, serialized)
+        return serialized
+
+    def serialize_list(self, users: Iterable[Any]) -> list[dict[str, Any]]:
+        """Returns list of the serialized users."""
+        return [self(user) for user in users]
+
+
+def _get_full_name(first_name: str | None, last_name: str | None) -> str:
+    """Same as `User.full_name`, but usable for the rows."""
+    if first_name is not None:
+        return first_name if last_name is None else f"{first_name} {last_name}"
+    return last_name if last_name is not None else ""
+
+
+def _serialize_base(user: Any, serialized: dict[str, Any]) -> None:
+    serialized["id"] = user.id
+    serialized["username"] = user.username
+    serialized["avatar"] = user.avatar
+    serialized["first_name"] = user.first_name
+    serialized["last_name"] = user.last_name
+    serialized["full_name"] = _get_full_name(user.first_name, user.last_name)
+    serialized["sex"] = int(user.sex)
+
+
+def _serialize_profile(user: Any, serialized: dict[str, Any]) -> None:
+    serialized["profile"] = {
+        "bio": user.profile_bio,
+        "website": user.profile_website,
+        "socials": {
+            "vk": user.profile_social_username_vk,
+            "tg": user.profile_social_username_tg,
+            "gh": user.profile_social_username_gh,
+        },
+        "privacy": {
+            "is_public": user.privacy_profile_public,
+            "auth_required": user.privacy_profile_require_auth,
+        },
+    }
+
+
+def _serialize_email(user: Any, serialized: dict[str, Any]) -> None:
+    serialized["email"] = user.email
+
+
+def _serialize_phone(user: Any, serialized: dict[str, Any]) -> None:
+    serialized["phone"] = user.phone_number
+
+
+def _serialize_optional(user: Any, serialized: dict[str, Any]) -> None:
+    time_online = user.time_online
+    serialized["time_created"] = time.mktime(user.time_created.timetuple())
+    serialized["time_online"] = (
+        time.mktime(time_online.timetuple()) if time_online else None
+    )
+    serialized["states"] = {"is_active": user.is_active, "is_vip": user.is_vip}
+
+
+def _serialize_optional_private(user: Any, serialized: dict[str, Any]) -> None:
+    _serialize_optional(user, serialized)
+    if user.is_admin:
+        serialized["states"]["is_admin"] = user.is_admin
+    serialized["states"]["is_confirmed"] = user.is_verified
+
+
+_BASE_COLUMNS = ("id", "username", "avatar", "first_name", "last_name", "sex")
+_PROFILE_COLUMNS = (
+    "profile_bio",
+    "profile_website",
+    "profile_social_username_vk",
+    "profile_social_username_tg",
+    "profile_social_username_gh",
+    "privacy_profile_public",
+    "privacy_profile_require_auth",
+)
+_OPTIONAL_COLUMNS = ("time_created", "time_online", "is_active", "is_vip")
+_OPTIONAL_PRIVATE_COLUMNS = _OPTIONAL_COLUMNS + ("is_admin", "is_verified")
+
+
+@lru_cache(maxsize=None)
+def get_user_serializer(
+    *,
+    include_email: bool = False,
+    include_optional_fields: bool = False,
+    include_private_fields: bool = False,
+    include_profile_fields: bool = False,
+    include_phone: bool = False,
+) -> UserSerializer:
+    """
+    Returns serializer for given flags, flags are evaluated only once when serializer is built.
+    """
+    sections: list[tuple[_Section, tuple[str, ...]]] = [
+        (_serialize_base, _BASE_COLUMNS)
+    ]
+    if include_profile_fields:
+        sections.append((_serialize_profile, _PROFILE_COLUMNS))
+    if include_private_fields and include_email:
+        sections.append((_serialize_email, ("email",)))
+    if include_private_fields and include_phone:
+        sections.append((_serialize_phone, ("phone_number",)))
+    if include_optional_fields and include_private_fields:
+        sections.append((_serialize_optional_private, _OPTIONAL_PRIVATE_COLUMNS))
+    elif include_optional_fields:
+        sections.append((_serialize_optional, _OPTIONAL_COLUMNS))
+    return UserSerializer(sections)
+
 
 def serialize(
     user: User,
@@ -20,50 +153,13 @@ def serialize(
     include_phone: bool = False,
 ) -> dict[str, Any]:
     """Returns dict object for API response with serialized user data."""
-    serialized: dict[str, Any] = {
-        "id": user.id,
-        "username": user.username,
-        "avatar": user.avatar,
-        "first_name": user.first_name,
-        "last_name": user.last_name,
-        "full_name": user.full_name,
-        "sex": int(user.sex),
-    }
-
-    if include_profile_fields:
-        serialized["profile"] = {
-            "bio": user.profile_bio,
-            "website": user.profile_website,
-            "socials": {
-                "vk": user.profile_social_username_vk,
-                "tg": user.profile_social_username_tg,
-                "gh": user.profile_social_username_gh,
-            },
-            "privacy": {
-                "is_public": user.privacy_profile_public,
-                "auth_required": user.privacy_profile_require_auth,
-            },
-        }
-
-    if include_private_fields:
-        if include_email:
-            serialized["email"] = user.email
-        if include_phone:
-            serialized["phone"] = user.phone_number
-
-    if include_optional_fields:
-        time_online = user.time_online
-        serialized["time_created"] = time.mktime(user.time_created.timetuple())
-        serialized["time_online"] = (
-            time.mktime(time_online.timetuple()) if time_online else None
-        )
-        serialized["states"] = {"is_active": user.is_active, "is_vip": user.is_vip}
-
-        if include_private_fields:
-            if user.is_admin:
-                serialized["states"]["is_admin"] = user.is_admin
-            serialized["states"]["is_confirmed"] = user.is_verified
-
+    serialized = get_user_serializer(
+        include_email=include_email,
+        include_optional_fields=include_optional_fields,
+        include_private_fields=include_private_fields,
+        include_profile_fields=include_profile_fields,
+        include_phone=include_phone,
+    )(user)
     return serialized if in_list else {"user": serialized}
 
 
@@ -78,7 +174,7 @@ def serialize_user_security(user: User) -> dict[str, Any]:
 
 
 def serialize_list(
-    users: list[User],
+    users: Iterable[Any],
     *,
     include_email: bool = False,
     include_optional_fields: bool = False,
@@ -86,22 +182,18 @@ def serialize_list(
     include_profile_fields: bool = False,
     include_phone: bool = False,
 ) -> dict[str, Any]:
-    """Returns dict object for API response with serialized users list data."""
-
-    return {
-        "users": [
-            serialize(
-                user,
-                in_list=True,
-                include_email=include_email,
-                include_optional_fields=include_optional_fields,
-                include_private_fields=include_private_fields,
-                include_profile_fields=include_profile_fields,
-                include_phone=include_phone,
-            )
-            for user in users
-        ]
-    }
+    """
+    Returns dict object for API response with serialized users list data.
+    Users may be models or rows selected with columns of the serializer (see `get_user_serializer`).
+    """
+    serializer = get_user_serializer(
+        include_email=include_email,
+        include_optional_fields=include_optional_fields,
+        include_private_fields=include_private_fields,
+        include_profile_fields=include_profile_fields,
+        include_phone=include_phone,
+    )
+    return {"users": serializer.serialize_list(users)}
 
 
 serialize_user = serialize
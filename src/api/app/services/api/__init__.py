@@ -6,7 +6,7 @@
     Used both for response and errors (as response or exception with exception handler).
 """
 
-from .response import api_success, api_error
+from .response import api_success, api_error, ApiResponse
 from .errors import ApiErrorException, ApiErrorCode
 from . import response, errors
 
@@ -15,6 +15,7 @@ __all__ = [
     "errors",
     "api_error",
     "api_success",
+    "ApiResponse",
     "ApiErrorCode",
     "ApiErrorException",
 ]
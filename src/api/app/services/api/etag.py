@@ -0,0 +1,48 @@
+"""
+    Weak ETags and conditional GET (`If-None-Match`) handling.
+
+    ETags are checked after request is authenticated and data is loaded,
+    so not modified response only saves serialization and response body.
+"""
+
+import hashlib
+from datetime import datetime
+
+from fastapi import Response, Request
+from app.database.models.user import User
+
+
+def get_user_etag(user: User, *scope: object) -> str:
+    """
+    Returns weak ETag of the serialized user, derived from user id, update time and scope
+    (e.g flags that changes serialized fields).
+    Online time is not included, as it is updated with every online flush,
+    so it may be stale in the responses validated by that (weak) ETag.
+    """
+    version = "-".join(map(str, (_get_timestamp(user.time_updated), *scope)))
+    digest = hashlib.blake2b(version.encode(), digest_size=8).hexdigest()
+    return f'W/"{user.id}-{digest}"'
+
+
+def is_not_modified(request: Request, etag: str | None) -> bool:
+    """
+    Returns True if request `If-None-Match` matches given ETag (weak comparison).
+    """
+    if_none_match = request.headers.get("If-None-Match")
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    etag = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+def not_modified_response(etag: str) -> Response:
+    """Returns 304 response without body."""
+    return Response(status_code=304, headers={"ETag": etag})
+
+
+def _get_timestamp(value: datetime | None) -> float:
+    return value.timestamp() if value else 0.0
@@ -2,6 +2,9 @@
     API response wrappers.
 """
 
+from typing import Any
+
+import orjson
 from pydantic import BaseModel
 from fastapi.responses import JSONResponse
 from app.__version__ import __version__
@@ -9,6 +12,24 @@ from app.__version__ import __version__
 from .errors import ApiErrorCode
 
 
+class ApiResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+    Pydantic models are serialized as is (with their fields), without converting whole content first.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, default=_serialize_default, option=orjson.OPT_NON_STR_KEYS
+        )
+
+
+def _serialize_default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.dict()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
 def api_error(
     api_code: ApiErrorCode,
     message: str = "",
@@ -21,7 +42,7 @@ def api_error(
     headers = headers or dict()
     code, status = api_code.value
 
-    return JSONResponse(
+    return ApiResponse(
         {
             "v": __version__,
             "error": {"message": message, "code": code, "status": status} | data,
@@ -33,6 +54,4 @@ def api_error(
 
 def api_success(data: dict | BaseModel) -> JSONResponse:
     """Returns API success response."""
-    if isinstance(data, BaseModel):
-        data = data.dict()
-    return JSONResponse({"v": __version__, "success": data}, status_code=200)
+    return ApiResponse({"v": __version__, "success": data}, status_code=200)
@@ -0,0 +1,11 @@
+"""
+    Caching services.
+
+    Provides per-worker caches backed by the shared Redis layer,
+    with invalidation broadcasted between workers.
+"""
+
+from .lru import LRUCache
+from .invalidation import on_startup, on_shutdown, broadcast_invalidation
+
+__all__ = ["LRUCache", "broadcast_invalidation", "on_startup", "on_shutdown"]
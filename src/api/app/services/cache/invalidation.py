@@ -0,0 +1,95 @@
+"""
+    Cache invalidation broadcast between workers.
+
+    Each worker holds own in-process caches, so invalidation is published
+    over Redis Pub/Sub and every worker (including publisher) evicts local entries.
+"""
+
+import json
+from typing import Iterable, Callable, Any
+
+from redis.client import PubSubWorkerThread
+from redis import RedisError
+from app.config import get_logger, get_cache_client
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+# Namespace -> handler that evicts given keys from the local cache.
+_handlers: dict[str, Callable[[list[str]], None]] = {}
+_subscriber: PubSubWorkerThread | None = None
+
+
+def register_invalidation_handler(
+    namespace: str, handler: Callable[[list[str]], None]
+) -> None:
+    """
+    Registers handler that will be called with list of keys to evict for given namespace.
+    """
+    _handlers[namespace] = handler
+
+
+def broadcast_invalidation(namespace: str, keys: Iterable[Any]) -> None:
+    """
+    Evicts keys from the local cache and broadcasts eviction to other workers.
+    """
+    keys = [str(key) for key in keys]
+    if not keys:
+        return
+
+    _invalidate_locally(namespace, keys)
+    try:
+        get_cache_client().publish(
+            INVALIDATION_CHANNEL, json.dumps({"namespace": namespace, "keys": keys})
+        )
+    except RedisError as e:
+        # Other workers will drop stale entries after local TTL.
+        get_logger().warning(
+            f"[cache] Failed to broadcast invalidation for `{namespace}`: {e}"
+        )
+
+
+def on_startup() -> None:
+    """
+    Subscribes to the invalidation channel in the background thread.
+    """
+    global _subscriber  # pylint: disable=global-statement
+    if _subscriber is not None:
+        return
+    try:
+        pubsub = get_cache_client().pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{INVALIDATION_CHANNEL: _on_message})
+        _subscriber = pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+    except RedisError as e:
+        get_logger().warning(
+            f"[cache] Unable to subscribe to invalidations, local caches will rely on TTL: {e}"
+        )
+
+
+def on_shutdown() -> None:
+    """
+    Stops invalidation subscriber thread.
+    """
+    global _subscriber  # pylint: disable=global-statement
+    if _subscriber is None:
+        return
+    _subscriber.stop()
+    _subscriber = None
+
+
+def _on_message(message: dict[str, Any]) -> None:
+    """
+    Handles invalidation message from the channel.
+    """
+    try:
+        data = json.loads(message["data"])
+        _invalidate_locally(data["namespace"], data["keys"])
+    except (ValueError, KeyError, TypeError):
+        get_logger().warning(f"[cache] Got malformed invalidation message: {message!r}")
+
+
+def _invalidate_locally(namespace: str, keys: list[str]) -> None:
+    """
+    Evicts keys from the local cache of the namespace (if registered).
+    """
+    if handler := _handlers.get(namespace):
+        handler(keys)
@@ -0,0 +1,65 @@
+"""
+    Per-worker (in-process) LRU cache with TTL.
+"""
+
+import time
+from typing import TypeVar, Hashable, Generic
+from threading import Lock
+from collections import OrderedDict
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Bounded least-recently-used cache where each entry expires after TTL.
+
+    Thread-safe, as synchronous dependencies are executed inside the thread pool.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """
+        :param maxsize: Maximal amount of entries, least recently used is evicted first.
+        :param ttl: Time-To-Live of the entry in seconds.
+        """
+        if maxsize <= 0:
+            raise ValueError("LRU cache maxsize must be positive integer!")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Returns entry by key or default if there is no entry or it is expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """Sets entry by key, evicting least recently used entries when full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        """Removes entry by key if it is present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
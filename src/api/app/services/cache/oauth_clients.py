@@ -0,0 +1,203 @@
+"""
+    Two-tier cache of the OAuth clients metadata for grant resolution and authorization.
+
+    Per-worker LRU with TTL in front of the shared Redis layer (same as sessions cache).
+    Missing clients are cached too (for shorter TTL), and secrets are stored only as digests.
+    Entries are invalidated (and broadcasted to other workers) when client is changed.
+"""
+
+import hmac
+import hashlib
+from typing import Iterable
+from functools import lru_cache
+from datetime import datetime
+from dataclasses import dataclass
+
+from redis import RedisError
+from app.database.models.oauth_client import OAuthClient
+from app.config import get_settings, get_logger, get_cache_client
+
+from .lru import LRUCache
+from .invalidation import register_invalidation_handler, broadcast_invalidation
+
+NAMESPACE = "oauth_clients"
+
+
+@dataclass(frozen=True)
+class CachedOAuthClient:
+    """
+    Snapshot of the OAuth client fields required for authorization and display.
+    Client that does not exist is cached with `exists` set to False.
+    """
+
+    id: int
+    exists: bool
+    owner_id: int = 0
+    secret_digest: str = ""
+    display_name: str = ""
+    display_avatar: str | None = None
+    is_active: bool = False
+    is_verified: bool = False
+    time_created: datetime | None = None
+
+    @classmethod
+    def from_model(cls, oauth_client: OAuthClient) -> "CachedOAuthClient":
+        """Returns snapshot of the database model."""
+        return cls(
+            id=oauth_client.id,  # type: ignore
+            exists=True,
+            owner_id=oauth_client.owner_id,  # type: ignore
+            secret_digest=get_secret_digest(oauth_client.secret),  # type: ignore
+            display_name=oauth_client.display_name,  # type: ignore
+            display_avatar=oauth_client.display_avatar,  # type: ignore
+            is_active=oauth_client.is_active,  # type: ignore
+            is_verified=oauth_client.is_verified,  # type: ignore
+            time_created=oauth_client.time_created,  # type: ignore
+        )
+
+    @classmethod
+    def from_mapping(
+        cls, client_id: int, fields: dict[str, str]
+    ) -> "CachedOAuthClient":
+        """Returns snapshot from the Redis hash fields."""
+        if fields["exists"] != "1":
+            return cls(id=client_id, exists=False)
+        return cls(
+            id=client_id,
+            exists=True,
+            owner_id=int(fields["owner_id"]),
+            secret_digest=fields["secret_digest"],
+            display_name=fields["display_name"],
+            display_avatar=fields["display_avatar"] or None,
+            is_active=fields["is_active"] == "1",
+            is_verified=fields["is_verified"] == "1",
+            time_created=datetime.fromisoformat(fields["time_created"])
+            if fields["time_created"]
+            else None,
+        )
+
+    def to_mapping(self) -> dict[str, str]:
+        """Returns fields for storing as Redis hash."""
+        if not self.exists:
+            return {"exists": "0"}
+        return {
+            "exists": "1",
+            "owner_id": str(self.owner_id),
+            "secret_digest": self.secret_digest,
+            "display_name": self.display_name,
+            "display_avatar": self.display_avatar or "",
+            "is_active": "1" if self.is_active else "0",
+            "is_verified": "1" if self.is_verified else "0",
+            # Stored as is (without timezone conversion), so serialized same as the model.
+            "time_created": self.time_created.isoformat() if self.time_created else "",
+        }
+
+    def check_secret(self, secret: str) -> bool:
+        """Returns True if given secret is secret of the client (compared in constant time)."""
+        return self.exists and hmac.compare_digest(
+            self.secret_digest, get_secret_digest(secret)
+        )
+
+
+def get_secret_digest(secret: str) -> str:
+    """Returns digest of the client secret, that is stored instead of the secret."""
+    return hashlib.sha256(secret.encode()).hexdigest()
+
+
+def get_cached_oauth_client(client_id: int) -> CachedOAuthClient | None:
+    """
+    Returns client from the local or Redis cache, or None if it is not cached.
+    """
+    if not get_settings().cache_oauth_clients_enabled:
+        return None
+
+    local_cache = _get_local_cache()
+    if (oauth_client := local_cache.get(client_id)) is not None:
+        return oauth_client
+
+    try:
+        fields = get_cache_client().hgetall(_get_key(client_id))
+    except RedisError as e:
+        get_logger().warning(f"[cache] Unable to query OAuth client from Redis: {e}")
+        return None
+    if not fields:
+        return None
+
+    try:
+        oauth_client = CachedOAuthClient.from_mapping(client_id, fields)
+    except (KeyError, ValueError):
+        # Entry stored by the older version, will be replaced by the caller.
+        return None
+    local_cache.set(client_id, oauth_client)
+    return oauth_client
+
+
+def cache_oauth_client(
+    client_id: int, oauth_client: OAuthClient | None
+) -> CachedOAuthClient:
+    """
+    Stores client (or its absence) in both cache tiers and returns its snapshot.
+    """
+    cached_oauth_client = (
+        CachedOAuthClient.from_model(oauth_client)
+        if oauth_client is not None
+        else CachedOAuthClient(id=client_id, exists=False)
+    )
+    settings = get_settings()
+    if not settings.cache_oauth_clients_enabled:
+        return cached_oauth_client
+
+    _get_local_cache().set(client_id, cached_oauth_client)
+    try:
+        key = _get_key(client_id)
+        pipeline = get_cache_client().pipeline()
+        pipeline.delete(key)
+        pipeline.hset(key, mapping=cached_oauth_client.to_mapping())
+        pipeline.expire(
+            key,
+            settings.cache_oauth_clients_ttl
+            if cached_oauth_client.exists
+            else settings.cache_oauth_clients_negative_ttl,
+        )
+        pipeline.execute()
+    except RedisError as e:
+        get_logger().warning(f"[cache] Unable to store OAuth client in Redis: {e}")
+    return cached_oauth_client
+
+
+def invalidate_oauth_clients(client_ids: Iterable[int]) -> None:
+    """
+    Drops clients from both cache tiers and broadcasts it to other workers.
+    Should be called after changes are committed.
+    """
+    client_ids = list(client_ids)
+    if not client_ids or not get_settings().cache_oauth_clients_enabled:
+        return
+
+    try:
+        get_cache_client().delete(*map(_get_key, client_ids))
+    except RedisError as e:
+        get_logger().warning(f"[cache] Unable to drop OAuth clients from Redis: {e}")
+    broadcast_invalidation(NAMESPACE, client_ids)
+
+
+@lru_cache(maxsize=1)
+def _get_local_cache() -> LRUCache[int, CachedOAuthClient]:
+    settings = get_settings()
+    return LRUCache(
+        maxsize=settings.cache_oauth_clients_local_maxsize,
+        ttl=settings.cache_oauth_clients_local_ttl,
+    )
+
+
+def _get_key(client_id: int) -> str:
+    return f"{NAMESPACE}:{client_id}"
+
+
+def _invalidate_local(keys: list[str]) -> None:
+    local_cache = _get_local_cache()
+    for key in keys:
+        local_cache.delete(int(key))
+
+
+register_invalidation_handler(NAMESPACE, _invalidate_local)
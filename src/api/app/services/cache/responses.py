@@ -0,0 +1,160 @@
+"""
+    Cache of the responses for read-heavy and mostly public API methods.
+
+    Response bodies are stored in Redis (hash per cached object, with field per variant, e.g auth state)
+    with per-route TTL, and in the per-worker LRU in front of it
+    (or only in the LRU, if in-memory backend is used).
+    Entries are invalidated explicitly when underlying row is changed.
+    ETag of the response is cached alongside, so conditional requests are answered from the cache.
+    Redis is queried in the worker threads, as the client is synchronous.
+"""
+
+import time
+from typing import Iterable, Any
+from functools import lru_cache
+
+import anyio
+from starlette.responses import Response
+from redis import RedisError
+from app.services import metrics
+from app.config import get_settings, get_logger, get_cache_client
+
+from .lru import LRUCache
+from .invalidation import register_invalidation_handler, broadcast_invalidation
+
+NAMESPACE = "responses"
+
+# Namespaces of the cached objects.
+USER_PROFILES = "user_profiles"
+OAUTH_CLIENTS = "oauth_clients"
+FEATURES = "features"
+
+
+async def get_cached_response(
+    namespace: str, key: Any, variant: str = ""
+) -> Response | None:
+    """
+    Returns cached response from the local or Redis cache, or None if it is not cached.
+    """
+    settings = get_settings()
+    if not settings.fastapi_cache_enable:
+        return None
+
+    cache_key = _get_key(namespace, key)
+    variants = _get_local_cache().get(cache_key) or {}
+    if (entry := variants.get(variant)) is not None and entry[0] > time.monotonic():
+        metrics.increment("response_cache_local_hits")
+        return _build_response(entry[1], entry[2])
+    if settings.fastapi_cache_use_inmemory_backend:
+        metrics.increment("response_cache_misses")
+        return None
+
+    try:
+        body, etag = await anyio.to_thread.run_sync(
+            get_cache_client().hmget, cache_key, variant, _get_etag_field(variant)
+        )
+    except RedisError as e:
+        get_logger().warning(f"[cache] Unable to query response from Redis: {e}")
+        return None
+    if body is None:
+        metrics.increment("response_cache_misses")
+        return None
+
+    metrics.increment("response_cache_redis_hits")
+    _set_local(cache_key, variant, body, etag, settings.fastapi_cache_local_ttl)
+    return _build_response(body, etag)
+
+
+async def cache_response(
+    namespace: str, key: Any, response: Response, ttl: int, variant: str = ""
+) -> Response:
+    """
+    Stores successful response (with its ETag) in both cache tiers for given TTL (seconds), and returns it.
+    """
+    settings = get_settings()
+    if not settings.fastapi_cache_enable or response.status_code != 200:
+        return response
+
+    cache_key = _get_key(namespace, key)
+    body = response.body.decode()
+    etag = response.headers.get("ETag")
+    if settings.fastapi_cache_use_inmemory_backend:
+        _set_local(cache_key, variant, body, etag, ttl)
+        return response
+
+    local_ttl = min(ttl, settings.fastapi_cache_local_ttl)
+    _set_local(cache_key, variant, body, etag, local_ttl)
+    try:
+        await anyio.to_thread.run_sync(_set_redis, cache_key, variant, body, etag, ttl)
+    except RedisError as e:
+        get_logger().warning(f"[cache] Unable to store response in Redis: {e}")
+    return response
+
+
+def invalidate_cached_responses(namespace: str, keys: Iterable[Any]) -> None:
+    """
+    Drops all variants of the responses from both cache tiers and broadcasts it to other workers.
+    Should be called after changes are committed.
+    """
+    cache_keys = [_get_key(namespace, key) for key in keys]
+    settings = get_settings()
+    if not cache_keys or not settings.fastapi_cache_enable:
+        return
+
+    if not settings.fastapi_cache_use_inmemory_backend:
+        try:
+            get_cache_client().delete(*cache_keys)
+        except RedisError as e:
+            get_logger().warning(f"[cache] Unable to drop responses from Redis: {e}")
+    broadcast_invalidation(NAMESPACE, cache_keys)
+
+
+@lru_cache(maxsize=1)
+def _get_local_cache() -> LRUCache[str, dict[str, tuple[float, str, str | None]]]:
+    # Entries expire with their variants TTL.
+    return LRUCache(
+        maxsize=get_settings().fastapi_cache_local_maxsize, ttl=float("inf")
+    )
+
+
+def _set_local(
+    cache_key: str, variant: str, body: str, etag: str | None, ttl: int
+) -> None:
+    local_cache = _get_local_cache()
+    # Copied, as variants may be read concurrently.
+    variants = dict(local_cache.get(cache_key) or {})
+    variants[variant] = (time.monotonic() + ttl, body, etag)
+    local_cache.set(cache_key, variants)
+
+
+def _set_redis(
+    cache_key: str, variant: str, body: str, etag: str | None, ttl: int
+) -> None:
+    pipeline = get_cache_client().pipeline()
+    pipeline.hset(cache_key, variant, body)
+    if etag:
+        pipeline.hset(cache_key, _get_etag_field(variant), etag)
+    pipeline.expire(cache_key, ttl)
+    pipeline.execute()
+
+
+def _build_response(body: str, etag: str | None) -> Response:
+    headers = {"ETag": etag} if etag else None
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _get_etag_field(variant: str) -> str:
+    return f"{variant}:etag"
+
+
+def _get_key(namespace: str, key: Any) -> str:
+    return f"{NAMESPACE}:{namespace}:{key}"
+
+
+def _invalidate_local(cache_keys: list[str]) -> None:
+    local_cache = _get_local_cache()
+    for cache_key in cache_keys:
+        local_cache.delete(cache_key)
+
+
+register_invalidation_handler(NAMESPACE, _invalidate_local)
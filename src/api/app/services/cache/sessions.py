@@ -0,0 +1,287 @@
+"""
+    Two-tier cache of the user sessions for the authentication hot path.
+
+    Per-worker LRU with TTL in front of the shared Redis layer,
+    database is queried only when session is missing in both tiers.
+    Entries are invalidated (and broadcasted to other workers) when session is deactivated,
+    and are not stored again for a while (tombstone), so entries loaded before invalidation
+    are not cached by concurrent requests.
+
+    Session secrets sign tokens, so they are stored in Redis only encrypted (AES-GCM)
+    with the configured key, and Redis layer is not used without it.
+"""
+
+import os
+import base64
+import hashlib
+from typing import Iterable, Any
+from functools import lru_cache
+from dataclasses import dataclass
+
+from redis import RedisError
+from jwt.algorithms import has_crypto
+from app.database.models.user_session import UserSession
+from app.config import get_settings, get_logger, get_cache_client
+
+from .lru import LRUCache
+from .invalidation import register_invalidation_handler, broadcast_invalidation
+
+NAMESPACE = "sessions"
+_NONCE_SIZE = 12
+# Stores entry (KEYS[1]) with TTL (ARGV[1]), unless session is invalidated (KEYS[2]).
+_STORE_SCRIPT = """if redis.call("EXISTS", KEYS[2]) == 1 then
+  return 0
+end
+for i = 2, #ARGV, 2 do
+  redis.call("HSET", KEYS[1], ARGV[i], ARGV[i + 1])
+end
+redis.call("EXPIRE", KEYS[1], ARGV[1])
+return 1"""
+
+
+@dataclass(frozen=True)
+class CachedUserSession:
+    """
+    Snapshot of the user session fields required for authentication.
+    Detached from the database, so should not be modified or added to the session.
+    """
+
+    id: int
+    owner_id: int
+    token_secret: str
+    ip_address: str
+    user_agent_id: int
+    user_agent: str
+    is_active: bool
+
+    @classmethod
+    def from_model(cls, session: UserSession, user_agent: str) -> "CachedUserSession":
+        """Returns snapshot of the database model with its user agent string."""
+        return cls(
+            id=session.id,  # type: ignore
+            owner_id=session.owner_id,  # type: ignore
+            token_secret=session.token_secret,  # type: ignore
+            ip_address=session.ip_address,  # type: ignore
+            user_agent_id=session.user_agent_id,  # type: ignore
+            user_agent=user_agent,
+            is_active=session.is_active,  # type: ignore
+        )
+
+    @classmethod
+    def from_mapping(cls, fields: dict[str, str], cipher: Any) -> "CachedUserSession":
+        """Returns snapshot from the Redis hash fields (with encrypted secret)."""
+        session_id = int(fields["id"])
+        return cls(
+            id=session_id,
+            owner_id=int(fields["owner_id"]),
+            token_secret=_decrypt_secret(cipher, session_id, fields["token_secret"]),
+            ip_address=fields["ip_address"],
+            user_agent_id=int(fields["user_agent_id"]),
+            user_agent=fields["user_agent"],
+            is_active=fields["is_active"] == "1",
+        )
+
+    def to_mapping(self, cipher: Any) -> dict[str, str]:
+        """Returns fields for storing as Redis hash (with encrypted secret)."""
+        return {
+            "id": str(self.id),
+            "owner_id": str(self.owner_id),
+            "token_secret": _encrypt_secret(cipher, self.id, self.token_secret),
+            "ip_address": self.ip_address,
+            "user_agent_id": str(self.user_agent_id),
+            "user_agent": self.user_agent,
+            "is_active": "1" if self.is_active else "0",
+        }
+
+
+def get_cached_session(session_id: int) -> CachedUserSession | None:
+    """
+    Returns session from the local or Redis cache, or None if it is not cached.
+    """
+    if not get_settings().cache_sessions_enabled:
+        return None
+
+    local_cache = _get_local_cache()
+    if (session := local_cache.get(session_id)) is not None:
+        return session
+    if (cipher := _get_cipher()) is None:
+        return None
+
+    try:
+        fields = get_cache_client().hgetall(_get_key(session_id))
+    except RedisError as e:
+        get_logger().warning(f"[cache] Unable to query session from Redis: {e}")
+        return None
+    if not fields:
+        return None
+
+    try:
+        session = CachedUserSession.from_mapping(fields, cipher)
+    except (KeyError, ValueError):
+        # Entry stored by the older version (or with other key), will be replaced by the caller.
+        return None
+    local_cache.set(session_id, session)
+    return session
+
+
+def get_cached_sessions(session_ids: Iterable[int]) -> dict[int, CachedUserSession]:
+    """
+    Returns sessions found in the local or Redis cache (queried with single pipeline), by their ids.
+    """
+    if not get_settings().cache_sessions_enabled:
+        return {}
+
+    local_cache = _get_local_cache()
+    sessions: dict[int, CachedUserSession] = {}
+    missing_session_ids = []
+    for session_id in session_ids:
+        if (session := local_cache.get(session_id)) is not None:
+            sessions[session_id] = session
+        else:
+            missing_session_ids.append(session_id)
+    if not missing_session_ids or (cipher := _get_cipher()) is None:
+        return sessions
+
+    try:
+        pipeline = get_cache_client().pipeline(transaction=False)
+        for session_id in missing_session_ids:
+            pipeline.hgetall(_get_key(session_id))
+        results = pipeline.execute()
+    except RedisError as e:
+        get_logger().warning(f"[cache] Unable to query sessions from Redis: {e}")
+        return sessions
+
+    for session_id, fields in zip(missing_session_ids, results):
+        if not fields:
+            continue
+        try:
+            session = CachedUserSession.from_mapping(fields, cipher)
+        except (KeyError, ValueError):
+            continue
+        local_cache.set(session_id, session)
+        sessions[session_id] = session
+    return sessions
+
+
+def cache_session(session: UserSession, user_agent: str) -> CachedUserSession:
+    """
+    Stores session (with its user agent string) in both cache tiers and returns its snapshot.
+    Session that is recently invalidated is not stored, as it may be loaded before invalidation.
+    """
+    cached_session = CachedUserSession.from_model(session, user_agent)
+    settings = get_settings()
+    if not settings.cache_sessions_enabled:
+        return cached_session
+    if _get_local_tombstones().get(cached_session.id) is not None:
+        return cached_session
+
+    _get_local_cache().set(cached_session.id, cached_session)
+    if (cipher := _get_cipher()) is None:
+        return cached_session
+    try:
+        fields = cached_session.to_mapping(cipher)
+        get_cache_client().eval(
+            _STORE_SCRIPT,
+            2,
+            _get_key(cached_session.id),
+            _get_tombstone_key(cached_session.id),
+            settings.cache_sessions_ttl,
+            *(item for field in fields.items() for item in field),
+        )
+    except RedisError as e:
+        get_logger().warning(f"[cache] Unable to store session in Redis: {e}")
+    return cached_session
+
+
+def invalidate_sessions(session_ids: Iterable[int]) -> None:
+    """
+    Drops sessions from both cache tiers and broadcasts it to other workers.
+    Should be called after changes are committed.
+    """
+    session_ids = list(session_ids)
+    settings = get_settings()
+    if not session_ids or not settings.cache_sessions_enabled:
+        return
+
+    try:
+        pipeline = get_cache_client().pipeline()
+        for session_id in session_ids:
+            pipeline.set(
+                _get_tombstone_key(session_id),
+                1,
+                ex=settings.cache_sessions_invalidation_ttl,
+            )
+        pipeline.delete(*map(_get_key, session_ids))
+        pipeline.execute()
+    except RedisError as e:
+        get_logger().warning(f"[cache] Unable to drop sessions from Redis: {e}")
+    broadcast_invalidation(NAMESPACE, session_ids)
+
+
+@lru_cache(maxsize=1)
+def _get_local_cache() -> LRUCache[int, CachedUserSession]:
+    settings = get_settings()
+    return LRUCache(
+        maxsize=settings.cache_sessions_local_maxsize,
+        ttl=settings.cache_sessions_local_ttl,
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_local_tombstones() -> LRUCache[int, bool]:
+    settings = get_settings()
+    return LRUCache(
+        maxsize=settings.cache_sessions_local_maxsize,
+        ttl=settings.cache_sessions_invalidation_ttl,
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_cipher() -> Any:
+    """Returns cipher for session secrets, or None if Redis layer should not be used."""
+    secret_key = get_settings().cache_sessions_secret_key
+    if not secret_key or not has_crypto:
+        return None
+    # pylint: disable=import-outside-toplevel
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+    return AESGCM(hashlib.sha256(secret_key.encode()).digest())
+
+
+def _encrypt_secret(cipher: Any, session_id: int, token_secret: str) -> str:
+    # Session id is authenticated, so encrypted secret is not usable for other sessions.
+    nonce = os.urandom(_NONCE_SIZE)
+    encrypted = cipher.encrypt(nonce, token_secret.encode(), str(session_id).encode())
+    return base64.b64encode(nonce + encrypted).decode()
+
+
+def _decrypt_secret(cipher: Any, session_id: int, encrypted_secret: str) -> str:
+    # pylint: disable=import-outside-toplevel
+    from cryptography.exceptions import InvalidTag
+
+    data = base64.b64decode(encrypted_secret)
+    try:
+        return cipher.decrypt(
+            data[:_NONCE_SIZE], data[_NONCE_SIZE:], str(session_id).encode()
+        ).decode()
+    except InvalidTag as e:
+        raise ValueError("Unable to decrypt session secret!") from e
+
+
+def _get_key(session_id: int) -> str:
+    return f"{NAMESPACE}:{session_id}"
+
+
+def _get_tombstone_key(session_id: int) -> str:
+    return f"{NAMESPACE}:{session_id}:invalidated"
+
+
+def _invalidate_local(keys: list[str]) -> None:
+    local_cache = _get_local_cache()
+    local_tombstones = _get_local_tombstones()
+    for key in keys:
+        local_cache.delete(int(key))
+        local_tombstones.set(int(key), True)
+
+
+register_invalidation_handler(NAMESPACE, _invalidate_local)
@@ -0,0 +1,33 @@
+"""
+    Per-worker intern map of the user agent strings to their ids.
+
+    User agents are never modified or deleted, so entries are not expiring
+    and are only evicted when map is full.
+"""
+
+from functools import lru_cache
+
+from app.config import get_settings
+
+from .lru import LRUCache
+
+
+def get_interned_user_agent_id(user_agent_string: str) -> int | None:
+    """
+    Returns id of the user agent by its string, or None if it is not interned.
+    """
+    return _get_local_cache().get(user_agent_string)
+
+
+def intern_user_agent(user_agent_string: str, user_agent_id: int) -> None:
+    """
+    Remembers id of the user agent by its string.
+    """
+    _get_local_cache().set(user_agent_string, user_agent_id)
+
+
+@lru_cache(maxsize=1)
+def _get_local_cache() -> LRUCache[str, int]:
+    return LRUCache(
+        maxsize=get_settings().cache_user_agents_local_maxsize, ttl=float("inf")
+    )
@@ -9,7 +9,8 @@
 """
 
 
-from typing import Callable
+import asyncio
+from typing import TypeVar, Callable, Awaitable
 from math import ceil
 
 import aioredis
@@ -18,7 +19,17 @@ from starlette.responses import Response
 from starlette.requests import Request
 from fastapi import HTTPException
 from app.services.request.get_from_request import get_client_host_from_request
-from app.config import get_settings
+from app.services import metrics
+from app.config import get_settings, get_logger
+
+from .scripts import SCRIPTS
+from .result import RateLimitResult
+from .local import LocalWindows, LocalRejections
+from .breaker import CircuitBreaker
+
+T = TypeVar("T")
+# Errors after which limiter falls back to the local limits.
+REDIS_ERRORS = (aioredis.exceptions.RedisError, OSError, asyncio.TimeoutError)
 
 
 async def default_identifier(request: Request):
@@ -55,24 +66,12 @@ async def default_callback(
 class FastAPILimiter:
     redis: aioredis.Redis = None
     prefix: str = None
-    lua_sha: str = None
+    lua_shas: dict[str, str] = None
     identifier: Callable = None
     callback: Callable = None
-    lua_script = """local key = KEYS[1]
-local limit = tonumber(ARGV[1])
-local expire_time = ARGV[2]
-local current = tonumber(redis.call('get', key) or "0")
-if current > 0 then
- if current + 1 > limit then
- return redis.call("PTTL",key)
- else
-        redis.call("INCR", key)
- return 0
- end
-else
-    redis.call("SET", key, 1,"px",expire_time)
- return 0
-end"""
+    local_rejections: LocalRejections = None
+    local_windows: LocalWindows = None
+    breaker: CircuitBreaker = None
 
     @classmethod
     async def init(
@@ -82,11 +81,102 @@ end"""
         identifier: Callable = default_identifier,
         callback: Callable = default_callback,
     ):
+        settings = get_settings()
         cls.redis = redis
         cls.prefix = prefix
         cls.identifier = identifier
         cls.callback = callback
-        cls.lua_sha = await redis.script_load(cls.lua_script)
+        cls.local_rejections = LocalRejections(settings.requests_limiter_local_maxsize)
+        cls.local_windows = LocalWindows(settings.requests_limiter_local_maxsize)
+        cls.breaker = CircuitBreaker(
+            failures=settings.requests_limiter_breaker_failures,
+            backoff=settings.requests_limiter_breaker_backoff,
+            backoff_max=settings.requests_limiter_breaker_backoff_max,
+        )
+        cls.lua_shas = {}
+        try:
+            await cls._call_redis(cls._load_scripts())
+        except REDIS_ERRORS as e:
+            # Scripts are loaded with the first call after Redis is available.
+            get_logger().warning(
+                f"Unable to load requests limiter scripts, using local limits! Error: {e!r}"
+            )
+
+    @classmethod
+    async def _load_scripts(cls) -> None:
+        for algorithm, script in SCRIPTS.items():
+            cls.lua_shas[algorithm] = await cls.redis.script_load(script)
+
+    @classmethod
+    async def _evalsha(cls, algorithm: str, keys: list[str], args: list[int]) -> list:
+        if algorithm not in cls.lua_shas:
+            await cls._load_scripts()
+        try:
+            return await cls.redis.evalsha(
+                cls.lua_shas[algorithm], len(keys), *keys, *args
+            )
+        except aioredis.exceptions.NoScriptError:
+            # Scripts are flushed (e.g Redis restarted).
+            await cls._load_scripts()
+            return await cls.redis.evalsha(
+                cls.lua_shas[algorithm], len(keys), *keys, *args
+            )
+
+    @classmethod
+    async def _call_redis(cls, awaitable: Awaitable[T]) -> T:
+        """
+        Awaits Redis call, recording result for the circuit breaker.
+        Calls are limited with the socket timeouts of the client,
+        so only connection that is timed out is dropped (as it may have unread reply).
+        """
+        try:
+            result = await awaitable
+        except REDIS_ERRORS:
+            cls.breaker.record_failure()
+            raise
+        cls.breaker.record_success()
+        return result
+
+    @classmethod
+    async def hit(
+        cls, keys: list[str], limits: list[tuple[int, int]], algorithm: str
+    ) -> RateLimitResult:
+        """
+        Counts request for all limits (times, milliseconds) with single script call.
+        Every admitted request is counted in Redis, only rejections are cached locally.
+        Falls back to per-worker windows while Redis is unavailable.
+        """
+        local_key = "|".join(keys)
+        result = cls.local_rejections.get(local_key)
+        if result is not None:
+            metrics.increment("limiter_local_rejections")
+            return result
+
+        if cls.breaker.is_open:
+            metrics.increment("limiter_fallback_hits")
+            return cls.local_windows.hit(keys, limits)
+        args = []
+        for times, milliseconds in limits:
+            args += [times, milliseconds]
+        try:
+            allowed, retry_after, index, remaining, reset = await cls._call_redis(
+                cls._evalsha(algorithm, keys, args)
+            )
+        except REDIS_ERRORS as e:
+            metrics.increment("limiter_redis_errors")
+            metrics.increment("limiter_fallback_hits")
+            get_logger().warning(
+                f"Requests limiter Redis call failed, using local limits! Error: {e!r}"
+            )
+            return cls.local_windows.hit(keys, limits)
+        metrics.increment("limiter_redis_hits")
+
+        limit = limits[index][0]
+        if not allowed:
+            # Rejected requests are not counted, so limit stays reached until retry time.
+            cls.local_rejections.reject(local_key, retry_after, limit)
+            return RateLimitResult(False, limit, 0, reset, retry_after)
+        return RateLimitResult(True, limit, remaining, reset, 0)
 
     @classmethod
     async def close(cls):
@@ -96,7 +186,11 @@ end"""
 async def on_startup():
     settings = get_settings()
     redis = await aioredis.from_url(
-        settings.cache_dsn, encoding=settings.cache_encoding, decode_responses=True
+        settings.cache_dsn,
+        encoding=settings.cache_encoding,
+        decode_responses=True,
+        socket_timeout=settings.requests_limiter_redis_timeout,
+        socket_connect_timeout=settings.requests_limiter_redis_timeout,
     )
 
     await FastAPILimiter.init(redis)
@@ -0,0 +1,57 @@
+"""
+    Circuit breaker for the requests limiter Redis calls.
+
+    After several failures in a row Redis is not called until backoff is over,
+    then single trial call is allowed, and backoff is doubled if it fails again.
+"""
+
+import time
+
+
+class CircuitBreaker:
+    """
+    Tracks failures of the calls and tells whether next call should be made.
+
+    Not thread-safe, as used only from the event loop.
+    """
+
+    def __init__(self, failures: int, backoff: float, backoff_max: float) -> None:
+        """
+        :param failures: Failures in a row after which circuit is opened.
+        :param backoff: Seconds to wait before first trial call.
+        :param backoff_max: Maximal seconds to wait before trial call.
+        """
+        self.failures = failures
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self._failures = 0
+        self._current_backoff = backoff
+        self._retry_at = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        """
+        Returns True if calls should not be made.
+        When backoff is over, only single trial call is allowed (until it is recorded),
+        as retry time is moved forward for the other calls.
+        """
+        if self._failures < self.failures:
+            return False
+        now = time.monotonic()
+        if now < self._retry_at:
+            return True
+        self._retry_at = now + self._current_backoff
+        return False
+
+    def record_success(self) -> None:
+        """Closes circuit and resets backoff."""
+        self._failures = 0
+        self._current_backoff = self.backoff
+
+    def record_failure(self) -> None:
+        """Opens circuit when failures threshold is reached, with doubled backoff on each trial."""
+        self._failures += 1
+        if self._failures < self.failures:
+            return
+        self._retry_at = time.monotonic() + self._current_backoff
+        self._current_backoff = min(self._current_backoff * 2, self.backoff_max)
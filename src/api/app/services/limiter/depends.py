@@ -1,12 +1,29 @@
 # pylint: disable=all
-from typing import Callable, Optional
+from typing import Optional, NamedTuple, Callable
+from math import ceil
 
 from pydantic import conint
+from starlette.routing import BaseRoute
 from starlette.requests import Request
 from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from app.config.environment.settings import RequestsLimiterAlgorithm
+from app.config import get_settings
 
+from .result import RateLimitResult
 from . import FastAPILimiter
 
+# Request state attribute with the most restrictive result of the checked limiters.
+RATE_LIMIT_STATE = "rate_limit"
+
+
+class RateLimit(NamedTuple):
+    """Additional limit of the limiter, checked within the same Redis call."""
+
+    times: int
+    milliseconds: int
+    identifier: Callable
+
 
 class RateLimiter:
     def __init__(
@@ -18,6 +35,8 @@ class RateLimiter:
         hours: conint(ge=-1) = 0,
         identifier: Optional[Callable] = None,
         callback: Optional[Callable] = None,
+        algorithm: Optional[RequestsLimiterAlgorithm] = None,
+        limits: tuple[RateLimit, ...] = (),
     ):
         self.times = times
         self.milliseconds = (
@@ -25,30 +44,79 @@ class RateLimiter:
         )
         self.identifier = identifier
         self.callback = callback
+        self.algorithm = algorithm
+        self.limits = limits
+        # Index of the limiter in the route dependencies, bound with `bind_rate_limiters`
+        # (limiters called with `check` are not route dependencies).
+        self.index = 0
+
+    async def get_key(self, request: Request) -> str:
+        # moved here because constructor run before app startup
+        identifier = self.identifier or FastAPILimiter.identifier
+        rate_key = await identifier(request)
+        return f"{FastAPILimiter.prefix}:{rate_key}:{self.index}"
+
+    async def get_keys(
+        self, request: Request, algorithm: RequestsLimiterAlgorithm
+    ) -> list[str]:
+        keys = [await self.get_key(request)]
+        for limit_index, limit in enumerate(self.limits, start=1):
+            rate_key = await limit.identifier(request)
+            keys.append(
+                f"{FastAPILimiter.prefix}:{rate_key}:{self.index}:{limit_index}"
+            )
+        if algorithm != RequestsLimiterAlgorithm.fixed_window:
+            # Algorithms store different values, so keys should not be shared.
+            keys = [f"{key}:{algorithm.value}" for key in keys]
+        return keys
 
     async def __call__(self, request: Request, response: Response):
         if not FastAPILimiter.redis:
             raise Exception(
                 "You must call FastAPILimiter.init in startup event of fastapi!"
             )
-        index = 0
-        for route in request.app.routes:
-            if route.path == request.scope["path"]:
-                for idx, dependency in enumerate(route.dependencies):
-                    if self is dependency.dependency:
-                        index = idx
-                        break
-        # moved here because constructor run before app startup
-        identifier = self.identifier or FastAPILimiter.identifier
         callback = self.callback or FastAPILimiter.callback
-        redis = FastAPILimiter.redis
-        rate_key = await identifier(request)
-        key = f"{FastAPILimiter.prefix}:{rate_key}:{index}"
-        pexpire = await redis.evalsha(
-            FastAPILimiter.lua_sha, 1, key, str(self.times), str(self.milliseconds)
-        )
-        if pexpire != 0:
-            return await callback(request, response, pexpire)
+        algorithm = self.algorithm or get_settings().requests_limiter_algorithm
+        keys = await self.get_keys(request, algorithm)
+        limits = [(self.times, self.milliseconds)]
+        limits += [(limit.times, limit.milliseconds) for limit in self.limits]
+        result = await FastAPILimiter.hit(keys, limits, algorithm.value)
+        store_rate_limit_result(request, result)
+        if not result.allowed:
+            return await callback(request, response, result.retry_after)
 
     async def check(self, request: Request, response: Response | None = None):
         return await self.__call__(request, response)
+
+
+def bind_rate_limiters(routes: list[BaseRoute]) -> None:
+    """
+    Binds index in the route dependencies to each route limiter,
+    so it is not searched for within all routes on every request.
+    """
+    for route in routes:
+        for index, dependency in enumerate(getattr(route, "dependencies", [])):
+            if isinstance(dependency.dependency, RateLimiter):
+                dependency.dependency.index = index
+
+
+def store_rate_limit_result(request: Request, result: RateLimitResult) -> None:
+    """
+    Stores result in the request state, if it is more restrictive than stored one
+    (rejected, or with less remaining requests), headers are set by the middleware.
+    """
+    stored_result = getattr(request.state, RATE_LIMIT_STATE, None)
+    if stored_result is None or (result.allowed, result.remaining) < (
+        stored_result.allowed,
+        stored_result.remaining,
+    ):
+        setattr(request.state, RATE_LIMIT_STATE, result)
+
+
+def set_rate_limit_headers(headers: MutableHeaders, result: RateLimitResult) -> None:
+    """
+    Sets `RateLimit-*` headers for the most restrictive limit (reset is in seconds).
+    """
+    headers["RateLimit-Limit"] = str(result.limit)
+    headers["RateLimit-Remaining"] = str(result.remaining)
+    headers["RateLimit-Reset"] = str(ceil(result.reset / 1000))
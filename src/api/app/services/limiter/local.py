@@ -0,0 +1,109 @@
+"""
+    Per-worker state of the requests limiter:
+    reached limits, and fallback windows while Redis is unavailable.
+
+    Every admitted request is counted in Redis, so limits are exact.
+    Rejected requests are not counted, so reached limit is cached by worker
+    until retry time and next requests of the same client are rejected without Redis call.
+"""
+
+import time
+from collections import OrderedDict
+
+from .result import RateLimitResult
+
+
+class LocalRejections:
+    """
+    Bounded map of the reached limits by limiter key.
+
+    Not thread-safe, as used only from the event loop.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        :param maxsize: Maximal amount of keys, least recently used is evicted first.
+        """
+        self.maxsize = maxsize
+        # Key -> (expires at, limit).
+        self._rejections: OrderedDict[str, tuple[float, int]] = OrderedDict()
+
+    def get(self, key: str) -> RateLimitResult | None:
+        """
+        Returns rejection result, or None if limit is not known to be reached.
+        """
+        rejection = self._rejections.get(key)
+        if rejection is None:
+            return None
+        expires_at, limit = rejection
+        now = time.monotonic()
+        if expires_at <= now:
+            del self._rejections[key]
+            return None
+        retry_after = max(1, int((expires_at - now) * 1000))
+        return RateLimitResult(False, limit, 0, retry_after, retry_after)
+
+    def reject(self, key: str, pexpire: int, limit: int = 0) -> None:
+        """
+        Stores reached limit until retry time (milliseconds).
+        """
+        if pexpire <= 0:
+            return
+        self._rejections[key] = (time.monotonic() + pexpire / 1000, limit)
+        self._rejections.move_to_end(key)
+        while len(self._rejections) > self.maxsize:
+            self._rejections.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all rejections."""
+        self._rejections.clear()
+
+
+class LocalWindows:
+    """
+    Bounded per-worker fixed windows, used while Redis is unavailable.
+
+    Each worker counts requests independently,
+    so the limit is multiplied by the amount of workers in that mode.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        :param maxsize: Maximal amount of keys, least recently used is evicted first.
+        """
+        self.maxsize = maxsize
+        # Key -> (requests count, expires at).
+        self._windows: OrderedDict[str, tuple[int, float]] = OrderedDict()
+
+    def hit(self, keys: list[str], limits: list[tuple[int, int]]) -> RateLimitResult:
+        """
+        Counts request for all limits (times, milliseconds), if every limit is passed.
+        """
+        now = time.monotonic()
+        windows = []
+        for key, (_, milliseconds) in zip(keys, limits):
+            count, expires_at = self._windows.get(key, (0, 0.0))
+            if expires_at <= now:
+                count, expires_at = 0, now + milliseconds / 1000
+            windows.append((count, expires_at))
+
+        blocked = [
+            (max(1, int((expires_at - now) * 1000)), times)
+            for (count, expires_at), (times, _) in zip(windows, limits)
+            if count >= times
+        ]
+        if blocked:
+            retry_after, times = max(blocked)
+            return RateLimitResult(False, times, 0, retry_after, retry_after)
+
+        result = None
+        for key, (count, expires_at), (times, _) in zip(keys, windows, limits):
+            self._windows[key] = (count + 1, expires_at)
+            self._windows.move_to_end(key)
+            remaining = times - count - 1
+            if result is None or remaining < result.remaining:
+                reset = max(1, int((expires_at - now) * 1000))
+                result = RateLimitResult(True, times, remaining, reset, 0)
+        while len(self._windows) > self.maxsize:
+            self._windows.popitem(last=False)
+        return result
@@ -0,0 +1,18 @@
+"""
+    Result of the request limits check.
+"""
+
+from typing import NamedTuple
+
+
+class RateLimitResult(NamedTuple):
+    """
+    Result for the most restrictive of checked limits,
+    times are in milliseconds (`retry_after` is zero when request is allowed).
+    """
+
+    allowed: bool
+    limit: int
+    remaining: int
+    reset: int
+    retry_after: int
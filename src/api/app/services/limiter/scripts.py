@@ -0,0 +1,114 @@
+"""
+    Lua scripts of the requests limiter algorithms.
+
+    Each script checks all limits in KEYS (with limit and window milliseconds in ARGV)
+    and counts request only when all are passed.
+    Returns 1 if request is allowed (0 if any limit is reached), milliseconds to retry after,
+    index of the most restrictive limit, its remaining quota and milliseconds until reset.
+"""
+
+# Fixed window counter.
+FIXED_WINDOW = """local currents = {}
+local allowed = true
+for i, key in ipairs(KEYS) do
+  currents[i] = tonumber(redis.call("GET", key) or "0")
+  if currents[i] >= tonumber(ARGV[i * 2 - 1]) then
+    allowed = false
+  end
+end
+if not allowed then
+  local index, retry_after = 1, 0
+  for i, key in ipairs(KEYS) do
+    if currents[i] >= tonumber(ARGV[i * 2 - 1]) then
+      local pttl = redis.call("PTTL", key)
+      if pttl > retry_after then
+        index, retry_after = i, pttl
+      end
+    end
+  end
+  return {0, retry_after, index - 1, 0, retry_after}
+end
+local index, remaining, reset = 1, nil, 0
+for i, key in ipairs(KEYS) do
+  if currents[i] > 0 then
+    redis.call("INCR", key)
+  else
+    redis.call("SET", key, 1, "PX", ARGV[i * 2])
+  end
+  local left = tonumber(ARGV[i * 2 - 1]) - currents[i] - 1
+  if remaining == nil or left < remaining then
+    index, remaining, reset = i, left, redis.call("PTTL", key)
+  end
+end
+return {1, 0, index - 1, remaining, reset}"""
+
+# Generic cell rate algorithm, stores theoretical arrival time (no bursts at window edges).
+GCRA = """local time = redis.call("TIME")
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local tats = {}
+local index, retry_after = 1, 0
+for i, key in ipairs(KEYS) do
+  local period = tonumber(ARGV[i * 2])
+  local interval = period / tonumber(ARGV[i * 2 - 1])
+  tats[i] = math.max(tonumber(redis.call("GET", key) or "0"), now) + interval
+  local wait = tats[i] - period - now
+  if wait > retry_after then
+    index, retry_after = i, wait
+  end
+end
+if retry_after > 0 then
+  retry_after = math.ceil(retry_after)
+  return {0, retry_after, index - 1, 0, retry_after}
+end
+local remaining, reset = nil, 0
+for i, key in ipairs(KEYS) do
+  local period = tonumber(ARGV[i * 2])
+  local interval = period / tonumber(ARGV[i * 2 - 1])
+  -- Fractional part is kept, as rounded arrival times add up and reject requests under the limit.
+  redis.call("SET", key, string.format("%.3f", tats[i]), "PX", math.ceil(tats[i] - now))
+  local left = math.floor((now - (tats[i] - period)) / interval)
+  if remaining == nil or left < remaining then
+    index, remaining, reset = i, left, math.ceil(tats[i] - now)
+  end
+end
+return {1, 0, index - 1, remaining, reset}"""
+
+# Sliding log of request times, exact but stores entry per request.
+SLIDING_LOG = """local time = redis.call("TIME")
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local counts = {}
+local index, retry_after = 1, 0
+for i, key in ipairs(KEYS) do
+  local limit = tonumber(ARGV[i * 2 - 1])
+  local period = tonumber(ARGV[i * 2])
+  redis.call("ZREMRANGEBYSCORE", key, "-inf", now - period)
+  counts[i] = redis.call("ZCARD", key)
+  if counts[i] >= limit then
+    local entry = redis.call("ZRANGE", key, counts[i] - limit, counts[i] - limit, "WITHSCORES")
+    local wait = tonumber(entry[2]) + period - now
+    if wait > retry_after then
+      index, retry_after = i, wait
+    end
+  end
+end
+if retry_after > 0 then
+  return {0, retry_after, index - 1, 0, retry_after}
+end
+local remaining, reset = nil, 0
+for i, key in ipairs(KEYS) do
+  local period = tonumber(ARGV[i * 2])
+  redis.call("ZADD", key, now, time[1] .. time[2] .. ":" .. counts[i])
+  redis.call("PEXPIRE", key, period)
+  local left = tonumber(ARGV[i * 2 - 1]) - counts[i] - 1
+  if remaining == nil or left < remaining then
+    local oldest = redis.call("ZRANGE", key, 0, 0, "WITHSCORES")
+    index, remaining, reset = i, left, tonumber(oldest[2]) + period - now
+  end
+end
+return {1, 0, index - 1, remaining, reset}"""
+
+SCRIPTS = {
+    "fixed_window": FIXED_WINDOW,
+    "gcra": GCRA,
+    "sliding_log": SLIDING_LOG,
+}
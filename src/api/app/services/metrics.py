@@ -0,0 +1,61 @@
+"""
+    In-process metrics registry.
+
+    Metrics are collected per worker and exposed with admin API method,
+    for watching saturation (e.g thread pools) without external tooling.
+"""
+
+from typing import Callable
+from threading import Lock
+
+_lock = Lock()
+_counters: dict[str, int] = {}
+# Name -> [count, total, max] of the observed values.
+_summaries: dict[str, list[float]] = {}
+# Name -> callable that returns current value.
+_gauges: dict[str, Callable[[], float]] = {}
+
+
+def increment(name: str, value: int = 1) -> None:
+    """
+    Increments counter by given value.
+    """
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+def observe(name: str, value: float) -> None:
+    """
+    Observes value for the summary (count, total, max).
+    """
+    with _lock:
+        summary = _summaries.setdefault(name, [0, 0.0, 0.0])
+        summary[0] += 1
+        summary[1] += value
+        summary[2] = max(summary[2], value)
+
+
+def register_gauge(name: str, getter: Callable[[], float]) -> None:
+    """
+    Registers gauge, which value is queried when metrics are collected.
+    """
+    _gauges[name] = getter
+
+
+def collect_metrics() -> dict[str, dict]:
+    """
+    Returns snapshot of all metrics.
+    """
+    with _lock:
+        counters = dict(_counters)
+        summaries = {
+            name: {
+                "count": int(count),
+                "total": total,
+                "max": maximum,
+                "avg": total / count if count else 0.0,
+            }
+            for name, (count, total, maximum) in _summaries.items()
+        }
+    gauges = {name: getter() for name, getter in _gauges.items()}
+    return {"counters": counters, "gauges": gauges, "summaries": summaries}
@@ -1,4 +1,13 @@
 from .grants import resolve_grant
-from .client import query_oauth_client
+from .client import (
+    query_oauth_client_metadata,
+    query_oauth_client,
+    get_oauth_client_metadata,
+)
 
-__all__ = ["resolve_grant", "query_oauth_client"]
+__all__ = [
+    "resolve_grant",
+    "query_oauth_client",
+    "query_oauth_client_metadata",
+    "get_oauth_client_metadata",
+]
@@ -2,6 +2,11 @@
     Service to work with oauth clients.
 """
 
+from app.services.cache.oauth_clients import (
+    get_cached_oauth_client,
+    cache_oauth_client,
+    CachedOAuthClient,
+)
 from app.services.api import ApiErrorException, ApiErrorCode
 from app.database.repositories import OAuthClientsRepository
 from app.database.models.oauth_client import OAuthClient
@@ -28,3 +33,29 @@ def query_oauth_client(
             "You are not owner of this OAuth client!",
         )
     return oauth_client
+
+
+def get_oauth_client_metadata(db: Session, client_id: int) -> CachedOAuthClient | None:
+    """
+    Returns active oauth client metadata (from the cache, or database caching result), or None.
+    Should be used for read-only access, as it is not database model.
+    """
+    oauth_client = get_cached_oauth_client(client_id)
+    if oauth_client is None:
+        oauth_client = cache_oauth_client(
+            client_id, OAuthClientsRepository(db).get_by_id(client_id)
+        )
+    return oauth_client if oauth_client.exists and oauth_client.is_active else None
+
+
+def query_oauth_client_metadata(db: Session, client_id: int) -> CachedOAuthClient:
+    """
+    Returns active oauth client metadata or raises API error if not found or inactive.
+    """
+    oauth_client = get_oauth_client_metadata(db, client_id)
+    if not oauth_client:
+        raise ApiErrorException(
+            ApiErrorCode.OAUTH_CLIENT_NOT_FOUND,
+            "OAuth client not found or deactivated!",
+        )
+    return oauth_client
@@ -0,0 +1,75 @@
+"""
+    Store of the OAuth authorization codes (Redis).
+
+    Codes are stored with TTL of the code token, and consumed atomically (`GETDEL`),
+    so each code may be resolved only once, without database writes or periodic truncation.
+"""
+
+import secrets
+from dataclasses import dataclass
+
+from redis import RedisError, Redis
+from app.services.api import ApiErrorException, ApiErrorCode
+from app.config import get_settings, get_logger, get_cache_client
+
+KEY_PREFIX = "oauth_codes"
+# Code ids are random (fits into JSON safe integer), collisions are retried.
+_CODE_ID_BITS = 53
+_CREATE_ATTEMPTS = 3
+
+
+@dataclass(frozen=True)
+class StoredOAuthCode:
+    """OAuth code issued for the user session and client."""
+
+    id: int
+    user_id: int
+    client_id: int
+    session_id: int
+
+
+class OAuthCodesStore:
+    """
+    OAuth codes store, with same interface as the former database repository.
+    """
+
+    def __init__(self, client: Redis | None = None) -> None:
+        self.client = client or get_cache_client()
+
+    def create(self, user_id: int, client_id: int, session_id: int) -> StoredOAuthCode:
+        """Creates new OAuth code that expires with the code token."""
+        pexpire = get_settings().security_oauth_code_tokens_ttl * 1000
+        value = f"{user_id}:{client_id}:{session_id}"
+        try:
+            for _ in range(_CREATE_ATTEMPTS):
+                code_id = secrets.randbits(_CODE_ID_BITS)
+                if self.client.set(_get_key(code_id), value, nx=True, px=pexpire):
+                    return StoredOAuthCode(code_id, user_id, client_id, session_id)
+        except RedisError as e:
+            get_logger().error(f"[oauth] Unable to store OAuth code: {e}")
+        raise ApiErrorException(
+            ApiErrorCode.API_INTERNAL_SERVER_ERROR,
+            "Unable to issue OAuth code, please try again later!",
+        )
+
+    def get_by_id(self, code_id: int) -> StoredOAuthCode | None:
+        """
+        Returns OAuth code by id and removes it (so code is single-use),
+        or None if code is expired, already used or not exists.
+        """
+        try:
+            value = self.client.getdel(_get_key(code_id))
+        except RedisError as e:
+            get_logger().error(f"[oauth] Unable to query OAuth code: {e}")
+            raise ApiErrorException(
+                ApiErrorCode.API_INTERNAL_SERVER_ERROR,
+                "Unable to resolve OAuth code, please try again later!",
+            ) from e
+        if value is None:
+            return None
+        user_id, client_id, session_id = map(int, value.split(":"))
+        return StoredOAuthCode(code_id, user_id, client_id, session_id)
+
+
+def _get_key(code_id: int) -> str:
+    return f"{KEY_PREFIX}:{code_id}"
@@ -1,15 +1,14 @@
 from app.services.tokens import OAuthCode
 from app.services.oauth.permissions import normalize_scope
+from app.services.oauth.codes import OAuthCodesStore
 from app.schemas.oauth import ResponseType, AllowClientModel
-from app.database.repositories import OAuthCodesRepository
 from app.database.models.user_session import UserSession
 from app.database.models.user import User
-from app.database.dependencies import Session
 from app.config import get_settings
 
 
 def oauth_authorization_code_flow(
-    model: AllowClientModel, db: Session, user: User, session: UserSession
+    model: AllowClientModel, user: User, session: UserSession
 ) -> dict:
     # Authorization code flow.
     # Gives code, that required to be decoded using OAuth resolve method at server-side using client secret value.
@@ -23,7 +22,7 @@ def oauth_authorization_code_flow(
     # as it should be resolved to access token with default TTL immediately at server.
     scope = normalize_scope(model.scope)
     time_to_live = settings.security_oauth_code_tokens_ttl
-    stored_code = OAuthCodesRepository(db).create(user.id, model.client_id, session.id)  # type: ignore
+    stored_code = OAuthCodesStore().create(user.id, model.client_id, session.id)  # type: ignore
     code = OAuthCode(
         settings.security_tokens_issuer,
         time_to_live,
@@ -32,7 +31,7 @@ def oauth_authorization_code_flow(
         scope,
         model.redirect_uri,
         model.client_id,
-        code_id=stored_code.id,  # type: ignore
+        code_id=stored_code.id,
     ).encode(
         key=session.token_secret  # type: ignore
     )
@@ -1,3 +1,4 @@
+from app.services.tokens.signing_keys import get_current_signing_key
 from app.services.tokens import AccessToken
 from app.services.oauth.permissions import (
     permissions_get_ttl,
@@ -37,7 +38,8 @@ def oauth_impicit_flow(
         session.id,  # type: ignore
         normalize_scope(model.scope),
     ).encode(
-        key=session.token_secret  # type: ignore
+        key=session.token_secret,  # type: ignore
+        signing_key=get_current_signing_key(),
     )
 
     # Constructing redirect URL with hash-link parameters.
@@ -6,6 +6,7 @@
 from dataclasses import dataclass
 
 from fastapi.responses import JSONResponse
+from app.services.tokens.signing_keys import get_current_signing_key
 from app.services.tokens import RefreshToken, OAuthCode, AccessToken
 from app.services.oauth.permissions import (
     permissions_get_ttl,
@@ -13,13 +14,13 @@ from app.services.oauth.permissions import (
     normalize_scope,
     Permission,
 )
+from app.services.oauth.codes import OAuthCodesStore
+from app.services.oauth.client import query_oauth_client_metadata
 from app.services.api import api_success, ApiErrorException, ApiErrorCode
 from app.schemas.oauth import ResolveGrantModel
 from app.database.repositories import (
     UsersRepository,
     UserSessionsRepository,
-    OAuthCodesRepository,
-    OAuthClientsRepository,
 )
 from app.database.models.user_session import UserSession
 from app.database.models.user import User
@@ -43,15 +44,8 @@ def _verify_oauth_client_secret(
     """
     Checks that oauth client is valid for that client secret.
     """
-    oauth_client = OAuthClientsRepository(db).get_by_id(client_id, is_active=True)
-
-    if not oauth_client:
-        raise ApiErrorException(
-            ApiErrorCode.OAUTH_CLIENT_NOT_FOUND,
-            "OAuth client not found or deactivated!",
-        )
-
-    if oauth_client.secret != client_secret:
+    oauth_client = query_oauth_client_metadata(db, client_id)
+    if not oauth_client.check_secret(client_secret):
         raise ApiErrorException(
             ApiErrorCode.OAUTH_CLIENT_SECRET_MISMATCH,
             "Invalid client secret! Please review secret, or generate new secret.",
@@ -111,21 +105,24 @@ def _decode_signed_code_token_with_session(
     return code_token, session
 
 
-def _verify_and_expire_oauth_code(db: Session, code_token: OAuthCode) -> None:
+def _verify_and_expire_oauth_code(code_token: OAuthCode, session: UserSession) -> None:
     """
-    Verifies and expires oauth code by query database code.
+    Verifies and expires oauth code by consuming stored code.
     """
-    oauth_code = OAuthCodesRepository(db).get_by_id(code_token.get_code_id())
+    oauth_code = OAuthCodesStore().get_by_id(code_token.get_code_id())
     if not oauth_code:
         raise ApiErrorException(
-            ApiErrorCode.AUTH_INVALID_TOKEN, "No additional information."
+            ApiErrorCode.AUTH_EXPIRED_TOKEN, "Code has been expired or already used!"
         )
-    if oauth_code.was_used:
+    client_id = code_token.get_client_id()  # pylint: disable=no-member
+    if (oauth_code.user_id, oauth_code.client_id, oauth_code.session_id) != (
+        code_token.get_subject(),
+        client_id,
+        session.id,
+    ):
         raise ApiErrorException(
-            ApiErrorCode.AUTH_EXPIRED_TOKEN, "Code has been expired or already used!"
+            ApiErrorCode.AUTH_INVALID_TOKEN, "No additional information."
         )
-    oauth_code.was_used = True  # type: ignore
-    db.commit()
 
 
 def _query_user_data_from_raw_code_token(
@@ -143,7 +140,7 @@ def _query_user_data_from_raw_code_token(
     _verify_oauth_params(code_token, redirect_uri, client_id)
     _verify_oauth_client_secret(db, client_id=client_id, client_secret=client_secret)
     user = _query_user_by_user_id(db, session, user_id=code_token.get_subject())
-    _verify_and_expire_oauth_code(db, code_token)
+    _verify_and_expire_oauth_code(code_token, session)
     return code_token, session, user
 
 
@@ -169,7 +166,8 @@ def encode_tokens_pair(
         session.id,  # type: ignore
         normalize_scope(code_token.get_scope()),  # pylint: disable=no-member
     ).encode(
-        key=session.token_secret  # type: ignore
+        key=session.token_secret,  # type: ignore
+        signing_key=get_current_signing_key(),
     )
     refresh_token = RefreshToken(
         settings.security_tokens_issuer,
@@ -3,6 +3,7 @@
 """
 
 from fastapi.responses import JSONResponse
+from app.services.tokens.signing_keys import get_current_signing_key
 from app.services.tokens import RefreshToken, AccessToken
 from app.services.oauth.permissions import (
     permissions_get_ttl,
@@ -10,13 +11,10 @@ from app.services.oauth.permissions import (
     normalize_scope,
     Permission,
 )
+from app.services.oauth.client import get_oauth_client_metadata
 from app.services.api import api_success, api_error, ApiErrorCode
 from app.schemas.oauth import ResolveGrantModel
-from app.database.repositories import (
-    UsersRepository,
-    UserSessionsRepository,
-    OAuthClientsRepository,
-)
+from app.database.repositories import UsersRepository, UserSessionsRepository
 from app.database.dependencies import Session
 from app.config import Settings
 
@@ -50,7 +48,7 @@ def oauth_refresh_token_grant(
             "Given refresh token was obtained with different client!",
         )
 
-    oauth_client = OAuthClientsRepository(db).get_by_id(model.client_id, is_active=True)
+    oauth_client = get_oauth_client_metadata(db, model.client_id)
 
     if not oauth_client:
         return api_error(
@@ -58,7 +56,7 @@ def oauth_refresh_token_grant(
             "OAuth client not found, deactivated!",
         )
 
-    if oauth_client.secret != model.client_secret:
+    if not oauth_client.check_secret(model.client_secret):
         return api_error(
             ApiErrorCode.OAUTH_CLIENT_SECRET_MISMATCH,
             "Invalid client_secret! Please review secret, or generate new secret.",
@@ -92,7 +90,7 @@ def oauth_refresh_token_grant(
         user.id,
         session.id,
         normalize_scope(refresh_token_signed.get_scope()),  # pylint: disable=no-member
-    ).encode(key=session.token_secret)
+    ).encode(key=session.token_secret, signing_key=get_current_signing_key())
     refresh_token = RefreshToken(
         settings.security_tokens_issuer,
         settings.security_refresh_tokens_ttl,
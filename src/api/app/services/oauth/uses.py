@@ -0,0 +1,180 @@
+"""
+    OAuth client uses write-behind buffer.
+
+    Uses are appended to the Redis stream on authorization, and inserted into the database
+    by the worker in batches (multi-row insert with counters update in single transaction),
+    so authorization is not turned into additional write transaction.
+    Stream is consumed with consumer group, so uses of failed batch are claimed and retried,
+    and uses that are failed too many times are moved to the dead letter stream.
+    Delivery is at-least-once: if batch is inserted, but not acknowledged (Redis failure),
+    it is inserted again, so counters may be slightly overestimated in that case.
+"""
+
+import os
+import time
+import socket
+from datetime import datetime, timezone
+
+from sqlalchemy.orm import Session
+from redis import ResponseError, RedisError, Redis
+from app.database.repositories import OAuthClientUseRepository
+from app.config import get_settings, get_logger, get_cache_client
+
+USES_STREAM_KEY = "oauth_client_uses:pending"
+USES_STREAM_GROUP = "oauth_client_uses"
+USES_DEAD_LETTER_STREAM_KEY = "oauth_client_uses:dead"
+# Uses that are pending (read, but not inserted) longer than that (ms) are claimed again.
+_CLAIM_MIN_IDLE_TIME = 60_000
+# Until that time (monotonic) uses are inserted directly, as buffer is too long.
+_backpressure_until = 0.0
+
+
+def record_oauth_client_use(db: Session, user_id: int, client_id: int) -> None:
+    """
+    Records use of the OAuth client by the user.
+    Falls back to the direct database insert when buffer is disabled, unavailable or too long.
+    """
+    global _backpressure_until  # pylint: disable=global-statement
+    settings = get_settings()
+    if settings.auth_oauth_client_uses_buffer_enabled and (
+        _backpressure_until <= time.monotonic()
+    ):
+        try:
+            pipeline = get_cache_client().pipeline(transaction=False)
+            pipeline.xadd(
+                USES_STREAM_KEY,
+                {"user_id": user_id, "client_id": client_id, "time": time.time()},
+            )
+            pipeline.xlen(USES_STREAM_KEY)
+            _, length = pipeline.execute()
+            if length > settings.auth_oauth_client_uses_buffer_max_length:
+                get_logger().warning(
+                    f"[oauth] OAuth client uses buffer is too long ({length}), inserting directly."
+                )
+                _backpressure_until = (
+                    time.monotonic() + settings.auth_oauth_client_uses_flush_interval
+                )
+            return
+        except RedisError as e:
+            get_logger().warning(
+                f"[oauth] Unable to buffer OAuth client use, inserting directly: {e}"
+            )
+
+    OAuthClientUseRepository(db).create(user_id, client_id)
+
+
+def flush_oauth_client_uses(db: Session) -> int:
+    """
+    Flushes buffered uses into the database in batches, until buffer is empty.
+    Returns amount of inserted uses.
+    """
+    client = get_cache_client()
+    settings = get_settings()
+    batch_size = settings.auth_oauth_client_uses_batch_size
+    consumer = f"{socket.gethostname()}:{os.getpid()}"
+    _create_group(client)
+
+    # Uses of the failed (or crashed) consumers are retried first.
+    entries = client.xautoclaim(
+        USES_STREAM_KEY,
+        USES_STREAM_GROUP,
+        consumer,
+        min_idle_time=_CLAIM_MIN_IDLE_TIME,
+        count=batch_size,
+    )[1]
+    entries = _move_dead_letters(
+        client, entries, settings.auth_oauth_client_uses_max_deliveries
+    )
+    inserted_uses = 0
+    while True:
+        if not entries:
+            streams = client.xreadgroup(
+                USES_STREAM_GROUP, consumer, {USES_STREAM_KEY: ">"}, count=batch_size
+            )
+            entries = streams[0][1] if streams else []
+        if not entries:
+            return inserted_uses
+
+        uses = []
+        malformed_entries = []
+        for entry_id, fields in entries:
+            if not fields:
+                continue  # Entry may be deleted while pending.
+            try:
+                uses.append(_parse_use(fields))
+            except (KeyError, ValueError):
+                malformed_entries.append((entry_id, fields))
+        _add_dead_letters(client, malformed_entries)
+        OAuthClientUseRepository(db).create_many(uses)
+        entry_ids = [entry_id for entry_id, _ in entries]
+        pipeline = client.pipeline(transaction=True)
+        pipeline.xack(USES_STREAM_KEY, USES_STREAM_GROUP, *entry_ids)
+        pipeline.xdel(USES_STREAM_KEY, *entry_ids)
+        pipeline.execute()
+        inserted_uses += len(uses)
+        entries = []
+
+
+def _parse_use(fields: dict[str, str]) -> tuple[int, int, datetime]:
+    """Returns use (user id, client id, time) from the stream entry fields."""
+    return (
+        int(fields["user_id"]),
+        int(fields["client_id"]),
+        datetime.fromtimestamp(float(fields["time"]), tz=timezone.utc),
+    )
+
+
+def _move_dead_letters(
+    client: Redis, entries: list[tuple[str, dict[str, str]]], max_deliveries: int
+) -> list[tuple[str, dict[str, str]]]:
+    """
+    Moves claimed entries that are failed to insert given times
+    to the dead letter stream, so single failing use is not retried forever.
+    Returns entries that should be retried.
+    """
+    if not entries:
+        return entries
+    # Entries without delivery count (not reported by some Redis implementations) are retried.
+    deliveries = {
+        pending["message_id"]: pending.get("times_delivered", 0)
+        for pending in client.xpending_range(
+            USES_STREAM_KEY,
+            USES_STREAM_GROUP,
+            min=entries[0][0],
+            max=entries[-1][0],
+            count=len(entries),
+        )
+    }
+    # Claim is counted as delivery too.
+    dead_entries = [
+        entry for entry in entries if deliveries.get(entry[0], 0) > max_deliveries
+    ]
+    _add_dead_letters(client, dead_entries)
+    dead_entry_ids = {entry_id for entry_id, _ in dead_entries}
+    return [entry for entry in entries if entry[0] not in dead_entry_ids]
+
+
+def _add_dead_letters(client: Redis, entries: list[tuple[str, dict[str, str]]]) -> None:
+    """Moves entries from the uses stream to the dead letter stream."""
+    if not entries:
+        return
+    get_logger().error(
+        f"[oauth] Moving {len(entries)} failed OAuth client uses to the dead letter stream."
+    )
+    entry_ids = [entry_id for entry_id, _ in entries]
+    pipeline = client.pipeline(transaction=True)
+    for _, fields in entries:
+        if fields:
+            pipeline.xadd(USES_DEAD_LETTER_STREAM_KEY, fields)
+    pipeline.xack(USES_STREAM_KEY, USES_STREAM_GROUP, *entry_ids)
+    pipeline.xdel(USES_STREAM_KEY, *entry_ids)
+    pipeline.execute()
+
+
+def _create_group(client: Redis) -> None:
+    """Creates consumer group (with the stream) if it is not exists."""
+    try:
+        client.xgroup_create(USES_STREAM_KEY, USES_STREAM_GROUP, id="0", mkstream=True)
+    except ResponseError as e:
+        if "BUSYGROUP" not in str(e):
+            raise
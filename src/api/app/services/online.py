@@ -0,0 +1,91 @@
+"""
+    Online presence write-behind buffer.
+
+    Last-seen time of the users is buffered in the Redis hash (coalesced per user)
+    and periodically flushed into the database by the worker with single bulk update,
+    so authenticated requests are not turned into write transactions.
+"""
+
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+from redis import RedisError
+from app.services.cache import LRUCache
+from app.database.repositories import UsersRepository
+from app.database.models.user import User
+from app.config import get_settings, get_logger, get_cache_client
+
+ONLINE_BUFFER_KEY = "online:pending"
+# Users recorded by this worker within granularity, to not hit Redis on each request.
+_RECENTLY_RECORDED_MAXSIZE = 10_000
+
+
+def record_user_online(user: User, db: Session) -> None:
+    """
+    Records that user is online now.
+    Changes smaller than configured granularity are skipped.
+    Falls back to the direct database update when buffer is disabled or unavailable.
+    """
+    settings = get_settings()
+    now = time.time()
+    if user.time_online and (
+        now - user.time_online.timestamp() < settings.auth_online_granularity
+    ):
+        return
+
+    recently_recorded = _get_recently_recorded()
+    if recently_recorded.get(user.id) is not None:
+        return
+
+    if settings.auth_online_buffer_enabled:
+        try:
+            get_cache_client().hset(ONLINE_BUFFER_KEY, str(user.id), str(now))
+            recently_recorded.set(user.id, now)  # type: ignore
+            return
+        except RedisError as e:
+            get_logger().warning(
+                f"[online] Unable to buffer online time, updating directly: {e}"
+            )
+
+    user.time_online = datetime.fromtimestamp(now, tz=timezone.utc)  # type: ignore
+    db.commit()
+
+
+def flush_online_buffer(db: Session) -> int:
+    """
+    Flushes buffered online times into the database.
+    Returns amount of updated users.
+    """
+    client = get_cache_client()
+    pipeline = client.pipeline(transaction=True)
+    pipeline.hgetall(ONLINE_BUFFER_KEY)
+    pipeline.delete(ONLINE_BUFFER_KEY)
+    pending, _ = pipeline.execute()
+    if not pending:
+        return 0
+
+    times_online = {
+        int(user_id): datetime.fromtimestamp(float(timestamp), tz=timezone.utc)
+        for user_id, timestamp in pending.items()
+    }
+    try:
+        return UsersRepository(db).bulk_update_time_online(times_online)
+    except SQLAlchemyError:
+        # Put times back into the buffer (unless newer is already recorded),
+        # so they will be flushed next time.
+        pipeline = client.pipeline(transaction=False)
+        for user_id, timestamp in pending.items():
+            pipeline.hsetnx(ONLINE_BUFFER_KEY, user_id, timestamp)
+        pipeline.execute()
+        raise
+
+
+@lru_cache(maxsize=1)
+def _get_recently_recorded() -> LRUCache[int, float]:
+    return LRUCache(
+        maxsize=_RECENTLY_RECORDED_MAXSIZE,
+        ttl=get_settings().auth_online_granularity,
+    )
@@ -1,8 +1,28 @@
 """
     Password service for hashing and validating passwords.
+
+    Hashing is CPU bound (scrypt), so asynchronous API executes it in the process pool,
+    without blocking event loop (and other requests) of the worker.
 """
 import os
+import multiprocessing
+import hmac
 import hashlib
+import base64
+import asyncio
+from typing import TypeVar, Callable, Any
+from functools import partial, lru_cache
+from concurrent.futures.process import BrokenProcessPool
+from concurrent.futures import ProcessPoolExecutor
+
+import anyio
+from app.config import get_settings
+
+T = TypeVar("T")
+
+# Hash method for new passwords, passwords hashed with older methods
+# (or older parameters) are re-hashed on successful signin.
+LATEST_HASH_METHOD = 2
 
 
 class HashingError(Exception):
@@ -16,7 +36,9 @@ def get_hashed_password(password: str, *, hash_method: int | None = 0) -> str:
 
     if hash_method == 0 or hash_method is None:
         return _hash_method_hash_0_sha256(password)
-    return _hash_method_hash_1_scrypt(password, do_verification=True)
+    if hash_method == 1:
+        return _hash_method_hash_1_scrypt(password)
+    return _hash_method_hash_2_scrypt(password)
 
 
 def check_password(
@@ -28,7 +50,79 @@ def check_password(
 
     if hash_method == 0 or hash_method is None:
         return _hash_method_verify_0_sha256(password, hashed_password)
-    return _hash_method_verify_1_scrypt(password, hashed_password)
+    if hash_method == 1:
+        return _hash_method_verify_1_scrypt(password, hashed_password)
+    return _hash_method_verify_2_scrypt(password, hashed_password)
+
+
+def password_needs_rehash(hashed_password: str, *, hash_method: int | None) -> bool:
+    """Returns is password hashed with outdated method or parameters."""
+    if hash_method != LATEST_HASH_METHOD:
+        return True
+    if (parsed_hash := _parse_hash_2_scrypt(hashed_password)) is None:
+        return True
+    return parsed_hash[:3] != _get_scrypt_parameters()
+
+
+async def get_hashed_password_async(
+    password: str, *, hash_method: int | None = 0
+) -> str:
+    """Returns hashed password, hashing in the process pool."""
+    if hash_method == 0 or hash_method is None:
+        # Not worth sending to another process.
+        return get_hashed_password(password, hash_method=hash_method)
+    return await _run_in_process_pool(
+        get_hashed_password, password, hash_method=hash_method
+    )
+
+
+async def check_password_async(
+    password: str, hashed_password: str, *, hash_method: int | None = 0
+) -> bool:
+    """Returns is password and hashed one is same, hashing in the process pool."""
+    if hash_method == 0 or hash_method is None:
+        # Not worth sending to another process.
+        return check_password(password, hashed_password, hash_method=hash_method)
+    return await _run_in_process_pool(
+        check_password, password, hashed_password, hash_method=hash_method
+    )
+
+
+def on_shutdown() -> None:
+    """
+    Shutdowns hashing process pool (if it was started).
+    """
+    if _get_process_pool.cache_info().currsize == 0:
+        return
+    _get_process_pool().shutdown(wait=False, cancel_futures=True)
+    _get_process_pool.cache_clear()
+
+
+async def _run_in_process_pool(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Runs function in the hashing process pool,
+    or in the thread pool if process pool is disabled (size is zero).
+    """
+    call = partial(func, *args, **kwargs)
+    if get_settings().security_password_hashing_processes <= 0:
+        return await anyio.to_thread.run_sync(call)
+
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(_get_process_pool(), call)
+    except BrokenProcessPool:
+        # Hashing process was killed (e.g OOM), start new pool once.
+        _get_process_pool.cache_clear()
+        return await loop.run_in_executor(_get_process_pool(), call)
+
+
+@lru_cache(maxsize=1)
+def _get_process_pool() -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=get_settings().security_password_hashing_processes,
+        # Forking threaded (and having event loop) process is not safe.
+        mp_context=multiprocessing.get_context("spawn"),
+    )
 
 
 def _hash_method_hash_0_sha256(password: str) -> str:
@@ -45,25 +139,11 @@ def _hash_method_verify_0_sha256(password: str, hashed_password: str) -> bool:
     return _hash_method_hash_0_sha256(password) == hashed_password
 
 
-def _hash_method_hash_1_scrypt(password: str, do_verification: bool = True) -> str:
+def _hash_method_hash_1_scrypt(password: str) -> str:
     """
     Hashes given password with random salt.
     """
-
-    if not do_verification:
-        return _hash_internal_with_scrypt(password, _generate_encoded_urandom_salt())
-
-    for _ in range(50):
-        hashed_password = _hash_internal_with_scrypt(
-            password, _generate_encoded_urandom_salt()
-        )
-
-        if check_password(password, hashed_password, hash_method=1):
-            return hashed_password
-
-    raise HashingError(
-        "Failed to hash password, due to reaching limit for re-hashing and can`t get valid hash for the given password!"
-    )
+    return _hash_internal_with_scrypt(password, _generate_encoded_urandom_salt())
 
 
 def _hash_method_verify_1_scrypt(password: str, hashed_password: str):
@@ -100,11 +180,93 @@ def _hash_internal_with_scrypt(password: str, salt: str | None = None) -> str:
     return f"_1_scrypt\\u{salt}\\u{_hash_with_scrypt(password, salt)}"
 
 
+def _hash_method_hash_2_scrypt(password: str) -> str:
+    """
+    Hashes given password with random salt, using current scrypt parameters.
+    Hashed password encodes its parameters as `$scrypt$n=N,r=R,p=P$salt$hash` (base64).
+    """
+    n, r, p = _get_scrypt_parameters()
+    salt = os.urandom(16)
+    digest = _scrypt(password, salt, n=n, r=r, p=p)
+    return f"$scrypt$n={n},r={r},p={p}${_b64encode(salt)}${_b64encode(digest)}"
+
+
+def _hash_method_verify_2_scrypt(password: str, hashed_password: str) -> bool:
+    """
+    Returns is given password is same with given hashed password (with parameters from hash).
+    """
+    if (parsed_hash := _parse_hash_2_scrypt(hashed_password)) is None:
+        return False
+    n, r, p, salt, digest = parsed_hash
+    return hmac.compare_digest(
+        _scrypt(password, salt, n=n, r=r, p=p, dklen=len(digest)), digest
+    )
+
+
+def _parse_hash_2_scrypt(
+    hashed_password: str,
+) -> tuple[int, int, int, bytes, bytes] | None:
+    """
+    Returns parameters, salt and digest from the hashed password, or None if it is malformed.
+    """
+    try:
+        _, htype, parameters, salt, digest = hashed_password.split("$")
+        if htype != "scrypt":
+            return None
+        n, r, p = (
+            int(value)
+            for _, value in (
+                parameter.split("=") for parameter in parameters.split(",")
+            )
+        )
+        return n, r, p, _b64decode(salt), _b64decode(digest)
+    except ValueError:
+        return None
+
+
+def _get_scrypt_parameters() -> tuple[int, int, int]:
+    settings = get_settings()
+    return (
+        settings.security_password_scrypt_n,
+        settings.security_password_scrypt_r,
+        settings.security_password_scrypt_p,
+    )
+
+
+def _scrypt(
+    password: str, salt: bytes, *, n: int, r: int, p: int, dklen: int = 64
+) -> bytes:
+    """
+    Returns scrypt digest, allowing memory required by given parameters.
+    """
+    return hashlib.scrypt(
+        password.encode(),
+        salt=salt,
+        n=n,
+        r=r,
+        p=p,
+        dklen=dklen,
+        maxmem=256 * r * (n + p + 2),
+    )
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii").rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.b64decode(data + "=" * (-len(data) % 4), validate=True)
+
+
 def _generate_encoded_urandom_salt() -> str:
     """
     Returns encoded (as string) salt for hashing for urandom within bytes range.
+    Salt never contains separator of the hashed password parts,
+    so hash is always verifiable and there is no need to verify it after hashing.
     """
-    return os.urandom(16).decode("latin-1")
+    while "\\u" in (salt := os.urandom(16).decode("latin-1")):
+        continue
+    return salt
 
 
 def _hash_with_scrypt(
@@ -5,21 +5,57 @@
 """
 
 from typing import Type, NoReturn
-from datetime import datetime
 
 from sqlalchemy.orm import Session
 from fastapi.requests import Request
 from fastapi import Depends
+from app.services.tokens.signing_keys import get_signing_key
+from app.services.tokens.exceptions import (
+    TokenWrongTypeError,
+    TokenInvalidSignatureError,
+    TokenInvalidError,
+    TokenExpiredError,
+)
 from app.services.tokens import SessionToken, BaseToken, AccessToken
 from app.services.request.session_check_client import session_check_client_by_request
 from app.services.request.auth_data import AuthData
+from app.services.online import record_user_online
 from app.services.oauth.permissions import parse_permissions_from_scope, Permission
+from app.services.cache.sessions import (
+    get_cached_sessions,
+    get_cached_session,
+    cache_session,
+    CachedUserSession,
+)
 from app.services.api import ApiErrorException, ApiErrorCode
+from app.database.threadpool import run_in_database_threadpool
 from app.database.repositories import UsersRepository, UserSessionsRepository
-from app.database.models.user_session import UserSession
+from app.database.models.user import User
 from app.config import get_logger
 
 
+# Token exceptions -> API error, for the errors returned (not raised) by batch queries.
+_TOKEN_API_ERRORS: dict[type[Exception], tuple[ApiErrorCode, str]] = {
+    TokenWrongTypeError: (
+        ApiErrorCode.AUTH_INVALID_TOKEN,
+        "Token has wrong type! Please read documentation.",
+    ),
+    TokenExpiredError: (
+        ApiErrorCode.AUTH_EXPIRED_TOKEN,
+        "Token has been expired or revoked! Please get new fresh token.",
+    ),
+    TokenInvalidSignatureError: (
+        ApiErrorCode.AUTH_INVALID_TOKEN,
+        "Token has invalid signature! Server is unable to verify that token signed by himself.",
+    ),
+    TokenInvalidError: (
+        ApiErrorCode.AUTH_INVALID_TOKEN,
+        "Token invalid! No additonal information.",
+    ),
+}
+_TOKEN_EXCEPTIONS = tuple(_TOKEN_API_ERRORS)
+
+
 class AuthDataDependency:
     """
     FastAPI dependency to query auth data.
@@ -44,8 +80,11 @@ class AuthDataDependency:
             "allow_not_confirmed": allow_not_confirmed,
         }
 
-    def __call__(self, req: Request, db: Session = Depends()):
-        return query_auth_data_from_request(req=req, db=db, **self.kwargs)  # type: ignore
+    async def __call__(self, req: Request, db: Session = Depends()) -> AuthData:
+        # Synchronous database work is offloaded to the bounded thread pool.
+        return await run_in_database_threadpool(
+            query_auth_data_from_request, req=req, db=db, **self.kwargs  # type: ignore
+        )
 
 
 def query_auth_data_from_token(
@@ -158,6 +197,82 @@ def try_query_auth_data_from_request(
         return None
 
 
+def query_auth_data_from_tokens(
+    tokens: list[str],
+    db: Session,
+    *,
+    required_permissions: set[Permission] | None = None,
+    allow_deactivated: bool = False,
+    allow_external_clients: bool = False,
+    trigger_online_update: bool = True,
+) -> list[AuthData | ApiErrorException]:
+    """
+    Queries authentication data for many access tokens at once.
+    Sessions and users referenced by the tokens are loaded with one query each (if not cached).
+    Returns auth data or API error for each token (in same order as tokens).
+    :param tokens: Access tokens.
+    :param db: Database session.
+    :param required_permissions: If passed, will require permission from each token.
+    :param allow_deactivated: If true, allow deactivated users to authenticate.
+    """
+
+    decoded_tokens: list[tuple[BaseToken, set[Permission]] | ApiErrorException] = []
+    for token in tokens:
+        try:
+            decoded_tokens.append(
+                _decode_token_unverified(token, AccessToken, required_permissions)
+            )
+        except ApiErrorException as e:
+            decoded_tokens.append(e)
+        except _TOKEN_EXCEPTIONS as e:
+            decoded_tokens.append(_get_token_api_error(e))
+
+    session_ids = {
+        session_id
+        for decoded in decoded_tokens
+        if not isinstance(decoded, ApiErrorException)
+        and isinstance(session_id := decoded[0].get_session_id(), int)
+    }
+    sessions, owners = _get_sessions_by_ids(session_ids, db)
+
+    results: list[AuthData | ApiErrorException] = []
+    for decoded in decoded_tokens:
+        if isinstance(decoded, ApiErrorException):
+            results.append(decoded)
+            continue
+        decoded_token, permissions = decoded
+        try:
+            session = sessions.get(decoded_token.get_session_id())
+            if session is None:
+                # Internal authentication system integrity check.
+                _raise_integrity_check_error()
+            _check_session(
+                session,
+                allow_external_clients=allow_external_clients
+                or Permission.noexpire in permissions,
+            )
+            _verify_token_signature(decoded_token, session)
+            auth_data = AuthData(
+                token=decoded_token,
+                session=session,
+                user=owners.get(session.owner_id),
+                permissions=permissions,
+            )
+            results.append(
+                _query_auth_data(
+                    auth_data,
+                    db,
+                    allow_deactivated=allow_deactivated,
+                    trigger_online_update=trigger_online_update,
+                )
+            )
+        except ApiErrorException as e:
+            results.append(e)
+        except _TOKEN_EXCEPTIONS as e:
+            results.append(_get_token_api_error(e))
+    return results
+
+
 def get_token_from_request(req: Request, only_session_token: bool) -> str:
     """
     Returns token from request.
@@ -194,6 +309,41 @@ def _decode_token(
     :param required_permissions: If passed, will require permission from token.
     """
 
+    # Decode base token once, signature is verified after querying session (key).
+    decoded_token, permissions = _decode_token_unverified(
+        token, token_type, required_permissions
+    )
+
+    # Query session, verify signature with session secret.
+    allow_external_clients = (
+        True if allow_external_clients else Permission.noexpire in permissions
+    )
+    session, owner = _query_session_from_sid(
+        decoded_token.get_session_id(),
+        db,
+        request,
+        allow_external_clients=allow_external_clients,
+    )
+    _verify_token_signature(decoded_token, session)
+
+    # Return DTO.
+    return AuthData(
+        token=decoded_token, session=session, user=owner, permissions=permissions
+    )
+
+
+def _decode_token_unverified(
+    token: str,
+    token_type: Type[BaseToken],
+    required_permissions: set[Permission] | None = None,
+) -> tuple[BaseToken, set[Permission]]:
+    """
+    Decodes given token without signature verification and checks its scope permissions.
+    :param token: Token to decode.
+    :param token_type: Token type to get.
+    :param required_permissions: If passed, will require permission from token.
+    """
+
     if token_type is not AccessToken and token_type is not SessionToken:
         raise ValueError(
             "Unexpected type of the token type inside _decode_token! Should be access or session!"
@@ -202,25 +352,34 @@ def _decode_token(
     if not token:
         raise ApiErrorException(ApiErrorCode.AUTH_REQUIRED, "Authentication required!")
 
-    # Decode base token.
-    unsigned_token = token_type.decode_unsigned(token)
+    decoded_token = token_type.decode_unverified(token)
 
     # Checks for token allowance.
-    scope = unsigned_token.get_scope() if token_type.get_type() == "access" else ""
-    permissions = _query_scope_permissions(scope, required_permissions)
+    scope = decoded_token.get_scope() if token_type.get_type() == "access" else ""
+    return decoded_token, _query_scope_permissions(scope, required_permissions)
 
-    # Query session, decode with valid signature.
-    allow_external_clients = (
-        True if allow_external_clients else Permission.noexpire in permissions
-    )
-    session = _query_session_from_sid(
-        unsigned_token.get_session_id(),
-        db,
-        request,
-        allow_external_clients=allow_external_clients,
-    )
-    signed_token = token_type.decode(token, key=session.token_secret)  # type: ignore
-    if not signed_token.signature_is_valid():
+
+def _verify_token_signature(
+    decoded_token: BaseToken, session: CachedUserSession
+) -> None:
+    """
+    Verifies signature of the decoded token with the session secret,
+    or with the signing key, if token is signed with it (has key id).
+    """
+    if (key_id := decoded_token.get_key_id()) is not None:
+        signing_key = get_signing_key(key_id)
+        if signing_key is None:
+            # Key was removed after rotation (or token is forged).
+            raise ApiErrorException(
+                ApiErrorCode.AUTH_INVALID_TOKEN,
+                "Unable to validate signature of the token!",
+            )
+        decoded_token.verify_signature(
+            key=signing_key.public_key, algorithm=signing_key.algorithm
+        )
+    else:
+        decoded_token.verify_signature(key=session.token_secret)
+    if not decoded_token.signature_is_valid():
         # If there is invalid signature on the token,
         # means token signed with another user, or old signature...
         raise ApiErrorException(
@@ -228,9 +387,6 @@ def _decode_token(
             "Unable to validate signature of the token!",
         )
 
-    # Return DTO.
-    return AuthData(token=signed_token, session=session, permissions=permissions)
-
 
 def _query_scope_permissions(
     scope: str, required_permissions: set[Permission] | Permission | None = None
@@ -277,9 +433,10 @@ def _query_session_from_sid(
     db: Session,
     request: Request | None = None,
     allow_external_clients: bool = False,
-) -> UserSession:
+) -> tuple[CachedUserSession, User | None]:
     """
     Queries session from SID (session_id).
+    Returns session with its owner user, if user was loaded together with the session.
     :param session_id: Session ID itself (SID).
     :param db: Database session.
     :param request: Request for client check.
@@ -290,12 +447,25 @@ def _query_session_from_sid(
         # Internal authentication system integrity check.
         _raise_integrity_check_error()
 
-    session = UserSessionsRepository(db).get_by_id(session_id)
+    session, owner = _get_session_by_id(session_id, db)
     if not session:
         # Internal authentication system integrity check.
         # users should never be deleted and this should never happen.
         _raise_integrity_check_error()
 
+    _check_session(session, request, allow_external_clients)
+    return session, owner
+
+
+def _check_session(
+    session: CachedUserSession,
+    request: Request | None = None,
+    allow_external_clients: bool = False,
+) -> None:
+    """
+    Raises API error if session is closed or (if not allowed) opened from another client.
+    """
+
     if not session.is_active:
         # If session is not active anymore,
         # means user closed (logouted) or whatever else happened.
@@ -308,9 +478,56 @@ def _query_session_from_sid(
         # If we are not expected to allow external clients (devices),
         # trigger session suspicious check.
         # this will disallow all suspicious devices that are different from session owner device.
-        session_check_client_by_request(db, session, request)
+        session_check_client_by_request(session, request)
+
+
+def _get_session_by_id(
+    session_id: int, db: Session
+) -> tuple[CachedUserSession | None, User | None]:
+    """
+    Returns session from the sessions cache, or queries database and caches it.
+    When queried from database, session owner and user agent are loaded within same query.
+    """
+    if session := get_cached_session(session_id):
+        return session, None
+
+    if row := UserSessionsRepository(db).get_with_owner_and_user_agent(session_id):
+        session, owner, user_agent = row
+        return cache_session(session, user_agent), owner
+    return None, None
+
+
+def _get_sessions_by_ids(
+    session_ids: set[int], db: Session
+) -> tuple[dict[int, CachedUserSession], dict[int, User]]:
+    """
+    Returns sessions (from cache, or queried with single database query) and their owners
+    (loaded with sessions, or queried with single database query for cached sessions).
+    """
+    sessions = get_cached_sessions(session_ids)
+    owners: dict[int, User] = {}
+    if missing_session_ids := session_ids - sessions.keys():
+        for session, owner, user_agent in UserSessionsRepository(
+            db
+        ).get_many_with_owner_and_user_agent(missing_session_ids):
+            sessions[session.id] = cache_session(session, user_agent)  # type: ignore
+            owners[owner.id] = owner  # type: ignore
+
+    if (
+        missing_owner_ids := {session.owner_id for session in sessions.values()}
+        - owners.keys()
+    ):
+        for owner in UsersRepository(db).get_users_by_ids(missing_owner_ids):
+            owners[owner.id] = owner  # type: ignore
+    return sessions, owners
+
 
-    return session
+def _get_token_api_error(error: Exception) -> ApiErrorException:
+    """
+    Returns API error for the token exception (same as exception handlers return).
+    """
+    api_code, message = _TOKEN_API_ERRORS[type(error)]
+    return ApiErrorException(api_code, message)
 
 
 def _query_auth_data(
@@ -328,9 +545,12 @@ def _query_auth_data(
     :param trigger_online_update: If true, will trigger online update for user.
     """
 
-    # Query database for our user to feed into auth data DTO.
+    # Query database for our user to feed into auth data DTO,
+    # unless it is already loaded together with the session.
     user_id = auth_data.token.get_subject()
-    user = UsersRepository(db).get_user_by_id(user_id=user_id)
+    user = auth_data.user
+    if user is None or user.id != user_id:
+        user = UsersRepository(db).get_user_by_id(user_id=user_id)
 
     if not user or auth_data.session.owner_id != user.id:
         # Internal authentication system integrity check.
@@ -347,12 +567,12 @@ def _query_auth_data(
 
     if allow_not_confirmed is not None:
         if allow_not_confirmed:
-            if auth_data.user.is_verified:
+            if user.is_verified:
                 raise ApiErrorException(
                     ApiErrorCode.EMAIL_CONFIRMATION_ALREADY_CONFIRMED,
                     "Email is confirmed and this method does not allow confirmed users!",
                 )
-        elif not auth_data.user.is_verified:
+        elif not user.is_verified:
             raise ApiErrorException(
                 ApiErrorCode.USER_EMAIL_NOT_CONFIRMED,
                 "Email is not confirmed and this method does not allow unconfirmed users!",
@@ -363,9 +583,8 @@ def _query_auth_data(
         # By default, this flag is enabled, means if you want to externally disable this trigger,
         # you should know that this is external trigger.
 
-        # Do update of the online time for user.
-        user.time_online = datetime.now()  # type: ignore
-        db.commit()
+        # Do update of the online time for user (buffered, see online service).
+        record_user_online(user, db)
 
     # Return modified DTO with user ORM model instance.
     auth_data.user = user
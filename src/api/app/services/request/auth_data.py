@@ -4,7 +4,7 @@
 
 from app.services.tokens import BaseToken, AccessToken
 from app.services.oauth.permissions import parse_permissions_from_scope, Permission
-from app.database.models.user_session import UserSession
+from app.services.cache.sessions import CachedUserSession
 from app.database.models.user import User
 
 
@@ -13,20 +13,20 @@ class AuthData:
 
     user: User
     token: BaseToken
-    session: UserSession
+    session: CachedUserSession
     permissions: set[Permission]
 
     def __init__(
         self,
         token: BaseToken,
-        session: UserSession,
+        session: CachedUserSession,
         user: User | None = None,
         permissions: set[Permission] | None = None,
     ) -> None:
         """
         :param user: User database model object.
         :param token: Session or access token object.
-        :param session: User session database model object.
+        :param session: Snapshot of the user session database model object.
         """
         # TODO: Checkout auth dependency for workflow.
         self.user = user  # type: ignore
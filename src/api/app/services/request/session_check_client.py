@@ -3,34 +3,30 @@
     (Session opened from another client).
 """
 
-from sqlalchemy.orm import Session
 from fastapi import Request
 from app.services.request.get_from_request import (
     get_user_agent_from_request,
     get_client_host_from_request,
 )
+from app.services.cache.sessions import CachedUserSession
 from app.services.api import ApiErrorException, ApiErrorCode
-from app.database.repositories import UserAgentsRepository
-from app.database.models.user_session import UserSession
 from app.config import get_settings
 
 
 def session_check_client_by_request(
-    db: Session, session: UserSession, request: Request
+    session: CachedUserSession, request: Request
 ) -> None:
     """
     Raises API exception if session does not pass internal auth system checks.
     """
 
-    if _check_session_is_suspicious(db, session, request):
+    if _check_session_is_suspicious(session, request):
         raise ApiErrorException(
             ApiErrorCode.AUTH_INVALID_TOKEN, "Session opened from another client!"
         )
 
 
-def _check_session_is_suspicious(
-    db: Session, session: UserSession, request: Request
-) -> bool:
+def _check_session_is_suspicious(session: CachedUserSession, request: Request) -> bool:
     """
     Returns true, if session is considered as suspicious.
     """
@@ -53,12 +49,9 @@ def _check_session_is_suspicious(
             if reject_fast:
                 return True
 
-    # Client user agent is wrong.
+    # Client user agent is wrong (session is loaded with its user agent string).
     if settings.auth_reject_wrong_user_agent:
-        user_agent = UserAgentsRepository(db).get_by_string(
-            get_user_agent_from_request(request)
-        )
-        if user_agent is None or user_agent.id != session.user_agent_id:
+        if get_user_agent_from_request(request) != session.user_agent:
             is_wrong_ua = True
             if reject_fast:
                 return True
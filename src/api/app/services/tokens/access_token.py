@@ -2,8 +2,13 @@
     Florgon API access token implementation.
 """
 
+from typing import TYPE_CHECKING
+
 from .base_token import BaseToken
 
+if TYPE_CHECKING:
+    from .signing_keys import SigningKey
+
 
 class AccessToken(BaseToken):
     """
@@ -43,22 +48,24 @@ class AccessToken(BaseToken):
         self._session_id = session_id
         self._scope = scope
 
-    @classmethod
-    def decode(cls, token: str, key: str | None = None):
+    def _load_custom_payload(self) -> None:
         """
-        Decoding with custom payload fields.
+        Loads custom payload fields from the raw payload.
         """
-        instance = super(AccessToken, cls).decode(token, key)
-        session_id = instance._raw_payload["sid"]  # pylint: disable=protected-access
-        instance._session_id = session_id  # pylint: disable=protected-access
-        scope = instance._raw_payload["scope"]  # pylint: disable=protected-access
-        instance._scope = scope  # pylint: disable=protected-access
-        return instance
+        self._session_id = self._raw_payload["sid"]
+        self._scope = self._raw_payload["scope"]
 
-    def encode(self, *, key: str | None = None) -> str:
+    def encode(
+        self, *, key: str | None = None, signing_key: "SigningKey | None" = None
+    ) -> str:
         """
         Encodes token with custom payload fields.
+        If signing key is given, token is signed with it (with key id header) instead of the key.
         """
         self.custom_payload["sid"] = self._session_id
         self.custom_payload["scope"] = self._scope
+        if signing_key is not None:
+            self._key = signing_key.private_key
+            self._signing_algorithm = signing_key.algorithm
+            self._custom_headers = {"kid": signing_key.key_id}
         return super().encode(key=key)
@@ -7,12 +7,19 @@
 """
 
 import time
+import json
+import binascii
 from typing import Any
 
 import jwt
+from jwt.utils import base64url_decode
+from jwt.algorithms import get_default_algorithms
 
 from . import exceptions
 
+# Algorithm implementations of the JWT library (used for the single-parse verification).
+_JWT_ALGORITHMS = get_default_algorithms()
+
 
 class BaseToken:
     """
@@ -25,7 +32,7 @@ class BaseToken:
 
     To implement token, inherit from this class and implement own token implementation:
         custom fields,
-        override encode / decode methods with injecting own payload,
+        override encode / `_load_custom_payload` methods with injecting own payload,
         update token type.
 
     Notice that updating token type is very important, because core implementation based on
@@ -44,7 +51,7 @@ class BaseToken:
     # JWT signing algorithm. Used by JWT library to sign tokens.
     # May be: HS(256|384|512) for HMAC SHA,
     # or one of crypto algorithms: RSA/EC/RSAPSS/OKPA.
-    # Notice that using asymmetric algorithm is more secure but not implemented yet.
+    # Access tokens may be signed with asymmetric signing key instead (see `signing_keys`).
     _signing_algorithm: str = "HS256"
 
     # Totally raw token payload, being set when decoding token (should be empty with encoding operation),
@@ -59,6 +66,12 @@ class BaseToken:
     # Token additional headers (JWT headers), not supposed to use mostly.
     _custom_headers: dict = {}
 
+    # Parts of the token decoded with `decode_unverified`,
+    # kept to verify the signature later without parsing the token again.
+    _raw_headers: dict | None = None
+    _signing_input: bytes | None = None
+    _signature: bytes | None = None
+
     # Secret key for signing actual token.
     # Should not be modified directly as it will be updated automatically.
     _key: str | None = None
@@ -114,6 +127,10 @@ class BaseToken:
         """Returns when decoded token will expire."""
         return self._expires_at
 
+    def get_key_id(self) -> str | None:
+        """Returns key id (`kid` header) of decoded token, if it is signed with signing key."""
+        return (self._raw_headers or {}).get("kid")
+
     def signature_is_valid(self) -> bool:
         """Returns true if token was decoded with checking the signature."""
         return self._signature_is_valid
@@ -192,19 +209,72 @@ class BaseToken:
         """
         Decodes token from JWT string.
 
-        You are supposed to inherit inside own class and
-        implement at your own using super().decode() call.
-
-        Example:
-        ```
-            instance = super().decode(token, payload)
-            instance._custom_field = "myfield"
-            return instance
-        ```
+        Custom payload fields are injected with `_load_custom_payload`,
+        which you are supposed to override inside own class.
         """
 
         # Decoding token.
         payload = cls._decode_payload(token, key)
+        return cls._from_payload(payload, signature_is_valid=key is not None)
+
+    @classmethod
+    def decode_unverified(cls, token: str):
+        """
+        Decodes token without verifying the signature, parsing the token only once.
+        Signature should be verified with `verify_signature` after key is known,
+        (e.g when key is session secret that is queried by the token claims).
+        Until verified, token is marked as invalid signature (as with `decode_unsigned`).
+        """
+        signing_input, headers, payload, signature = cls._split_jwt(token)
+        cls._check_payload_type(payload)
+
+        try:
+            instance = cls._from_payload(payload, signature_is_valid=False)
+        except (KeyError, ValueError, TypeError) as payload_error:
+            # Payload has missing or malformed fields.
+            raise exceptions.TokenInvalidError from payload_error
+        instance._raw_headers = headers
+        instance._signing_input = signing_input
+        instance._signature = signature
+        return instance
+
+    def verify_signature(self, key: Any, *, algorithm: str | None = None) -> None:
+        """
+        Verifies signature of the token decoded with `decode_unverified` with given key,
+        over already decoded token parts, and validates token claims (expiration).
+        Raises token exceptions same as `decode` with key.
+
+        :param algorithm: Expected algorithm (e.g of the signing key), default is algorithm of the token type.
+        """
+        if self._signing_input is None or self._signature is None:
+            raise ValueError(
+                "Token should be decoded with `decode_unverified` to verify the signature!"
+            )
+
+        expected_algorithm_name = algorithm or self._signing_algorithm
+        algorithm_name = (self._raw_headers or {}).get("alg")
+        if algorithm_name != expected_algorithm_name:
+            raise exceptions.TokenInvalidError(
+                f"Expected token algorithm to be {expected_algorithm_name}, but got {algorithm_name}"
+            )
+        jwt_algorithm = _JWT_ALGORITHMS[algorithm_name]
+        try:
+            is_valid = jwt_algorithm.verify(
+                self._signing_input, jwt_algorithm.prepare_key(key), self._signature
+            )
+        except jwt.exceptions.PyJWTError as py_jwt_error:
+            raise exceptions.TokenInvalidError from py_jwt_error
+        if not is_valid:
+            raise exceptions.TokenInvalidSignatureError
+
+        self._validate_claims(self._raw_payload or {})
+        self._signature_is_valid = True
+
+    @classmethod
+    def _from_payload(cls, payload: dict, *, signature_is_valid: bool):
+        """
+        Constructs token instance from decoded (raw) payload.
+        """
 
         # Get token time-to-live (TTL).
         issued_at = float(payload["iat"])
@@ -225,7 +295,7 @@ class BaseToken:
         instance._raw_payload = payload
         instance._issued_at = issued_at
         instance._expires_at = expires_at
-        instance._signature_is_valid = key is not None
+        instance._signature_is_valid = signature_is_valid
 
         # Deleting base fields from custom payload.
         del instance.custom_payload["iss"]
@@ -235,8 +305,22 @@ class BaseToken:
         if ttl != 0:
             del instance.custom_payload["exp"]
 
+        # Injecting fields of the children token classes.
+        instance._load_custom_payload()
         return instance
 
+    def _load_custom_payload(self) -> None:
+        """
+        Loads custom payload fields from the raw payload when decoding token.
+
+        You are supposed to override this method inside own class to inject own fields.
+
+        Example:
+        ```
+            self._custom_field = self._raw_payload["myfield"]
+        ```
+        """
+
     @classmethod
     def decode_unsigned(cls, token: str):
         """
@@ -270,8 +354,14 @@ class BaseToken:
         payload = cls._decode_jwt_exception_wrapped(
             token=token, key=key, verify_signature=verify_signature
         )
+        cls._check_payload_type(payload)
+        return payload
 
-        # Checking token types.
+    @classmethod
+    def _check_payload_type(cls, payload: dict) -> None:
+        """
+        Raises wrong type error if payload belongs to another type of token.
+        """
         expected_type = cls._type
         got_type = payload.get("typ", "")
         if got_type != expected_type:
@@ -280,7 +370,45 @@ class BaseToken:
                 f"Expected token type to be {expected_type}, but got {got_type}"
             )
 
-        return payload
+    @staticmethod
+    def _split_jwt(token: str) -> tuple[bytes, dict[str, Any], dict[str, Any], bytes]:
+        """
+        Splits and decodes JWT string once into signing input, headers, payload and signature.
+        """
+        if not isinstance(token, str):
+            raise TypeError("Token should be a string!")
+
+        try:
+            signing_input, signature_segment = token.encode("utf-8").rsplit(b".", 1)
+            headers_segment, payload_segment = signing_input.split(b".", 1)
+            headers = json.loads(base64url_decode(headers_segment))
+            payload = json.loads(base64url_decode(payload_segment))
+            signature = base64url_decode(signature_segment)
+        except (ValueError, TypeError, binascii.Error) as decode_error:
+            raise exceptions.TokenInvalidError from decode_error
+
+        if not isinstance(headers, dict) or not isinstance(payload, dict):
+            raise exceptions.TokenInvalidError(
+                "Token headers and payload should be objects!"
+            )
+        return signing_input, headers, payload, signature
+
+    @staticmethod
+    def _validate_claims(payload: dict[str, Any]) -> None:
+        """
+        Validates registered claims same as JWT library does when decoding with signature.
+        """
+        now = time.time()
+        try:
+            if "iat" in payload and int(payload["iat"]) > now:
+                raise exceptions.TokenInvalidError("Token is not yet valid (iat)!")
+            if "exp" in payload and int(payload["exp"]) <= now:
+                raise exceptions.TokenExpiredError
+        except (ValueError, TypeError) as claim_error:
+            raise exceptions.TokenInvalidError from claim_error
+        if "aud" in payload:
+            # Audience is not expected for our tokens.
+            raise exceptions.TokenInvalidError("Token audience is not expected!")
 
     @classmethod
     def _decode_jwt_exception_wrapped(
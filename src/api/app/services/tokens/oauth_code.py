@@ -64,25 +64,15 @@ class OAuthCode(BaseToken):
         self._redirect_uri = redirect_uri
         self._client_id = client_id
 
-    @classmethod
-    def decode(cls, token: str, key: str | None = None):
+    def _load_custom_payload(self) -> None:
         """
-        Decoding with custom payload fields.
+        Loads custom payload fields from the raw payload.
         """
-        instance = super(OAuthCode, cls).decode(token, key)
-
-        session_id = instance._raw_payload["sid"]  # pylint: disable=protected-access
-        instance._session_id = session_id  # pylint: disable=protected-access
-        scope = instance._raw_payload["scope"]  # pylint: disable=protected-access
-        instance._scope = scope  # pylint: disable=protected-access
-        redirect_uri = instance._raw_payload["ruri"]  # pylint: disable=protected-access
-        instance._redirect_uri = redirect_uri  # pylint: disable=protected-access
-        client_id = instance._raw_payload["cid"]  # pylint: disable=protected-access
-        instance._client_id = client_id  # pylint: disable=protected-access
-        code_id = instance._raw_payload["id"]  # pylint: disable=protected-access
-        instance._code_id = code_id  # pylint: disable=protected-access
-
-        return instance
+        self._session_id = self._raw_payload["sid"]
+        self._scope = self._raw_payload["scope"]
+        self._redirect_uri = self._raw_payload["ruri"]
+        self._client_id = self._raw_payload["cid"]
+        self._code_id = self._raw_payload["id"]
 
     def encode(self, *, key: str | None = None) -> str:
         """
@@ -51,21 +51,13 @@ class RefreshToken(BaseToken):
         self._scope = scope
         self._client_id = client_id
 
-    @classmethod
-    def decode(cls, token: str, key: str | None = None):
+    def _load_custom_payload(self) -> None:
         """
-        Decoding with custom payload fields.
+        Loads custom payload fields from the raw payload.
         """
-        instance = super(RefreshToken, cls).decode(token, key)
-
-        session_id = instance._raw_payload["sid"]  # pylint: disable=protected-access
-        instance._session_id = session_id  # pylint: disable=protected-access
-        scope = instance._raw_payload["scope"]  # pylint: disable=protected-access
-        instance._scope = scope  # pylint: disable=protected-access
-        client_id = instance._raw_payload["cid"]  # pylint: disable=protected-access
-        instance._client_id = client_id  # pylint: disable=protected-access
-
-        return instance
+        self._session_id = self._raw_payload["sid"]
+        self._scope = self._raw_payload["scope"]
+        self._client_id = self._raw_payload["cid"]
 
     def encode(self, *, key: str | None = None) -> str:
         """
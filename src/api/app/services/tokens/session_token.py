@@ -36,16 +36,11 @@ class SessionToken(BaseToken):
         super().__init__(issuer, ttl, subject=user_id, payload={}, key=key)
         self._session_id = session_id  # pylint: disable=protected-access
 
-    @classmethod
-    def decode(cls, token: str, key: str | None = None):
+    def _load_custom_payload(self) -> None:
         """
-        Decoding with custom payload fields.
+        Loads custom payload fields from the raw payload.
         """
-        instance = super(SessionToken, cls).decode(token, key)
-
-        session_id = instance._raw_payload["sid"]  # pylint: disable=protected-access
-        instance._session_id = session_id  # pylint: disable=protected-access
-        return instance
+        self._session_id = self._raw_payload["sid"]
 
     def encode(self, *, key: str | None = None) -> str:
         """
@@ -0,0 +1,110 @@
+"""
+    Asymmetric signing keys of the access tokens (ES256 / EdDSA), published as JWKS.
+
+    Access tokens signed with these keys have key id (`kid`) header,
+    so resource servers may verify them offline with public keys from the JWKS,
+    without introspection (`/v1/tokens/check`) requests.
+    First configured key signs new tokens, other keys are only published (for key rotation).
+"""
+
+import json
+import hashlib
+import base64
+from typing import Any
+from functools import lru_cache
+from dataclasses import dataclass
+
+from jwt.algorithms import has_crypto, get_default_algorithms
+from app.config import get_settings
+
+# Required members of the public JWK by key type, used for key id (RFC 7638 thumbprint).
+_THUMBPRINT_MEMBERS = {"EC": ("crv", "kty", "x", "y"), "OKP": ("crv", "kty", "x")}
+
+
+@dataclass(frozen=True)
+class SigningKey:
+    """Private key for signing tokens, with its public key and JWK."""
+
+    key_id: str
+    algorithm: str
+    # PEM encoded, used for signing tokens.
+    private_key: str
+    # Public key object of the cryptography library, used for verification.
+    public_key: Any
+    public_jwk: dict[str, str]
+
+
+def load_signing_key(private_key_pem: str) -> SigningKey:
+    """
+    Returns signing key from PEM encoded private key (P-256 for ES256, or Ed25519 for EdDSA).
+    Key id is thumbprint of the public key, so it is same for each worker.
+    """
+    if not has_crypto:
+        raise RuntimeError(
+            "Asymmetric signing keys requires `cryptography` library (`pyjwt[crypto]`)!"
+        )
+    # pylint: disable=import-outside-toplevel
+    from cryptography.hazmat.primitives.serialization import load_pem_private_key
+    from cryptography.hazmat.primitives.asymmetric import ed25519, ec
+
+    private_key = load_pem_private_key(private_key_pem.encode(), password=None)
+    if isinstance(private_key, ec.EllipticCurvePrivateKey) and isinstance(
+        private_key.curve, ec.SECP256R1
+    ):
+        algorithm = "ES256"
+    elif isinstance(private_key, ed25519.Ed25519PrivateKey):
+        algorithm = "EdDSA"
+    else:
+        raise ValueError("Signing key should be P-256 (ES256) or Ed25519 (EdDSA) key!")
+
+    public_key = private_key.public_key()
+    public_jwk = json.loads(get_default_algorithms()[algorithm].to_jwk(public_key))
+    key_id = _get_thumbprint(public_jwk)
+    return SigningKey(
+        key_id=key_id,
+        algorithm=algorithm,
+        private_key=private_key_pem,
+        public_key=public_key,
+        public_jwk=public_jwk | {"kid": key_id, "alg": algorithm, "use": "sig"},
+    )
+
+
+@lru_cache(maxsize=1)
+def get_signing_keys() -> dict[str, SigningKey]:
+    """
+    Returns configured signing keys by their ids (in order of configuration).
+    """
+    signing_keys = {}
+    for path in get_settings().security_access_tokens_signing_keys:
+        with open(path, "r", encoding="utf-8") as private_key_file:
+            signing_key = load_signing_key(private_key_file.read())
+        signing_keys[signing_key.key_id] = signing_key
+    return signing_keys
+
+
+def get_signing_key(key_id: str) -> SigningKey | None:
+    """Returns signing key by id, or None if key is not configured (e.g removed after rotation)."""
+    return get_signing_keys().get(key_id)
+
+
+def get_current_signing_key() -> SigningKey | None:
+    """
+    Returns key for signing new access tokens,
+    or None if access tokens should be signed with session secret.
+    """
+    return next(iter(get_signing_keys().values()), None)
+
+
+def get_jwks() -> dict[str, list[dict[str, str]]]:
+    """Returns public keys of all signing keys as JWK set."""
+    return {
+        "keys": [signing_key.public_jwk for signing_key in get_signing_keys().values()]
+    }
+
+
+def _get_thumbprint(jwk: dict[str, str]) -> str:
+    members = {name: jwk[name] for name in _THUMBPRINT_MEMBERS[jwk["kty"]]}
+    digest = hashlib.sha256(
+        json.dumps(members, separators=(",", ":"), sort_keys=True).encode()
+    ).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
@@ -4,9 +4,15 @@
 import re
 
 from validate_email import validate_email
-from app.services.passwords import check_password
+from app.services.passwords import (
+    password_needs_rehash,
+    get_hashed_password_async,
+    check_password_async,
+    LATEST_HASH_METHOD,
+)
 from app.services.api import ApiErrorException, ApiErrorCode
 from app.schemas.session import SignupModel
+from app.database.threadpool import run_in_database_threadpool
 from app.database.repositories import UsersRepository
 from app.database.models.user import User
 from app.database.dependencies import Session
@@ -132,10 +138,15 @@ def validate_signup_fields(db: Session, model: SignupModel) -> None:
     validate_phone_number_field(db=db, phone_number=model.phone_number)
 
 
-def validate_signin_fields(user: User | None = None, password: str = "") -> User:
-    """Validates that all fields passes signin base validation, or raises API error if not."""
+async def validate_signin_fields(
+    user: User | None = None, password: str = "", db: Session | None = None
+) -> User:
+    """
+    Validates that all fields passes signin base validation, or raises API error if not.
+    If database session is passed, password hashed with outdated method is re-hashed.
+    """
 
-    if not user or not check_password(
+    if not user or not await check_password_async(
         password=password,
         hashed_password=user.password,  # type: ignore
         hash_method=user.security_hash_method,  # type: ignore
@@ -150,6 +161,19 @@ def validate_signin_fields(user: User | None = None, password: str = "") -> User
             "Unable to complete request as user was frozen (deactivated or blocked).",
         )
 
+    if db is not None and password_needs_rehash(
+        user.password, hash_method=user.security_hash_method  # type: ignore
+    ):
+        hashed_password = await get_hashed_password_async(
+            password, hash_method=LATEST_HASH_METHOD
+        )
+        await run_in_database_threadpool(
+            UsersRepository(db).set_hashed_password,
+            user,
+            hashed_password,
+            LATEST_HASH_METHOD,
+        )
+
     return user
 
 
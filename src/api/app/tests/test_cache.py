@@ -0,0 +1,335 @@
+"""
+    Tests in-process LRU cache, responses cache, sessions cache, OAuth clients cache and ETags units.
+"""
+
+import time
+import asyncio
+import unittest
+from typing import Any
+from datetime import datetime
+from unittest import mock
+
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.orm import Session
+from sqlalchemy import create_engine
+from fastapi.responses import JSONResponse
+from fastapi import Response, Request
+from app.services.cache.responses import (
+    invalidate_cached_responses,
+    get_cached_response,
+    cache_response,
+    USER_PROFILES,
+)
+from app.services.cache.oauth_clients import get_secret_digest, CachedOAuthClient
+from app.services.cache.lru import LRUCache
+from app.services.cache import sessions, responses, oauth_clients, invalidation
+from app.services.api.etag import is_not_modified, get_user_etag
+from app.serializers.oauth_client import serialize_oauth_client
+from app.schemas.user import UpdateModel
+from app.database.repositories import UsersRepository
+from app.database.models.user_session import UserSession
+from app.database.models.oauth_client import OAuthClient
+from app.database.models.user import User
+from app.database.core import Base
+from app.config import get_settings
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+
+class TestLRUCacheUnit(unittest.TestCase):
+    """Checks LRU cache eviction and expiration."""
+
+    def test_lru_eviction(self):
+        """Least recently used entry is evicted first."""
+        cache: LRUCache[int, str] = LRUCache(maxsize=2, ttl=60)
+        cache.set(1, "a")
+        cache.set(2, "b")
+        self.assertEqual(cache.get(1), "a")
+        cache.set(3, "c")
+        self.assertIsNone(cache.get(2))
+        self.assertEqual(cache.get(1), "a")
+        self.assertEqual(cache.get(3), "c")
+        self.assertEqual(len(cache), 2)
+
+    def test_ttl_expiration(self):
+        """Expired entry is not returned."""
+        cache: LRUCache[int, str] = LRUCache(maxsize=2, ttl=0.01)
+        cache.set(1, "a")
+        time.sleep(0.02)
+        self.assertIsNone(cache.get(1))
+        self.assertEqual(cache.get(1, "default"), "default")
+
+    def test_delete(self):
+        """Deleted entry is not returned and deletion of missing entry is noop."""
+        cache: LRUCache[int, str] = LRUCache(maxsize=2, ttl=60)
+        cache.set(1, "a")
+        cache.delete(1)
+        cache.delete(2)
+        self.assertIsNone(cache.get(1))
+
+
+class TestResponsesCacheUnit(unittest.TestCase):
+    """Checks responses cache (with in-memory backend) variants and invalidation."""
+
+    def setUp(self):
+        settings = get_settings()
+        self._use_inmemory_backend = settings.fastapi_cache_use_inmemory_backend
+        settings.fastapi_cache_use_inmemory_backend = True
+
+    def tearDown(self):
+        get_settings().fastapi_cache_use_inmemory_backend = self._use_inmemory_backend
+
+    def test_cached_response_variants(self):
+        """Response is cached per variant, and all variants are invalidated."""
+        _cache_response("test", 1, JSONResponse({"a": 1}), variant="anonymous")
+        self.assertEqual(_get_cached_response("test", 1, "anonymous").body, b'{"a":1}')
+        self.assertIsNone(_get_cached_response("test", 1, "authenticated"))
+        invalidate_cached_responses("test", [1])
+        self.assertIsNone(_get_cached_response("test", 1, "anonymous"))
+
+    def test_error_response_not_cached(self):
+        """Only successful responses are cached."""
+        _cache_response("test", 2, JSONResponse({}, status_code=400))
+        self.assertIsNone(_get_cached_response("test", 2))
+
+    def test_cached_response_etag(self):
+        """ETag is cached with the response and used for conditional requests."""
+        response = JSONResponse({"a": 1}, headers={"ETag": 'W/"1-abc"'})
+        _cache_response("test", 3, response)
+        cached_response = _get_cached_response("test", 3)
+        self.assertEqual(cached_response.headers["ETag"], 'W/"1-abc"')
+
+        request = _get_request({"If-None-Match": '"0-def", "1-abc"'})
+        self.assertTrue(is_not_modified(request, cached_response.headers["ETag"]))
+        self.assertFalse(is_not_modified(_get_request({}), 'W/"1-abc"'))
+        self.assertFalse(
+            is_not_modified(_get_request({"If-None-Match": 'W/"0-def"'}), 'W/"1-abc"')
+        )
+
+    def test_user_etag(self):
+        """User ETag is changed by update and scope, but not by online time."""
+        user = User(id=1, time_updated=datetime(2023, 1, 1), time_online=None)
+        etag = get_user_etag(user, True)
+        user.time_online = datetime(2023, 1, 2)
+        self.assertEqual(get_user_etag(user, True), etag)
+        self.assertNotEqual(get_user_etag(user, False), etag)
+        user.time_updated = datetime(2023, 1, 2)
+        self.assertNotEqual(get_user_etag(user, True), etag)
+
+    def test_user_profile_invalidated(self):
+        """Cached profile is dropped when user is updated, deactivated or activated."""
+        engine = create_engine(
+            "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+        )
+        Base.metadata.create_all(engine, tables=[User.__table__])
+        with Session(engine) as db:
+            repo = UsersRepository(db)
+            user = User(username="user", email="user@florgon.com", password="")
+            repo.finish(user)
+
+            for update in (
+                lambda: repo.apply_update_model(UpdateModel(first_name="User"), user),
+                lambda: repo.deactivate(user),
+                lambda: repo.activate(user),
+            ):
+                _cache_response(USER_PROFILES, "user", JSONResponse({}))
+                update()
+                self.assertIsNone(_get_cached_response(USER_PROFILES, "user"))
+
+
+@unittest.skipIf(fakeredis is None, "fakeredis is not installed")
+class TestResponsesRedisCacheUnit(unittest.TestCase):
+    """Checks responses cache Redis layer (with fake Redis)."""
+
+    def setUp(self):
+        self.client = fakeredis.FakeRedis(decode_responses=True)
+        self.settings = get_settings().copy()
+        self.settings.fastapi_cache_enable = True
+        self.settings.fastapi_cache_use_inmemory_backend = False
+        self.patches = [
+            mock.patch.object(responses, "get_cache_client", return_value=self.client),
+            mock.patch.object(
+                invalidation, "get_cache_client", return_value=self.client
+            ),
+            mock.patch.object(responses, "get_settings", return_value=self.settings),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+        responses._get_local_cache.cache_clear()
+
+    def test_redis_layer(self):
+        """Response missing in the local cache is loaded from Redis, and dropped from it."""
+        response = JSONResponse({"a": 1}, headers={"ETag": 'W/"1-abc"'})
+        _cache_response("test", 4, response)
+        responses._get_local_cache.cache_clear()
+        cached_response = _get_cached_response("test", 4)
+        self.assertEqual(cached_response.body, b'{"a":1}')
+        self.assertEqual(cached_response.headers["ETag"], 'W/"1-abc"')
+
+        invalidate_cached_responses("test", [4])
+        responses._get_local_cache.cache_clear()
+        self.assertIsNone(_get_cached_response("test", 4))
+
+
+@unittest.skipIf(fakeredis is None, "fakeredis is not installed")
+class TestSessionsCacheUnit(unittest.TestCase):
+    """Checks sessions cache secrets storage and invalidation (with fake Redis)."""
+
+    def setUp(self):
+        self.client = fakeredis.FakeRedis(decode_responses=True)
+        self.settings = get_settings().copy()
+        self.settings.cache_sessions_enabled = True
+        self.settings.cache_sessions_secret_key = "key"
+        self.patches = [
+            mock.patch.object(sessions, "get_cache_client", return_value=self.client),
+            mock.patch.object(
+                invalidation, "get_cache_client", return_value=self.client
+            ),
+            mock.patch.object(sessions, "get_settings", return_value=self.settings),
+        ]
+        for patch in self.patches:
+            patch.start()
+        self._clear_caches()
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+        self._clear_caches()
+
+    @unittest.skipIf(not sessions.has_crypto, "cryptography is not installed")
+    def test_secret_encrypted(self):
+        """Secret is stored in Redis only encrypted, and is not loaded with other key."""
+        sessions.cache_session(_get_session(), "agent")
+        stored_secret = self.client.hget(sessions._get_key(1), "token_secret")
+        self.assertNotIn("secret", stored_secret)
+
+        sessions._get_local_cache.cache_clear()
+        self.assertEqual(sessions.get_cached_session(1).token_secret, "secret")
+
+        self._clear_caches()
+        self.settings.cache_sessions_secret_key = "other"
+        self.assertIsNone(sessions.get_cached_session(1))
+        self.assertEqual(sessions.get_cached_sessions([1]), {})
+
+    def test_local_only_without_key(self):
+        """Session is not stored in Redis without the key."""
+        self.settings.cache_sessions_secret_key = ""
+        sessions.cache_session(_get_session(), "agent")
+        self.assertEqual(self.client.keys(sessions._get_key(1)), [])
+        self.assertEqual(sessions.get_cached_session(1).token_secret, "secret")
+
+    @unittest.skipIf(not sessions.has_crypto, "cryptography is not installed")
+    def test_not_stored_after_invalidation(self):
+        """Session loaded before invalidation is not stored by this or other worker."""
+        session = _get_session()
+        sessions.invalidate_sessions([1])
+        sessions.cache_session(session, "agent")
+        self.assertIsNone(sessions.get_cached_session(1))
+
+        # Other worker, that did not receive invalidation yet.
+        sessions._get_local_tombstones.cache_clear()
+        sessions.cache_session(session, "agent")
+        self.assertFalse(self.client.exists(sessions._get_key(1)))
+
+    def _clear_caches(self):
+        sessions._get_local_cache.cache_clear()
+        sessions._get_local_tombstones.cache_clear()
+        sessions._get_cipher.cache_clear()
+
+
+class TestOAuthClientsCacheUnit(unittest.TestCase):
+    """Checks OAuth clients cache snapshots."""
+
+    def test_negative_entry(self):
+        """Missing client is stored and loaded as not existing, and secrets are not matched."""
+        oauth_client = CachedOAuthClient.from_mapping(
+            1, CachedOAuthClient(id=1, exists=False).to_mapping()
+        )
+        self.assertFalse(oauth_client.exists)
+        self.assertFalse(oauth_client.check_secret(""))
+
+    def test_secret_digest(self):
+        """Only digest of the secret is stored, and secret is checked by it."""
+        oauth_client = CachedOAuthClient(
+            id=1, exists=True, secret_digest=get_secret_digest("secret"), is_active=True
+        )
+        loaded_oauth_client = CachedOAuthClient.from_mapping(
+            1, oauth_client.to_mapping()
+        )
+        self.assertNotIn("secret", loaded_oauth_client.to_mapping().values())
+        self.assertTrue(loaded_oauth_client.check_secret("secret"))
+        self.assertFalse(loaded_oauth_client.check_secret("other"))
+        self.assertTrue(loaded_oauth_client.is_active)
+
+    @unittest.skipIf(fakeredis is None, "fakeredis is not installed")
+    def test_redis_layer(self):
+        """Client loaded from Redis is serialized same as the database model."""
+        client = fakeredis.FakeRedis(decode_responses=True)
+        settings = get_settings().copy()
+        settings.cache_oauth_clients_enabled = True
+        model = OAuthClient(
+            id=1,
+            owner_id=1,
+            secret="secret",
+            display_name="Client",
+            is_active=True,
+            is_verified=False,
+            time_created=datetime(2023, 1, 1, 12),
+        )
+        with mock.patch.object(
+            oauth_clients, "get_cache_client", return_value=client
+        ), mock.patch.object(oauth_clients, "get_settings", return_value=settings):
+            oauth_clients._get_local_cache.cache_clear()
+            oauth_clients.cache_oauth_client(1, model)
+            oauth_clients._get_local_cache.cache_clear()
+            oauth_client = oauth_clients.get_cached_oauth_client(1)
+            oauth_clients._get_local_cache.cache_clear()
+        self.assertEqual(oauth_client.time_created, model.time_created)
+        self.assertEqual(
+            serialize_oauth_client(oauth_client, display_secret=False),
+            serialize_oauth_client(model, display_secret=False),
+        )
+
+
+def _cache_response(
+    namespace: str, key: Any, response: Response, variant: str = ""
+) -> Response:
+    return asyncio.run(
+        cache_response(namespace, key, response, ttl=60, variant=variant)
+    )
+
+
+def _get_cached_response(
+    namespace: str, key: Any, variant: str = ""
+) -> Response | None:
+    return asyncio.run(get_cached_response(namespace, key, variant))
+
+
+def _get_session() -> UserSession:
+    return UserSession(
+        id=1,
+        owner_id=1,
+        token_secret="secret",
+        ip_address="127.0.0.1",
+        user_agent_id=1,
+        is_active=True,
+    )
+
+
+def _get_request(headers: dict[str, str]) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "headers": [
+                (name.lower().encode(), value.encode())
+                for name, value in headers.items()
+            ],
+        }
+    )
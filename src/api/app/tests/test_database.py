@@ -3,9 +3,10 @@
 """
 
 import unittest
+import asyncio
 
 from sqlalchemy import text
-from app.database.core import SessionLocal
+from app.database.core import get_async_sessionmaker, SessionLocal
 
 
 class TestDatabaseUnit(unittest.TestCase):
@@ -17,3 +18,13 @@ class TestDatabaseUnit(unittest.TestCase):
         with SessionLocal() as session:
             actual = session.execute(text(f"SELECT {expected}")).fetchall()[0][0]
             self.assertEqual(actual, expected)
+
+    def test_async_database_sql_select(self):
+        """Checks that SQL SELECT with asynchronous session equals to argument number."""
+        expected = 32
+
+        async def select_expected():
+            async with get_async_sessionmaker()() as session:
+                return (await session.execute(text(f"SELECT {expected}"))).scalar()
+
+        self.assertEqual(asyncio.run(select_expected()), expected)
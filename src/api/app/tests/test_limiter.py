@@ -0,0 +1,141 @@
+"""
+    Tests requests limiter unit (local rejections, fallback windows, circuit breaker).
+"""
+
+import time
+import unittest
+
+import aioredis
+from fastapi.testclient import TestClient
+from fastapi import FastAPI, Depends
+from app.services.limiter.scripts import SCRIPTS
+from app.services.limiter.local import LocalWindows, LocalRejections
+from app.services.limiter.depends import RateLimiter
+from app.services.limiter.breaker import CircuitBreaker
+from app.services.limiter import FastAPILimiter
+from app.services.api import api_success
+from app.config.middlewares.rate_limit import add_rate_limit_headers_middleware
+from app.config.exceptions import EXCEPTION_HANDLERS
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+
+class TestLocalRejectionsUnit(unittest.TestCase):
+    """Checks reached limits are answered locally."""
+
+    def test_rejected_until_expiration(self):
+        """Reached limit is answered locally until retry time."""
+        rejections = LocalRejections(maxsize=2)
+        self.assertIsNone(rejections.get("key"))
+        rejections.reject("key", 10, limit=4)
+        result = rejections.get("key")
+        self.assertFalse(result.allowed)
+        self.assertEqual(result.limit, 4)
+        self.assertGreater(result.retry_after, 0)
+        time.sleep(0.02)
+        self.assertIsNone(rejections.get("key"))
+
+    def test_eviction(self):
+        """Least recently rejected key is evicted first."""
+        rejections = LocalRejections(maxsize=1)
+        rejections.reject("a", 1000)
+        rejections.reject("b", 1000)
+        self.assertIsNone(rejections.get("a"))
+        self.assertFalse(rejections.get("b").allowed)
+
+
+@unittest.skipIf(fakeredis is None, "fakeredis is not installed")
+class TestLimiterScriptsUnit(unittest.TestCase):
+    """Checks limiter algorithms scripts (with fake Redis)."""
+
+    def test_limit_admitted(self):
+        """Exactly the most restrictive limit is admitted by every algorithm."""
+        client = fakeredis.FakeRedis(decode_responses=True)
+        for algorithm, script in SCRIPTS.items():
+            with self.subTest(algorithm=algorithm):
+                keys = [f"{algorithm}:a", f"{algorithm}:b"]
+                results = [
+                    client.eval(script, len(keys), *keys, 3, 10_000, 5, 60_000)
+                    for _ in range(4)
+                ]
+                self.assertEqual([result[0] for result in results], [1, 1, 1, 0])
+                self.assertEqual([result[3] for result in results], [2, 1, 0, 0])
+                self.assertGreater(results[-1][1], 0)
+
+
+class TestLocalFallbackUnit(unittest.TestCase):
+    """Checks limits are kept locally while Redis is unavailable."""
+
+    def test_local_windows(self):
+        """Request is counted only if all limits are passed."""
+        windows = LocalWindows(maxsize=10)
+        limits = [(3, 1000), (1, 10)]
+        self.assertTrue(windows.hit(["a", "b"], limits).allowed)
+        result = windows.hit(["a", "b"], limits)
+        self.assertFalse(result.allowed)
+        self.assertEqual(result.limit, 1)
+        time.sleep(0.02)
+        result = windows.hit(["a", "b"], limits)
+        self.assertTrue(result.allowed)
+        self.assertEqual(result.remaining, 0)
+
+    def test_circuit_breaker(self):
+        """Circuit is opened after failures in a row, and closed after success."""
+        breaker = CircuitBreaker(failures=2, backoff=0.01, backoff_max=1)
+        breaker.record_failure()
+        self.assertFalse(breaker.is_open)
+        breaker.record_failure()
+        self.assertTrue(breaker.is_open)
+        time.sleep(0.02)
+        self.assertFalse(breaker.is_open)
+        breaker.record_failure()
+        self.assertTrue(breaker.is_open)
+        breaker.record_success()
+        self.assertFalse(breaker.is_open)
+
+    def test_circuit_breaker_single_trial(self):
+        """Only single trial call is allowed when backoff is over."""
+        breaker = CircuitBreaker(failures=1, backoff=0.01, backoff_max=1)
+        breaker.record_failure()
+        self.assertTrue(breaker.is_open)
+        time.sleep(0.02)
+        self.assertFalse(breaker.is_open)
+        self.assertTrue(breaker.is_open)
+        breaker.record_success()
+        self.assertFalse(breaker.is_open)
+        self.assertFalse(breaker.is_open)
+
+
+class TestRateLimitHeadersUnit(unittest.TestCase):
+    """Checks `RateLimit-*` headers are sent with responses of the limited routes."""
+
+    def test_rate_limit_headers(self):
+        """Headers are set both for allowed and rejected requests."""
+        app = FastAPI(exception_handlers=EXCEPTION_HANDLERS)
+        add_rate_limit_headers_middleware(app)
+
+        @app.on_event("startup")
+        async def _init_limiter():
+            # Redis is unavailable, so limits are counted with local fallback windows.
+            await FastAPILimiter.init(aioredis.from_url("redis://127.0.0.1:1/"))
+
+        @app.get("/", dependencies=[Depends(RateLimiter(times=2, seconds=10))])
+        async def _route():
+            return api_success({})
+
+        with TestClient(app) as client:
+            response = client.get("/")
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.headers["RateLimit-Limit"], "2")
+            self.assertEqual(response.headers["RateLimit-Remaining"], "1")
+            self.assertEqual(response.headers["RateLimit-Reset"], "10")
+
+            self.assertEqual(client.get("/").headers["RateLimit-Remaining"], "0")
+
+            response = client.get("/")
+            self.assertEqual(response.status_code, 429)
+            self.assertEqual(response.headers["RateLimit-Remaining"], "0")
+            self.assertIn("Retry-After", response.headers)
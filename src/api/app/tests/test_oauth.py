@@ -0,0 +1,165 @@
+"""
+    Tests OAuth units (client uses buffer, codes store).
+"""
+
+import unittest
+from unittest import mock
+
+from redis import RedisError
+from app.services.tokens import OAuthCode
+from app.services.oauth.grants.types.authorization_code import (
+    _verify_and_expire_oauth_code,
+)
+from app.services.oauth.codes import OAuthCodesStore
+from app.services.oauth import uses, codes
+from app.services.api import ApiErrorException, ApiErrorCode
+from app.database.models.user_session import UserSession
+from app.config import get_settings
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+
+@unittest.skipIf(fakeredis is None, "fakeredis is not installed")
+class TestOAuthClientUsesUnit(unittest.TestCase):
+    """Checks OAuth client uses buffering, fallback and flushing (with fake Redis)."""
+
+    def setUp(self):
+        self.client = fakeredis.FakeRedis(decode_responses=True)
+        self.repository = mock.MagicMock()
+        self.settings = get_settings().copy()
+        self.patches = [
+            mock.patch.object(uses, "get_cache_client", return_value=self.client),
+            mock.patch.object(uses, "get_settings", return_value=self.settings),
+            mock.patch.object(
+                uses, "OAuthClientUseRepository", return_value=self.repository
+            ),
+            mock.patch.object(uses, "_backpressure_until", 0.0),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+
+    def test_buffered(self):
+        """Uses are appended to the stream, and inserted by flush in single batch."""
+        for user_id in range(3):
+            uses.record_oauth_client_use(None, user_id, 1)
+        self.repository.create.assert_not_called()
+        self.assertEqual(self.client.xlen(uses.USES_STREAM_KEY), 3)
+
+        self.assertEqual(uses.flush_oauth_client_uses(None), 3)
+        (batch,), _ = self.repository.create_many.call_args
+        self.assertEqual([use[:2] for use in batch], [(0, 1), (1, 1), (2, 1)])
+        self.assertEqual(self.client.xlen(uses.USES_STREAM_KEY), 0)
+        self.assertEqual(uses.flush_oauth_client_uses(None), 0)
+
+    def test_fallback(self):
+        """Uses are inserted directly when buffer is disabled or Redis is unavailable."""
+        self.settings.auth_oauth_client_uses_buffer_enabled = False
+        uses.record_oauth_client_use(None, 1, 1)
+        self.assertEqual(self.repository.create.call_count, 1)
+
+        self.settings.auth_oauth_client_uses_buffer_enabled = True
+        with mock.patch.object(self.client, "pipeline", side_effect=RedisError):
+            uses.record_oauth_client_use(None, 1, 1)
+        self.assertEqual(self.repository.create.call_count, 2)
+        self.assertFalse(self.client.exists(uses.USES_STREAM_KEY))
+
+    def test_backpressure(self):
+        """Uses are inserted directly while buffer is too long."""
+        self.settings.auth_oauth_client_uses_buffer_max_length = 1
+        uses.record_oauth_client_use(None, 1, 1)
+        uses.record_oauth_client_use(None, 2, 1)
+        self.repository.create.assert_not_called()
+        uses.record_oauth_client_use(None, 3, 1)
+        self.repository.create.assert_called_once_with(3, 1)
+        self.assertEqual(self.client.xlen(uses.USES_STREAM_KEY), 2)
+
+    def test_dead_letters(self):
+        """Failing uses are retried, then moved to the dead letter stream."""
+        self.settings.auth_oauth_client_uses_max_deliveries = 2
+        uses.record_oauth_client_use(None, 1, 1)
+        self.client.xadd(uses.USES_STREAM_KEY, {"user_id": "malformed"})
+        self.repository.create_many.side_effect = ValueError
+
+        with mock.patch.object(uses, "_CLAIM_MIN_IDLE_TIME", 0):
+            for _ in range(2):
+                with self.assertRaises(ValueError):
+                    uses.flush_oauth_client_uses(None)
+            # Malformed use is moved at once, and failing one is still retried.
+            self.assertEqual(self.client.xlen(uses.USES_DEAD_LETTER_STREAM_KEY), 1)
+            self.assertEqual(self.client.xlen(uses.USES_STREAM_KEY), 1)
+
+            self.assertEqual(uses.flush_oauth_client_uses(None), 0)
+        self.assertEqual(self.client.xlen(uses.USES_DEAD_LETTER_STREAM_KEY), 2)
+        self.assertEqual(self.client.xlen(uses.USES_STREAM_KEY), 0)
+        self.assertEqual(self.repository.create_many.call_count, 2)
+
+
+@unittest.skipIf(fakeredis is None, "fakeredis is not installed")
+class TestOAuthCodesStoreUnit(unittest.TestCase):
+    """Checks OAuth codes are stored, consumed once and verified (with fake Redis)."""
+
+    def setUp(self):
+        self.client = fakeredis.FakeRedis(decode_responses=True)
+        self.store = OAuthCodesStore(client=self.client)
+
+    def test_single_use(self):
+        """Code is returned only once, with same fields."""
+        oauth_code = self.store.create(user_id=1, client_id=2, session_id=3)
+        self.assertGreater(self.client.pttl(f"{codes.KEY_PREFIX}:{oauth_code.id}"), 0)
+        self.assertEqual(self.store.get_by_id(oauth_code.id), oauth_code)
+        self.assertIsNone(self.store.get_by_id(oauth_code.id))
+        self.assertIsNone(self.store.get_by_id(oauth_code.id + 1))
+
+    def test_collision_retry(self):
+        """Existing code is not overwritten, and code id is generated again."""
+        existing_code = self.store.create(user_id=1, client_id=2, session_id=3)
+        with mock.patch.object(
+            codes.secrets, "randbits", side_effect=[existing_code.id, 42]
+        ):
+            oauth_code = self.store.create(user_id=4, client_id=5, session_id=6)
+        self.assertEqual(oauth_code.id, 42)
+        self.assertEqual(self.store.get_by_id(existing_code.id), existing_code)
+        self.assertEqual(self.store.get_by_id(42), oauth_code)
+
+        with mock.patch.object(
+            codes.secrets, "randbits", return_value=existing_code.id
+        ):
+            self.store.create(user_id=1, client_id=2, session_id=3)
+            with self.assertRaises(ApiErrorException):
+                self.store.create(user_id=1, client_id=2, session_id=3)
+
+    def test_verify_and_expire(self):
+        """Code is verified against user, client and session of the code token."""
+        session = UserSession(id=3)
+        with mock.patch.object(codes, "get_cache_client", return_value=self.client):
+            for (user_id, client_id, session_id), api_code in (
+                ((1, 2, 3), None),
+                ((9, 2, 3), ApiErrorCode.AUTH_INVALID_TOKEN),
+                ((1, 9, 3), ApiErrorCode.AUTH_INVALID_TOKEN),
+                ((1, 2, 9), ApiErrorCode.AUTH_INVALID_TOKEN),
+            ):
+                oauth_code = self.store.create(user_id, client_id, session_id)
+                code_token = OAuthCode(
+                    "me", 60, 1, 3, "", "", client_id=2, code_id=oauth_code.id
+                )
+                with self.subTest(user_id=user_id, client_id=client_id):
+                    if api_code is None:
+                        _verify_and_expire_oauth_code(code_token, session)
+                    else:
+                        with self.assertRaises(ApiErrorException) as context:
+                            _verify_and_expire_oauth_code(code_token, session)
+                        self.assertEqual(context.exception.api_code, api_code)
+
+                    # Code is consumed even if it is not matched.
+                    with self.assertRaises(ApiErrorException) as context:
+                        _verify_and_expire_oauth_code(code_token, session)
+                    self.assertEqual(
+                        context.exception.api_code, ApiErrorCode.AUTH_EXPIRED_TOKEN
+                    )
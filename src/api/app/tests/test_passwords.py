@@ -3,8 +3,24 @@
 """
 
 import unittest
+import asyncio
 
-from app.services.passwords import get_hashed_password, check_password
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.orm import Session
+from sqlalchemy import create_engine
+from app.services.validators.user import validate_signin_fields
+from app.services.passwords import (
+    password_needs_rehash,
+    on_shutdown,
+    get_hashed_password_async,
+    get_hashed_password,
+    check_password_async,
+    check_password,
+    LATEST_HASH_METHOD,
+)
+from app.services.api import ApiErrorException
+from app.database.models.user import User
+from app.database.core import Base
 
 
 class TestPasswordsUnit(unittest.TestCase):
@@ -43,3 +59,85 @@ class TestPasswordsUnit(unittest.TestCase):
         )
         with self.assertRaises(TypeError):
             check_password(32, 64, hash_method=1)  # noqa
+
+    def test_password_hash_method_2(self):
+        """Check that password hashed with parameters in hash, and older hashes require re-hash."""
+        test_password = "mypassword"
+        hashed_password = get_hashed_password(test_password, hash_method=2)
+        self.assertTrue(check_password(test_password, hashed_password, hash_method=2))
+        self.assertFalse(
+            check_password("otherpassword", hashed_password, hash_method=2)
+        )
+        self.assertFalse(check_password(test_password, "$scrypt$", hash_method=2))
+        self.assertFalse(password_needs_rehash(hashed_password, hash_method=2))
+        self.assertTrue(
+            password_needs_rehash(
+                hashed_password.replace("n=", "n=1", 1), hash_method=2
+            )
+        )
+        self.assertTrue(
+            password_needs_rehash(
+                get_hashed_password(test_password, hash_method=0), hash_method=0
+            )
+        )
+
+    def test_password_hash_async(self):
+        """Check that password hashed in the process pool is verified."""
+        test_password = "mypassword"
+
+        async def hash_and_check():
+            hashed_password = await get_hashed_password_async(
+                test_password, hash_method=1
+            )
+            return await check_password_async(
+                test_password, hashed_password, hash_method=1
+            )
+
+        try:
+            self.assertTrue(asyncio.run(hash_and_check()))
+        finally:
+            on_shutdown()
+
+    def test_signin_rehashes_password(self):
+        """Check that signin with password hashed by outdated method re-hashes it."""
+        test_password = "mypassword"
+        engine = create_engine(
+            "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+        )
+        Base.metadata.create_all(engine, tables=[User.__table__])
+        with Session(engine) as db:
+            user = User(
+                username="user",
+                email="user@florgon.com",
+                password=get_hashed_password(test_password, hash_method=0),
+                security_hash_method=0,
+            )
+            db.add(user)
+            db.commit()
+
+            try:
+                signed_in_user = asyncio.run(
+                    validate_signin_fields(user=user, password=test_password, db=db)
+                )
+                with self.assertRaises(ApiErrorException):
+                    asyncio.run(
+                        validate_signin_fields(
+                            user=user, password="otherpassword", db=db
+                        )
+                    )
+            finally:
+                on_shutdown()
+
+            self.assertIs(signed_in_user, user)
+            db.expire_all()
+            self.assertEqual(user.security_hash_method, LATEST_HASH_METHOD)
+            self.assertFalse(
+                password_needs_rehash(
+                    user.password, hash_method=user.security_hash_method
+                )
+            )
+            self.assertTrue(
+                check_password(
+                    test_password, user.password, hash_method=LATEST_HASH_METHOD
+                )
+            )
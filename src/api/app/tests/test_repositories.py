@@ -0,0 +1,176 @@
+"""
+    Tests repositories queries (amount of queries for lists with related rows),
+    and OAuth client usage counters (requires PostgreSQL database).
+"""
+
+import uuid
+import unittest
+from datetime import datetime, timezone
+
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import OperationalError
+from sqlalchemy import select, func, event, delete, create_engine
+from app.serializers.session import serialize_sessions
+from app.serializers.oauth_client import serialize_linked_oauth_clients
+from app.database.repositories import (
+    UserSessionsRepository,
+    OAuthClientUseRepository,
+    OAuthClientUserRepository,
+)
+from app.database.models.user_session import UserSession
+from app.database.models.user_agent import UserAgent
+from app.database.models.user import User
+from app.database.models.oauth_client_user import OAuthClientUser
+from app.database.models.oauth_client_use import OAuthClientUse
+from app.database.models.oauth_client_stats import (
+    OAuthClientUniqueUser,
+    OAuthClientStats,
+)
+from app.database.models.oauth_client import OAuthClient
+from app.database.core import SessionLocal, Base
+
+
+class TestRepositoriesQueries(unittest.TestCase):
+    """Checks that lists are queried with constant amount of queries (in-memory SQLite)."""
+
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://",
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+        Base.metadata.create_all(
+            self.engine,
+            tables=[
+                User.__table__,
+                UserAgent.__table__,
+                UserSession.__table__,
+                OAuthClient.__table__,
+                OAuthClientUser.__table__,
+            ],
+        )
+        with Session(self.engine) as db:
+            user = User(username="user", email="user@florgon.com", password="")
+            db.add(user)
+            db.flush()
+            self.user_id = user.id
+            for index in range(10):
+                user_agent = UserAgent(user_agent=f"user_agent_{index}")
+                oauth_client = OAuthClient(
+                    secret="", display_name=f"client_{index}", owner_id=user.id
+                )
+                db.add_all([user_agent, oauth_client])
+                db.flush()
+                db.add(
+                    UserSession(
+                        owner_id=user.id,
+                        token_secret="",
+                        ip_address="127.0.0.1",
+                        user_agent_id=user_agent.id,
+                    )
+                )
+                db.add(OAuthClientUser(user_id=user.id, client_id=oauth_client.id))
+            db.commit()
+
+        self.queries = 0
+        event.listen(self.engine, "before_cursor_execute", self._count_query)
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def _count_query(self, *_):
+        self.queries += 1
+
+    def test_linked_oauth_clients_queries(self):
+        """Linked clients are serialized with single query."""
+        with Session(self.engine) as db:
+            serialized = serialize_linked_oauth_clients(
+                OAuthClientUserRepository(db).get_by_user_id(self.user_id)
+            )
+        self.assertEqual(len(serialized["linked_oauth_clients"]), 10)
+        self.assertEqual(self.queries, 1)
+
+    def test_sessions_queries(self):
+        """Sessions are serialized with their user agents with single query."""
+        with Session(self.engine) as db:
+            serialized = serialize_sessions(
+                UserSessionsRepository(db).get_by_owner_id(
+                    self.user_id, with_user_agents=True
+                )
+            )
+        self.assertEqual(len(serialized["sessions"]), 10)
+        self.assertEqual(self.queries, 1)
+
+
+class TestOAuthClientUseRepository(unittest.TestCase):
+    """Checks OAuth client usage counters are same as counted uses (PostgreSQL)."""
+
+    def setUp(self):
+        self.db = SessionLocal()
+        try:
+            self.db.connection()
+        except OperationalError:
+            self.db.close()
+            self.skipTest("Database is not available")
+
+        self.user_ids = []
+        for _ in range(3):
+            name = uuid.uuid4().hex
+            user = User(username=name, email=f"{name}@florgon.com", password="")
+            self.db.add(user)
+            self.db.flush()
+            self.user_ids.append(user.id)
+        oauth_client = OAuthClient(
+            secret="", display_name="client", owner_id=self.user_ids[0]
+        )
+        self.db.add(oauth_client)
+        self.db.commit()
+        self.client_id = oauth_client.id
+
+    def tearDown(self):
+        for model in (OAuthClientStats, OAuthClientUniqueUser, OAuthClientUse):
+            self.db.execute(delete(model).where(model.client_id == self.client_id))
+        self.db.execute(delete(OAuthClient).where(OAuthClient.id == self.client_id))
+        self.db.execute(delete(User).where(User.id.in_(self.user_ids)))
+        self.db.commit()
+        self.db.close()
+
+    def _assert_counted(self, stats: OAuthClientStats) -> None:
+        where = OAuthClientUse.client_id == self.client_id
+        self.db.refresh(stats)
+        self.assertEqual(
+            stats.uses,
+            self.db.scalar(
+                select(func.count()).select_from(OAuthClientUse).where(where)
+            ),
+        )
+        self.assertEqual(
+            stats.unique_users,
+            self.db.scalar(
+                select(func.count(OAuthClientUse.user_id.distinct())).where(where)
+            ),
+        )
+
+    def test_counters(self):
+        """Counters are created from uses, and incremented with created uses."""
+        now = datetime.now(tz=timezone.utc)
+        # Uses created before counters were maintained.
+        self.db.add_all(
+            [
+                OAuthClientUse(user_id=self.user_ids[0], client_id=self.client_id),
+                OAuthClientUse(user_id=self.user_ids[0], client_id=self.client_id),
+            ]
+        )
+        self.db.commit()
+
+        repo = OAuthClientUseRepository(self.db)
+        stats = repo.get_stats(self.client_id)
+        self._assert_counted(stats)
+
+        repo.create_many(
+            [(user_id, self.client_id, now) for user_id in self.user_ids * 2]
+        )
+        repo.create(self.user_ids[1], self.client_id)
+        self._assert_counted(stats)
+        self.assertEqual((stats.uses, stats.unique_users), (9, 3))
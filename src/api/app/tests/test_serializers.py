@@ -0,0 +1,133 @@
+"""
+    Tests serializers (user serializers built for flags combinations).
+"""
+
+import time
+import itertools
+import unittest
+from datetime import datetime
+
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.orm import Session
+from sqlalchemy import select, create_engine
+from app.serializers.user import serialize_list, serialize, get_user_serializer
+from app.database.models.user import User
+from app.database.core import Base
+
+FLAGS = (
+    "include_email",
+    "include_optional_fields",
+    "include_private_fields",
+    "include_profile_fields",
+    "include_phone",
+)
+
+
+def _serialize_reference(user: User, **flags: bool) -> dict:
+    """Serialization of the user, as it was done before serializers were built for flags."""
+    serialized = {
+        "id": user.id,
+        "username": user.username,
+        "avatar": user.avatar,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "full_name": user.full_name,
+        "sex": int(user.sex),
+    }
+    if flags["include_profile_fields"]:
+        serialized["profile"] = {
+            "bio": user.profile_bio,
+            "website": user.profile_website,
+            "socials": {
+                "vk": user.profile_social_username_vk,
+                "tg": user.profile_social_username_tg,
+                "gh": user.profile_social_username_gh,
+            },
+            "privacy": {
+                "is_public": user.privacy_profile_public,
+                "auth_required": user.privacy_profile_require_auth,
+            },
+        }
+    if flags["include_private_fields"]:
+        if flags["include_email"]:
+            serialized["email"] = user.email
+        if flags["include_phone"]:
+            serialized["phone"] = user.phone_number
+    if flags["include_optional_fields"]:
+        time_online = user.time_online
+        serialized["time_created"] = time.mktime(user.time_created.timetuple())
+        serialized["time_online"] = (
+            time.mktime(time_online.timetuple()) if time_online else None
+        )
+        serialized["states"] = {"is_active": user.is_active, "is_vip": user.is_vip}
+        if flags["include_private_fields"]:
+            if user.is_admin:
+                serialized["states"]["is_admin"] = user.is_admin
+            serialized["states"]["is_confirmed"] = user.is_verified
+    return serialized
+
+
+class TestUserSerializerUnit(unittest.TestCase):
+    """Checks user serializers output is same for models and rows, for all flags."""
+
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+        )
+        Base.metadata.create_all(self.engine, tables=[User.__table__])
+        with Session(self.engine) as db:
+            db.add_all(
+                [
+                    User(
+                        username="user",
+                        email="user@florgon.com",
+                        password="",
+                        time_created=datetime(2023, 1, 1, 12, 30, 15, 500),
+                    ),
+                    User(
+                        username="admin",
+                        email="admin@florgon.com",
+                        phone_number="+70000000000",
+                        password="",
+                        first_name="First",
+                        last_name="Last",
+                        profile_bio="Bio",
+                        is_admin=True,
+                        is_verified=True,
+                        time_created=datetime(2023, 1, 1),
+                        time_online=datetime(2023, 1, 2, 6),
+                    ),
+                    User(
+                        username="last",
+                        email="last@florgon.com",
+                        password="",
+                        last_name="Last",
+                        sex=True,
+                        time_created=datetime(2023, 1, 1),
+                    ),
+                ]
+            )
+            db.commit()
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def test_flags_combinations(self):
+        """Models and rows are serialized same as before, for every combination of flags."""
+        with Session(self.engine) as db:
+            users = db.execute(select(User).order_by(User.id)).scalars().all()
+            for values in itertools.product((False, True), repeat=len(FLAGS)):
+                flags = dict(zip(FLAGS, values))
+                expected = [_serialize_reference(user, **flags) for user in users]
+                with self.subTest(**flags):
+                    self.assertEqual(
+                        [serialize(user, **flags) for user in users],
+                        [{"user": serialized} for serialized in expected],
+                    )
+                    self.assertEqual(
+                        serialize(users[0], in_list=True, **flags), expected[0]
+                    )
+
+                    columns = get_user_serializer(**flags).columns
+                    rows = db.execute(select(*columns).order_by(User.id)).all()
+                    self.assertEqual(serialize_list(rows, **flags), {"users": expected})
@@ -1,11 +1,35 @@
 """
-    Tests tokens (Access token) unit.
+    Tests tokens (Access token) and signing keys unit.
 """
 
 
+import time
+import json
+import asyncio
 import unittest
 
-from app.services.tokens import AccessToken
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.orm import Session
+from sqlalchemy import event, create_engine
+from pydantic import ValidationError
+from jwt.algorithms import has_crypto
+from app.services.tokens.signing_keys import load_signing_key
+from app.services.tokens.exceptions import (
+    TokenWrongTypeError,
+    TokenInvalidSignatureError,
+    TokenInvalidError,
+    TokenExpiredError,
+)
+from app.services.tokens import SessionToken, AccessToken
+from app.services.request.auth import query_auth_data_from_tokens
+from app.services.api import ApiErrorException, ApiErrorCode
+from app.schemas.tokens import CheckTokensBatchModel
+from app.routers.v1.tokens import check_access_tokens_batch
+from app.database.models.user_session import UserSession
+from app.database.models.user_agent import UserAgent
+from app.database.models.user import User
+from app.database.core import Base
+from app.config import get_settings
 
 
 class TestAccessTokenUnit(unittest.TestCase):
@@ -40,3 +64,208 @@ class TestAccessTokenUnit(unittest.TestCase):
             AccessToken.decode(encoded_token, key).get_raw_payload(),
             decoded_token.get_raw_payload(),
         )
+
+    def test_access_token_verify_after_decode(self):
+        """Test single-parse decoding with signature verified after."""
+        key = "my_secret_key"
+        encoded_token = AccessToken("me", 1, 2, 3, "email", key=key).encode()
+
+        decoded_token = AccessToken.decode_unverified(encoded_token)
+        self.assertFalse(decoded_token.signature_is_valid())
+        self.assertEqual(decoded_token.get_session_id(), 3)
+
+        decoded_token.verify_signature(key)
+        self.assertTrue(decoded_token.signature_is_valid())
+        self.assertEqual(
+            decoded_token.get_raw_payload(),
+            AccessToken.decode(encoded_token, key).get_raw_payload(),
+        )
+        self.assertEqual(decoded_token.get_scope(), "email")
+
+    def test_access_token_verify_rejects(self):
+        """Test single-parse decoding rejects wrong key, expired, malformed and wrong type tokens."""
+        key = "my_secret_key"
+        encoded_token = AccessToken("me", 1, 2, 3, "", key=key).encode()
+        with self.assertRaises(TokenInvalidSignatureError):
+            AccessToken.decode_unverified(encoded_token).verify_signature("other_key")
+
+        expired_token = AccessToken("me", 1, 2, 3, "", key=key)
+        expired_token._ttl = 0.000001  # pylint: disable=protected-access
+        encoded_expired_token = expired_token.encode()
+        time.sleep(0.01)
+        with self.assertRaises(TokenExpiredError):
+            AccessToken.decode_unverified(encoded_expired_token).verify_signature(key)
+
+        with self.assertRaises(TokenInvalidError):
+            AccessToken.decode_unverified("not.a.token")
+        with self.assertRaises(TokenWrongTypeError):
+            SessionToken.decode_unverified(encoded_token)
+
+    @unittest.skipUnless(has_crypto, "requires `cryptography` library")
+    def test_access_token_signing_key(self):
+        """Test signing with signing key (with key id) and verification with its public key."""
+        # pylint: disable=import-outside-toplevel
+        from cryptography.hazmat.primitives.asymmetric import ed25519, ec
+        from cryptography.hazmat.primitives import serialization
+
+        for private_key, algorithm in (
+            (ec.generate_private_key(ec.SECP256R1()), "ES256"),
+            (ed25519.Ed25519PrivateKey.generate(), "EdDSA"),
+        ):
+            signing_key = load_signing_key(
+                private_key.private_bytes(
+                    serialization.Encoding.PEM,
+                    serialization.PrivateFormat.PKCS8,
+                    serialization.NoEncryption(),
+                ).decode()
+            )
+            self.assertEqual(signing_key.algorithm, algorithm)
+            self.assertEqual(signing_key.public_jwk["kid"], signing_key.key_id)
+
+            encoded_token = AccessToken("me", 1, 2, 3, "").encode(
+                key="key", signing_key=signing_key
+            )
+            decoded_token = AccessToken.decode_unverified(encoded_token)
+            self.assertEqual(decoded_token.get_key_id(), signing_key.key_id)
+            decoded_token.verify_signature(
+                signing_key.public_key, algorithm=signing_key.algorithm
+            )
+            self.assertTrue(decoded_token.signature_is_valid())
+            with self.assertRaises(TokenInvalidError):
+                AccessToken.decode_unverified(encoded_token).verify_signature("key")
+
+
+class TestAccessTokensBatchUnit(unittest.TestCase):
+    """Tests batch check of the access tokens (in-memory SQLite)."""
+
+    def setUp(self):
+        settings = get_settings()
+        self._cache_sessions_enabled = settings.cache_sessions_enabled
+        settings.cache_sessions_enabled = False
+
+        self.engine = create_engine(
+            "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+        )
+        Base.metadata.create_all(
+            self.engine,
+            tables=[User.__table__, UserAgent.__table__, UserSession.__table__],
+        )
+        self.sessions = []
+        with Session(self.engine) as db:
+            user_agent = UserAgent(user_agent="user_agent")
+            db.add(user_agent)
+            for index in range(2):
+                user = User(
+                    username=f"user_{index}",
+                    email=f"user_{index}@florgon.com",
+                    password="",
+                )
+                db.add(user)
+                db.flush()
+                session = UserSession(
+                    owner_id=user.id,
+                    token_secret=f"secret_{index}",
+                    ip_address="127.0.0.1",
+                    user_agent_id=user_agent.id,
+                )
+                db.add(session)
+                db.flush()
+                self.sessions.append((user.id, session.id, session.token_secret))
+            db.commit()
+
+        self.queries: list[str] = []
+        event.listen(self.engine, "before_cursor_execute", self._count_query)
+
+    def tearDown(self):
+        get_settings().cache_sessions_enabled = self._cache_sessions_enabled
+        self.engine.dispose()
+
+    def _count_query(self, _connection, _cursor, statement, *_):
+        self.queries.append(statement)
+
+    def _get_tokens(self) -> list[str]:
+        """Returns valid, expired, wrong session and malformed tokens."""
+        user_id, session_id, secret = self.sessions[0]
+        other_user_id, other_session_id, other_secret = self.sessions[1]
+        expired_token = AccessToken("me", 1, user_id, session_id, "", key=secret)
+        expired_token._ttl = 0.000001  # pylint: disable=protected-access
+        tokens = [
+            AccessToken("me", 60, user_id, session_id, "", key=secret).encode(),
+            expired_token.encode(),
+            # Signed with secret of the other session.
+            AccessToken("me", 60, other_user_id, other_session_id, "").encode(
+                key=secret
+            ),
+            # Session of the other user.
+            AccessToken("me", 60, user_id, other_session_id, "").encode(
+                key=other_secret
+            ),
+            AccessToken("me", 60, user_id, 1_000, "", key=secret).encode(),
+            "not.a.token",
+            AccessToken("me", 60, user_id, session_id, "", key=secret).encode(),
+        ]
+        time.sleep(0.01)
+        return tokens
+
+    def test_query_auth_data_from_tokens(self):
+        """Each token gets own result, and sessions are queried with single query."""
+        tokens = self._get_tokens()
+        with Session(self.engine) as db:
+            results = query_auth_data_from_tokens(
+                tokens, db, trigger_online_update=False
+            )
+
+        self.assertEqual(len(results), len(tokens))
+        for index in (0, 6):
+            self.assertEqual(results[index].session.id, self.sessions[0][1])
+            self.assertEqual(results[index].user.id, self.sessions[0][0])
+        errors = [
+            result.api_code if isinstance(result, ApiErrorException) else None
+            for result in results
+        ]
+        self.assertEqual(
+            errors,
+            [
+                None,
+                ApiErrorCode.AUTH_EXPIRED_TOKEN,
+                ApiErrorCode.AUTH_INVALID_TOKEN,
+                ApiErrorCode.AUTH_INVALID_TOKEN,
+                ApiErrorCode.AUTH_INVALID_TOKEN,
+                ApiErrorCode.AUTH_INVALID_TOKEN,
+                None,
+            ],
+        )
+        # Sessions are loaded together with their owners, with single query.
+        # (user of the token with session of the other user is queried separately).
+        self.assertEqual(
+            len([query for query in self.queries if "user_sessions" in query]), 1
+        )
+        self.assertEqual(len(self.queries), 2)
+
+    def test_check_access_tokens_batch(self):
+        """Results are returned in order of the tokens, as success or error."""
+        tokens = self._get_tokens()
+        with Session(self.engine) as db:
+            response = asyncio.run(
+                check_access_tokens_batch(
+                    CheckTokensBatchModel(access_tokens=tokens), db
+                )
+            )
+        results = json.loads(response.body)["success"]["results"]
+        self.assertEqual(
+            ["success" in result for result in results],
+            [True, False, False, False, False, False, True],
+        )
+        self.assertEqual(results[0]["success"]["user_id"], self.sessions[0][0])
+        self.assertEqual(
+            results[1]["error"]["code"], ApiErrorCode.AUTH_EXPIRED_TOKEN.value[0]
+        )
+
+    def test_batch_max_size(self):
+        """Batches larger than configured size (and empty ones) are rejected."""
+        max_size = get_settings().security_tokens_check_batch_max_size
+        CheckTokensBatchModel(access_tokens=["token"] * max_size)
+        with self.assertRaises(ValidationError):
+            CheckTokensBatchModel(access_tokens=["token"] * (max_size + 1))
+        with self.assertRaises(ValidationError):
+            CheckTokensBatchModel(access_tokens=[])
@@ -12,3 +12,9 @@ def test_read_utils_get_server_time(client):  # pylint: disable=redefined-outer-
     assert "success" in json
     assert "v" in json
     assert "server_time" in json["success"]
+
+
+def test_read_utils_metrics_auth(client):  # pylint: disable=redefined-outer-name
+    """Tests that metrics method is not available without authentication."""
+    response = client.get("/v1/utils/metrics")
+    assert response.status_code == 401
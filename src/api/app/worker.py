@@ -13,34 +13,49 @@
 import os
 
 from celery.utils.log import get_task_logger
-from celery.schedules import crontab
 from celery import Celery
+from app.services.online import flush_online_buffer
+from app.services.oauth.uses import flush_oauth_client_uses
 from app.database.core import SessionLocal
+from app.config import get_settings
 
 worker_cache_dsn = os.environ.get("CACHE_DSN", "redis://cache:6379/")
 worker = Celery(__name__, broker=worker_cache_dsn, backend=worker_cache_dsn)
 worker.conf.broker_connection_retry_on_startup = True
 logger = get_task_logger(__name__)
 worker.conf.beat_schedule = {
-    "truncate_oauth_codes": {
-        "task": "truncate_oauth_codes",
-        "schedule": crontab(minute=0, hour=0),
+    "flush_online_buffer": {
+        "task": "flush_online_buffer",
+        "schedule": get_settings().auth_online_flush_interval,
+        "args": (),
+    },
+    "flush_oauth_client_uses": {
+        "task": "flush_oauth_client_uses",
+        "schedule": get_settings().auth_oauth_client_uses_flush_interval,
         "args": (),
     },
 }
 
 
-@worker.task(name="truncate_oauth_codes")
-def truncate_oauth_codes():
+@worker.task(name="flush_online_buffer")
+def flush_online_buffer_task():
+    """
+    Task that will be executed periodically
+    and flush buffered online time of the users into the database.
+    """
+    with SessionLocal() as db:
+        updated_users = flush_online_buffer(db)
+    logger.info(f"[flush_online_buffer] Updated online time for {updated_users} users.")
+    return updated_users
+
+
+@worker.task(name="flush_oauth_client_uses")
+def flush_oauth_client_uses_task():
     """
     Task that will be executed periodically
-    and truncate the oauth_codes table that is not required to store long history.
-    TODO: Use redis.
+    and insert buffered uses of the OAuth clients into the database.
     """
-    logger.info("[truncate_oauth_codes] Truncating oauth codes database table...")
     with SessionLocal() as db:
-        db.execute("TRUNCATE TABLE oauth_codes RESTART IDENTITY;")
-    logger.info(
-        "[truncate_oauth_codes] Finished truncating oauth codes database table!"
-    )
-    return True
+        inserted_uses = flush_oauth_client_uses(db)
+    logger.info(f"[flush_oauth_client_uses] Inserted {inserted_uses} uses.")
+    return inserted_uses
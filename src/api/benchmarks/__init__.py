@@ -0,0 +1,7 @@
+"""
+    Micro-benchmarks for the hot paths of the API.
+
+    Not collected by tests, run manually from the API source directory
+    (inside the server docker container), for example:
+    `python -m benchmarks.tokens`
+"""
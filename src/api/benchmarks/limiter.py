@@ -0,0 +1,85 @@
+"""
+    Benchmarks requests limiter key resolution for growing route table:
+    current (index bound at application creation) path against previous
+    (dependency searched within all routes on every request) path.
+
+    Usage: `python -m benchmarks.limiter [iterations] [routes ...]`
+"""
+
+import sys
+import timeit
+import asyncio
+
+from fastapi import Request, FastAPI, Depends
+from app.services.limiter.depends import bind_rate_limiters, RateLimiter
+from app.services.limiter import FastAPILimiter, default_identifier
+
+DEFAULT_ROUTES = [10, 100, 1000]
+
+
+async def get_key_searched(limiter: RateLimiter, request: Request) -> str:
+    """Previous path: search limiter index within all routes on every request."""
+    index = 0
+    for route in request.app.routes:
+        if route.path == request.scope["path"]:
+            for idx, dependency in enumerate(route.dependencies):
+                if limiter is dependency.dependency:
+                    index = idx
+                    break
+    rate_key = await default_identifier(request)
+    return f"{FastAPILimiter.prefix}:{rate_key}:{index}"
+
+
+def create_request(routes: int) -> tuple[RateLimiter, Request]:
+    """Returns limiter and request to the last of given amount of limited routes."""
+    app = FastAPI()
+    limiter = None
+    for index in range(routes):
+        limiter = RateLimiter(times=1, seconds=1)
+        app.add_api_route(
+            f"/route{index}",
+            lambda: None,
+            dependencies=[Depends(RateLimiter(times=1)), Depends(limiter)],
+        )
+    bind_rate_limiters(app.routes)
+    request = Request(
+        {
+            "type": "http",
+            "app": app,
+            "path": f"/route{routes - 1}",
+            "headers": [],
+            "client": ("127.0.0.1", 0),
+        }
+    )
+    return limiter, request
+
+
+def main(iterations: int, routes_values: list[int]) -> None:
+    FastAPILimiter.prefix = "fastapi-limiter"
+    FastAPILimiter.identifier = default_identifier
+    loop = asyncio.new_event_loop()
+    for routes in routes_values:
+        limiter, request = create_request(routes)
+        assert loop.run_until_complete(
+            limiter.get_key(request)
+        ) == loop.run_until_complete(get_key_searched(limiter, request))
+        searched = timeit.timeit(
+            lambda: loop.run_until_complete(get_key_searched(limiter, request)),
+            number=iterations,
+        )
+        bound = timeit.timeit(
+            lambda: loop.run_until_complete(limiter.get_key(request)),
+            number=iterations,
+        )
+        print(
+            f"routes={routes}: searched {searched / iterations * 1e6:.1f} us, "
+            f"bound {bound / iterations * 1e6:.1f} us"
+        )
+    loop.close()
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1000,
+        [int(routes) for routes in sys.argv[2:]] or DEFAULT_ROUTES,
+    )
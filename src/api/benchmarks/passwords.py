@@ -0,0 +1,51 @@
+"""
+    Benchmarks password hashing latency for scrypt cost parameters,
+    for choosing `SECURITY_PASSWORD_SCRYPT_*` that fit signin latency budget.
+
+    Latency is measured on a single core (as each hash is computed by one process),
+    throughput is estimated for all cores of the machine.
+
+    Usage: `python -m benchmarks.passwords [iterations] [n ...]`
+"""
+
+import os
+import sys
+import time
+import statistics
+
+from app.services.passwords import _scrypt
+
+R = 8
+P = 1
+DEFAULT_N = [2**12, 2**13, 2**14, 2**15, 2**16]
+
+
+def measure(n: int, iterations: int) -> list[float]:
+    """Returns latencies (in seconds) of hashing with given cost."""
+    salt = os.urandom(16)
+    latencies = []
+    for _ in range(iterations):
+        started_at = time.perf_counter()
+        _scrypt("benchmark_password", salt, n=n, r=R, p=P)
+        latencies.append(time.perf_counter() - started_at)
+    return latencies
+
+
+def main(iterations: int, n_values: list[int]) -> None:
+    cores = os.cpu_count() or 1
+    print(f"r={R}, p={P}, cores={cores}, iterations={iterations}")
+    for n in n_values:
+        latencies = sorted(measure(n, iterations))
+        p50 = statistics.median(latencies)
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        print(
+            f"n=2**{n.bit_length() - 1}: p50 {p50 * 1000:.1f} ms, p99 {p99 * 1000:.1f} ms, "
+            f"~{cores / p50:.0f} hashes/s on all cores"
+        )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 20,
+        [int(n) for n in sys.argv[2:]] or DEFAULT_N,
+    )
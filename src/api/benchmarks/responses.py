@@ -0,0 +1,83 @@
+"""
+    Benchmarks API response rendering on the user and sessions list payloads:
+    current (orjson) response class against previous (stdlib json) one.
+
+    Usage: `python -m benchmarks.responses [iterations] [sessions]`
+"""
+
+import sys
+import timeit
+from datetime import datetime
+
+from fastapi.responses import JSONResponse
+from app.services.api.response import ApiResponse
+from app.serializers.user import serialize_user
+from app.database.models.user import User
+from app.__version__ import __version__
+
+
+def get_user_payload() -> dict:
+    """Returns serialized user (with profile) as returned by the profile method."""
+    user = User(
+        id=1,
+        username="benchmark",
+        email="benchmark@florgon.com",
+        first_name="Bench",
+        last_name="Mark",
+        sex=False,
+        avatar="https://florgon.com/avatar.png",
+        profile_bio="Benchmark user " * 10,
+        profile_website="https://florgon.com",
+        privacy_profile_public=True,
+        privacy_profile_require_auth=False,
+        is_active=True,
+        is_vip=False,
+        time_created=datetime.now(),
+        time_online=datetime.now(),
+    )
+    return serialize_user(
+        user, include_optional_fields=True, include_profile_fields=True
+    )
+
+
+def get_sessions_payload(sessions: int) -> dict:
+    """Returns serialized sessions list as returned by the security method."""
+    return {
+        "sessions": [
+            {
+                "id": session_id,
+                "ip": "127.0.0.1",
+                "geo_country": "RU",
+                "user_agent": "Mozilla/5.0 (X11; Linux x86_64) Gecko/20100101 Firefox/115.0",
+                "created_at": datetime.now().timestamp(),
+                "is_active": True,
+            }
+            for session_id in range(sessions)
+        ],
+        "current_id": 0,
+    }
+
+
+def main(iterations: int, sessions: int) -> None:
+    payloads = {
+        "user": get_user_payload(),
+        f"sessions[{sessions}]": get_sessions_payload(sessions),
+    }
+    for name, payload in payloads.items():
+        content = {"v": __version__, "success": payload}
+        assert JSONResponse(content).body == ApiResponse(content).body
+        for response_class in (JSONResponse, ApiResponse):
+            elapsed = timeit.timeit(
+                lambda: response_class(content),
+                number=iterations,  # pylint: disable=cell-var-from-loop
+            )
+            print(
+                f"{name}, {response_class.__name__}: {elapsed / iterations * 1e6:.1f} us"
+            )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 50,
+    )
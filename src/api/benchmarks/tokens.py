@@ -0,0 +1,39 @@
+"""
+    Benchmarks access token decoding with signature verification:
+    current (single-parse) path against previous (decode twice) path.
+
+    Usage: `python -m benchmarks.tokens [iterations]`
+"""
+
+import sys
+import timeit
+
+from app.services.tokens import AccessToken
+
+KEY = "benchmark_session_secret"
+
+
+def decode_twice(token: str) -> AccessToken:
+    """Previous path: decode without signature, then decode again with the key."""
+    unsigned_token = AccessToken.decode_unsigned(token)
+    unsigned_token.get_session_id()
+    return AccessToken.decode(token, key=KEY)
+
+
+def decode_once(token: str) -> AccessToken:
+    """Current path: parse once, verify signature over already decoded parts."""
+    decoded_token = AccessToken.decode_unverified(token)
+    decoded_token.get_session_id()
+    decoded_token.verify_signature(key=KEY)
+    return decoded_token
+
+
+def main(iterations: int) -> None:
+    token = AccessToken("localhost", 3600, 1, 1, "email,edit", key=KEY).encode()
+    for name, func in [("decode twice", decode_twice), ("decode once", decode_once)]:
+        elapsed = timeit.timeit(lambda: func(token), number=iterations)
+        print(f"{name}: {elapsed / iterations * 1_000_000:.2f} us/op")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)